@@ -0,0 +1,83 @@
+"""
+Measure cold-start import time of the SDK in fresh interpreters.
+
+Each statement runs in a new ``python -c`` process, so nothing is cached in
+``sys.modules``; the time reported is the import alone, taken inside the
+child. Pass ``--importtime`` to print the slowest modules of one run
+(``python -X importtime``).
+
+Usage:
+    python benchmarks/bench_import.py [--runs 20] [--importtime]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+STATEMENTS = (
+    "import coherence_network",
+    "from coherence_network import CoherenceClient",
+    "from coherence_network import Ed25519Auth",
+    "from coherence_network import *",
+)
+
+_TIMER = "import time; _t = time.perf_counter(); {}; print(time.perf_counter() - _t)"
+
+
+def import_time(statement: str) -> float:
+    """Seconds ``statement`` takes in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.split()[-1])
+
+
+def measure(statement: str, runs: int) -> Dict[str, float]:
+    """Min and median import time of ``statement`` over ``runs`` processes, in ms"""
+    samples = [import_time(statement) * 1e3 for _ in range(runs)]
+    return {"min_ms": min(samples), "median_ms": statistics.median(samples)}
+
+
+def slowest_modules(statement: str, count: int) -> List[Tuple[int, int, str]]:
+    """``(self_us, cumulative_us, module)`` for the slowest imports of one run"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[0].strip().split()[-1].isdigit():
+            continue
+        self_us = int(fields[0].split()[-1])
+        rows.append((self_us, int(fields[1]), fields[2].strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20, help="processes per statement")
+    parser.add_argument("--importtime", action="store_true", help="show slowest modules")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    
+    for statement in STATEMENTS:
+        result = measure(statement, args.runs)
+        print(
+            f"{statement:<48} min {result['min_ms']:>8.2f} ms"
+            f"   median {result['median_ms']:>8.2f} ms"
+        )
+        if args.importtime:
+            for self_us, cumulative_us, module in slowest_modules(statement, args.top):
+                print(f"    {self_us / 1e3:>8.2f} ms self {cumulative_us / 1e3:>8.2f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compare Ed25519 signing backends and sign_many pool modes.
+
+Usage:
+    python benchmarks/bench_signing.py [--bodies 2000] [--size 2048]
+"""
+
+import argparse
+import os
+import time
+
+from coherence_network.auth import Ed25519Auth
+from coherence_network.signing import available_backends
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>10.0f} sig/s  ({seconds * 1e6 / count:.1f} us/sig)"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bodies", type=int, default=2000, help="bodies per run")
+    parser.add_argument("--size", type=int, default=2048, help="body size in bytes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    
+    key = os.urandom(32).hex()
+    bodies = ['{"summary": "%s"}' % ("x" * args.size) for _ in range(args.bodies)]
+    print(f"{args.bodies} bodies of ~{args.size} bytes, {args.workers} workers")
+    
+    for backend in available_backends():
+        auth = Ed25519Auth(key, backend=backend)
+        
+        started = time.perf_counter()
+        for body in bodies:
+            auth.get_headers(body)
+        print(f"{backend:<13} inline   {_rate(len(bodies), time.perf_counter() - started)}")
+        
+        for processes in (False, True):
+            auth.sign_many(bodies[: args.workers], args.workers, processes)  # warm the pool
+            started = time.perf_counter()
+            auth.sign_many(bodies, args.workers, processes)
+            mode = "processes" if processes else "threads"
+            print(f"{backend:<13} {mode:<8} {_rate(len(bodies), time.perf_counter() - started)}")
+            auth.close()
+
+
+if __name__ == "__main__":
+    main()
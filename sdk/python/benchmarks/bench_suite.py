@@ -0,0 +1,457 @@
+"""
+Benchmark the SDK against a local mock server and track results over time.
+
+Each run measures sync vs. async request throughput and latency, pagination,
+signing and verification, model decoding and memory, large pages over a
+slow link with and without compression, and cold-start import time,
+appends the results to a JSON-lines history file, and compares them with
+the last run made under the same settings.
+With ``--check`` the exit status is 1 when any benchmark regressed by more
+than ``--threshold``, so the suite can gate a release.
+
+Usage:
+    python benchmarks/bench_suite.py [--requests 500] [--latency-ms 2] [--check]
+    python benchmarks/bench_suite.py --only async_gather,decode --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, replace
+from typing import Any, Callable, Dict, List, Optional
+
+from bench_import import measure as measure_import
+from mock_server import MockCoherenceServer, MockConfig
+
+import coherence_network
+from coherence_network import (
+    AsyncCoherenceClient,
+    CoherenceClient,
+    CompressionConfig,
+    Ed25519Auth,
+    RetryPolicy,
+)
+from coherence_network.auth import Ed25519Verifier
+from coherence_network.decoding import DECODE_MODES, decode_response
+from coherence_network.instrument import Histogram
+from coherence_network.models import Claim
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.jsonl")
+
+Result = Dict[str, Any]
+
+
+def _result(value: float, unit: str, higher_is_better: bool, **extra: Any) -> Result:
+    return {"value": round(value, 3), "unit": unit, "higher_is_better": higher_is_better, **extra}
+
+
+def _latency(histogram: Histogram) -> Dict[str, float]:
+    return {
+        "p50_ms": round(histogram.quantile(0.5) * 1e3, 3),
+        "p99_ms": round(histogram.quantile(0.99) * 1e3, 3),
+    }
+
+
+def _client(server: MockCoherenceServer, **kwargs: Any) -> CoherenceClient:
+    return CoherenceClient(
+        base_url=server.base_url,
+        anon_key="bench",
+        retry=RetryPolicy(backoff_base=0.001, backoff_max=0.01),
+        **kwargs,
+    )
+
+
+def _async_client(server: MockCoherenceServer, **kwargs: Any) -> AsyncCoherenceClient:
+    return AsyncCoherenceClient(
+        base_url=server.base_url,
+        anon_key="bench",
+        retry=RetryPolicy(backoff_base=0.001, backoff_max=0.01),
+        **kwargs,
+    )
+
+
+def bench_sync_get(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Sequential ``claims.get`` on one sync client"""
+    ids = [claim["claim_id"] for claim in server.data.claims]
+    histogram = Histogram()
+    failures = 0
+    with _client(server, coalesce=False) as client:
+        started = time.perf_counter()
+        for i in range(args.requests):
+            t0 = time.perf_counter()
+            if not client.claims.get(ids[i % len(ids)])["success"]:
+                failures += 1
+            histogram.record(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - started
+    rate = args.requests / elapsed
+    return _result(rate, "req/s", True, failures=failures, **_latency(histogram))
+
+
+def bench_sync_threads(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """``claims.get`` from a thread pool sharing one sync client"""
+    ids = [claim["claim_id"] for claim in server.data.claims]
+    histogram = Histogram()
+    
+    with _client(server, coalesce=False) as client:
+        
+        def one(i: int) -> bool:
+            t0 = time.perf_counter()
+            ok = client.claims.get(ids[i % len(ids)])["success"]
+            histogram.record(time.perf_counter() - t0)
+            return ok
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.concurrency) as executor:
+            results = list(executor.map(one, range(args.requests)))
+        elapsed = time.perf_counter() - started
+    failures = results.count(False)
+    rate = args.requests / elapsed
+    return _result(rate, "req/s", True, failures=failures, **_latency(histogram))
+
+
+def bench_async_gather(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Concurrent ``claims.get`` on one async client via ``gather``"""
+    ids = [claim["claim_id"] for claim in server.data.claims]
+    histogram = Histogram()
+    
+    async def run() -> Result:
+        async with _async_client(server, coalesce=False) as client:
+            
+            async def one(i: int) -> bool:
+                t0 = time.perf_counter()
+                ok = (await client.claims.get(ids[i % len(ids)]))["success"]
+                histogram.record(time.perf_counter() - t0)
+                return ok
+            
+            started = time.perf_counter()
+            results = await client.gather(
+                (one(i) for i in range(args.requests)), limit=args.concurrency
+            )
+            elapsed = time.perf_counter() - started
+        failures = results.count(False)
+        rate = args.requests / elapsed
+        return _result(rate, "req/s", True, failures=failures, **_latency(histogram))
+    
+    return asyncio.run(run())
+
+
+def bench_pagination(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Walk every claim with ``iter_all``, without and with prefetch"""
+    results = {}
+    with _client(server) as client:
+        for prefetch in (False, True):
+            started = time.perf_counter()
+            claims = client.claims.iter_all(page_size=args.page_size, prefetch=prefetch)
+            count = sum(1 for _ in claims)
+            results["prefetch" if prefetch else "plain"] = count / (time.perf_counter() - started)
+    plain = round(results["plain"], 1)
+    return _result(results["prefetch"], "items/s", True, plain_items_per_s=plain)
+
+
+def bench_async_pagination(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Walk every claim with ``aiter_all(prefetch=True)``"""
+    
+    async def run() -> float:
+        async with _async_client(server) as client:
+            started = time.perf_counter()
+            count = 0
+            async for _ in client.claims.aiter_all(page_size=args.page_size, prefetch=True):
+                count += 1
+            return count / (time.perf_counter() - started)
+    
+    return _result(asyncio.run(run()), "items/s", True)
+
+
+def bench_sign(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Ed25519 request signing with the fastest installed backend"""
+    auth = Ed25519Auth(os.urandom(32).hex())
+    body = json.dumps({"summary": "x" * args.body_bytes}).encode()
+    count = max(args.requests * 4, 1000)
+    started = time.perf_counter()
+    for _ in range(count):
+        auth.get_headers(body)
+    elapsed = time.perf_counter() - started
+    return _result(elapsed / count * 1e6, "us/op", False, backend=auth.backend)
+
+
+def bench_verify(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Ed25519 verification of signed payloads from a few peers, keys cached"""
+    peers = [Ed25519Auth(os.urandom(32).hex()) for _ in range(8)]
+    body = json.dumps({"summary": "x" * args.body_bytes})
+    payloads = []
+    for i in range(max(args.requests * 2, 500)):
+        headers = peers[i % len(peers)].get_headers(body)
+        payloads.append(
+            (
+                body,
+                headers["X-Alephnet-Signature"],
+                headers["X-Alephnet-Pubkey"],
+                headers["X-Alephnet-Timestamp"],
+            )
+        )
+    verifier = Ed25519Verifier()
+    started = time.perf_counter()
+    for payload in payloads:
+        verifier.verify(*payload)
+    elapsed = time.perf_counter() - started
+    return _result(elapsed / len(payloads) * 1e6, "us/op", False, backend=verifier.backend)
+
+
+def bench_signed_post(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Signed gateway POSTs (serialize, sign, send, decode)"""
+    auth = Ed25519Auth(os.urandom(32).hex())
+    tasks = [task["task_id"] for task in server.data.tasks]
+    histogram = Histogram()
+    with _client(server, auth=auth) as client:
+        started = time.perf_counter()
+        for i in range(args.requests):
+            t0 = time.perf_counter()
+            client.gateway.claim_task(tasks[i % len(tasks)])
+            histogram.record(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - started
+    return _result(args.requests / elapsed, "req/s", True, **_latency(histogram))
+
+
+def _claim_page(server: MockCoherenceServer, count: int) -> bytes:
+    """Response body for ``count`` claims, as ``api-claims`` returns them"""
+    page = server.data.claims[:count]
+    return json.dumps(
+        {
+            "success": True,
+            "data": page,
+            "meta": {"timestamp": "2025-01-01T00:00:00Z", "request_id": "bench"},
+        }
+    ).encode()
+
+
+def bench_decode(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Decode one page of claims in every decode mode (no network)"""
+    content = _claim_page(server, args.page_size)
+    rounds = max(args.requests // 5, 20)
+    per_mode = {}
+    for mode in DECODE_MODES:
+        decode_response(content, List[Claim], mode)  # build cached adapters
+        started = time.perf_counter()
+        for _ in range(rounds):
+            decode_response(content, List[Claim], mode)
+        per_mode[mode] = (time.perf_counter() - started) / rounds * 1e6
+    return _result(
+        per_mode["validate"],
+        "us/page",
+        False,
+        **{f"{mode}_us_per_page": round(value, 1) for mode, value in per_mode.items()},
+    )
+
+
+def bench_compressed_page(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Large ``claims.list`` pages over a bandwidth-limited link, plain vs. gzip vs. streamed"""
+    config = replace(server.config, gzip=True, bandwidth=args.bandwidth_mbps * 1e6 / 8)
+    limit = args.page_size * 5
+    rounds = max(args.requests // 25, 10)
+    variants = {
+        "identity": CompressionConfig(accept=False, stream_threshold=None),
+        "gzip": CompressionConfig(stream_threshold=None),
+        "gzip_stream": CompressionConfig(),
+    }
+    per_variant = {}
+    with MockCoherenceServer(config) as link:
+        for name, compression in variants.items():
+            with _client(link, decode="trusted", compression=compression) as client:
+                client.claims.list(limit=limit)  # connect and build cached builders
+                started = time.perf_counter()
+                for _ in range(rounds):
+                    client.claims.list(limit=limit)
+                per_variant[name] = (time.perf_counter() - started) / rounds * 1e3
+    return _result(
+        per_variant["gzip_stream"],
+        "ms/page",
+        False,
+        **{f"{name}_ms": round(value, 2) for name, value in per_variant.items()},
+    )
+
+
+def bench_cold_import(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Import ``CoherenceClient`` in a fresh interpreter"""
+    client = measure_import("from coherence_network import CoherenceClient", 10)
+    package = measure_import("import coherence_network", 10)
+    return _result(
+        client["median_ms"],
+        "ms",
+        False,
+        min_ms=round(client["min_ms"], 3),
+        package_ms=round(package["median_ms"], 3),
+    )
+
+
+def bench_record_memory(server: MockCoherenceServer, args: argparse.Namespace) -> Result:
+    """Memory held per decoded claim in every decode mode"""
+    content = _claim_page(server, len(server.data.claims))
+    count = len(server.data.claims)
+    per_mode = {}
+    for mode in DECODE_MODES:
+        decode_response(content, List[Claim], mode)  # build cached adapters
+        gc.collect()
+        tracemalloc.start()
+        response = decode_response(content, List[Claim], mode)
+        per_mode[mode] = tracemalloc.get_traced_memory()[0] / count
+        tracemalloc.stop()
+        del response
+    return _result(
+        per_mode["compact"],
+        "B/record",
+        False,
+        **{f"{mode}_bytes": round(value) for mode, value in per_mode.items()},
+    )
+
+
+BENCHMARKS: Dict[str, Callable[[MockCoherenceServer, argparse.Namespace], Result]] = {
+    "sync_get": bench_sync_get,
+    "sync_threads": bench_sync_threads,
+    "async_gather": bench_async_gather,
+    "pagination": bench_pagination,
+    "async_pagination": bench_async_pagination,
+    "sign": bench_sign,
+    "verify": bench_verify,
+    "signed_post": bench_signed_post,
+    "decode": bench_decode,
+    "record_memory": bench_record_memory,
+    "compressed_page": bench_compressed_page,
+    "cold_import": bench_cold_import,
+}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def _load_history(path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path) as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def compare(
+    current: Dict[str, Result],
+    previous: Dict[str, Result],
+    threshold: float,
+) -> List[str]:
+    """Names of benchmarks that got worse by more than ``threshold`` (a fraction)"""
+    regressions = []
+    for name, result in current.items():
+        before = previous.get(name)
+        if not before or not before["value"]:
+            continue
+        change = (result["value"] - before["value"]) / before["value"]
+        if not result["higher_is_better"]:
+            change = -change
+        marker = ""
+        if change < -threshold:
+            regressions.append(name)
+            marker = "  REGRESSION"
+        print(f"  {name:<18} {before['value']:>12} -> {result['value']:<12} {change:+.1%}{marker}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500, help="requests per benchmark")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--body-bytes", type=int, default=1024, help="signed body size")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="server latency")
+    parser.add_argument("--jitter-ms", type=float, default=1.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503s")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of 429s")
+    parser.add_argument("--claims", type=int, default=2000)
+    parser.add_argument("--statement-bytes", type=int, default=256)
+    parser.add_argument(
+        "--bandwidth-mbps", type=float, default=50.0, help="link speed for compressed_page"
+    )
+    parser.add_argument("--only", help="comma-separated benchmark names")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON-lines results file")
+    parser.add_argument("--no-save", action="store_true", help="do not append to the history")
+    parser.add_argument("--threshold", type=float, default=0.15, help="regression tolerance")
+    parser.add_argument("--check", action="store_true", help="exit 1 on regressions")
+    args = parser.parse_args()
+    
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    
+    mock = MockConfig(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        claims=args.claims,
+        statement_bytes=args.statement_bytes,
+    )
+    config = {
+        **asdict(mock),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "page_size": args.page_size,
+        "body_bytes": args.body_bytes,
+        "bandwidth_mbps": args.bandwidth_mbps,
+    }
+    
+    results: Dict[str, Result] = {}
+    with MockCoherenceServer(mock) as server:
+        for name in names:
+            results[name] = BENCHMARKS[name](server, args)
+            result = results[name]
+            extra = {
+                key: value
+                for key, value in result.items()
+                if key not in ("value", "unit", "higher_is_better")
+            }
+            print(f"{name:<18} {result['value']:>12} {result['unit']:<8} {extra}")
+    
+    history = _load_history(args.history)
+    previous = next((run for run in reversed(history) if run["config"] == config), None)
+    regressions: List[str] = []
+    if previous is not None:
+        commit = previous["commit"] or "unknown commit"
+        print(f"\nCompared with {commit} at {previous['timestamp']}:")
+        regressions = compare(results, previous["results"], args.threshold)
+    
+    if not args.no_save:
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "commit": _git_commit(),
+            "sdk_version": coherence_network.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config,
+            "results": results,
+        }
+        with open(args.history, "a") as handle:
+            handle.write(json.dumps(record) + "\n")
+    
+    if regressions and args.check:
+        print(f"\nRegressed beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
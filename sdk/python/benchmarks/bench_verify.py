@@ -0,0 +1,73 @@
+"""
+Compare Ed25519 verification backends, key caching and verify_many pool modes.
+
+Usage:
+    python benchmarks/bench_verify.py [--payloads 20000] [--peers 50] [--size 512]
+"""
+
+import argparse
+import os
+import time
+
+from coherence_network.auth import Ed25519Auth, Ed25519Verifier
+from coherence_network.signing import VERIFIERS, available_backends
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>10.0f} ver/s  ({seconds * 1e6 / count:.1f} us/ver)"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--payloads", type=int, default=20000, help="payloads per run")
+    parser.add_argument("--peers", type=int, default=50, help="distinct signing keys")
+    parser.add_argument("--size", type=int, default=512, help="body size in bytes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    
+    peers = [Ed25519Auth(os.urandom(32).hex()) for _ in range(args.peers)]
+    payloads = []
+    for i in range(args.payloads):
+        body = '{"seq": %d, "data": "%s"}' % (i, "x" * args.size)
+        headers = peers[i % len(peers)].get_headers(body)
+        payloads.append(
+            (
+                body,
+                headers["X-Alephnet-Signature"],
+                headers["X-Alephnet-Pubkey"],
+                headers["X-Alephnet-Timestamp"],
+            )
+        )
+    print(
+        f"{args.payloads} payloads of ~{args.size} bytes from {args.peers} peers, "
+        f"{args.workers} workers"
+    )
+    
+    for backend in available_backends():
+        # Parsing the key for every message: what ad-hoc verification does
+        started = time.perf_counter()
+        for body, signature, pubkey, timestamp in payloads:
+            VERIFIERS[backend](bytes.fromhex(pubkey)).verify(
+                bytes.fromhex(signature), f"{timestamp}:{body}".encode()
+            )
+        print(f"{backend:<13} uncached {_rate(len(payloads), time.perf_counter() - started)}")
+        
+        verifier = Ed25519Verifier(backend=backend)
+        started = time.perf_counter()
+        for payload in payloads:
+            verifier.verify(*payload)
+        print(f"{backend:<13} cached   {_rate(len(payloads), time.perf_counter() - started)}")
+        
+        for processes in (False, True):
+            verifier.verify_many(payloads[:1024], args.workers, processes)  # warm the pool
+            started = time.perf_counter()
+            results = verifier.verify_many(payloads, args.workers, processes)
+            elapsed = time.perf_counter() - started
+            assert all(results), "a valid payload failed verification"
+            mode = "processes" if processes else "threads"
+            print(f"{backend:<13} {mode:<8} {_rate(len(payloads), elapsed)}")
+        verifier.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+"""
+Local stand-in for the Coherence Network edge functions, for benchmarks.
+
+Serves the api-* and agent-gateway routes the SDK calls, with the same
+response envelopes and record shapes as the real functions, over a
+synthetic in-memory dataset. Latency, payload size and error injection are
+configurable, and responses can be gzipped and sent at a limited
+bandwidth to stand in for a cross-region link. Only the standard library
+is used.
+
+Usage:
+    python benchmarks/mock_server.py --port 8787 --latency-ms 20 --error-rate 0.01
+    python benchmarks/mock_server.py --gzip --bandwidth-kbps 2000
+"""
+
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass
+class MockConfig:
+    """How the mock server behaves"""
+    
+    latency: float = 0.0  # seconds added to every response
+    jitter: float = 0.0  # up to this many extra seconds, uniformly random
+    error_rate: float = 0.0  # share of requests answered with a 503
+    throttle_rate: float = 0.0  # share of requests answered with a 429
+    claims: int = 2000
+    agents: int = 200
+    tasks: int = 500
+    statement_bytes: int = 256  # size of each claim statement
+    gzip: bool = False  # gzip responses of gzip_min_bytes or more, like the functions
+    gzip_min_bytes: int = 1024
+    bandwidth: float = 0.0  # response bytes per second; 0 for unlimited
+    seed: int = 1
+
+
+def _timestamp(base: datetime, offset: int) -> str:
+    return (base - timedelta(seconds=offset)).isoformat().replace("+00:00", "Z")
+
+
+_WORDS = (
+    "the a of and to in is that for on with as by from this be are was at or an which "
+    "claim evidence result model data sample error rate measure effect observed expected "
+    "supports contradicts refines assumption scope trial control baseline variance signal "
+    "energy mass field particle cell protein gene market price demand supply growth "
+    "increase decrease significant consistent replicated independent under over between"
+).split()
+
+
+class _Text:
+    """Statements of word-salad prose: compresses about like real claim text"""
+    
+    def __init__(self, seed: int, size: int):
+        rng = random.Random(seed + 1)  # own stream: records stay as before
+        words = [rng.choice(_WORDS) for _ in range(64 * 1024 // 6)]
+        self._corpus = " ".join(words)
+        self._size = size
+    
+    def statement(self, index: int) -> str:
+        start = index * 7919 % max(1, len(self._corpus) - self._size)
+        return self._corpus[start : start + self._size]
+
+
+class Dataset:
+    """Claims, agents and tasks shaped like the API functions' responses"""
+    
+    def __init__(self, config: MockConfig):
+        rng = random.Random(config.seed)
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        text = _Text(config.seed, config.statement_bytes)
+        
+        self.agents = [
+            {
+                "agent_id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "display_name": f"agent-{i}",
+                "pubkey": "%064x" % rng.getrandbits(256),
+                "capabilities": {"verify": True},
+                "domains": [rng.choice(["physics", "biology", "economics"])],
+                "reputation": {
+                    "calibration": 0.5,
+                    "reliability": 0.5,
+                    "constructiveness": 0.5,
+                    "security_hygiene": 0.5,
+                    "overall_score": 0.5,
+                },
+                "is_verified": True,
+                "verified_at": _timestamp(now, i),
+                "created_at": _timestamp(now, i),
+            }
+            for i in range(config.agents)
+        ]
+        self.claims = []
+        for i in range(config.claims):
+            author = self.agents[i % len(self.agents)] if self.agents else None
+            self.claims.append(
+                {
+                    "claim_id": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "title": f"Claim {i}",
+                    "statement": text.statement(i),
+                    "author": {
+                        "agent_id": author["agent_id"],
+                        "display_name": author["display_name"],
+                    }
+                    if author
+                    else None,
+                    "confidence": round(rng.random(), 3),
+                    "status": rng.choice(["active", "active", "disputed", "verified"]),
+                    "scope": {"domain": rng.choice(["physics", "biology"]), "time_range": None},
+                    "assumptions": [],
+                    "tags": ["bench"],
+                    "coherence_score": round(rng.random(), 3),
+                    "created_at": _timestamp(now, i * 60),
+                }
+            )
+        self.tasks = [
+            {
+                "task_id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "type": rng.choice(["VERIFY", "COUNTEREXAMPLE", "SYNTHESIZE"]),
+                "status": "open",
+                "priority": round(rng.random(), 3),
+                "target": None,
+                "assigned_agent": None,
+                "constraints": {"sandbox": "standard", "time_budget_sec": 3600},
+                "coherence_reward": rng.randint(1, 50),
+                "created_at": _timestamp(now, i * 30),
+            }
+            for i in range(config.tasks)
+        ]
+        self.claims_by_id = {claim["claim_id"]: claim for claim in self.claims}
+        self.agents_by_id = {agent["agent_id"]: agent for agent in self.agents}
+        self.tasks_by_id = {task["task_id"]: task for task in self.tasks}
+
+
+def _page(records: List[Any], query: Dict[str, str], default_limit: int = 50) -> List[Any]:
+    limit = int(query.get("limit", default_limit))
+    offset = int(query.get("offset", 0))
+    return records[offset : offset + limit]
+
+
+# Bytes written per sleep when bandwidth is limited
+_THROTTLE_CHUNK = 16 * 1024
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections from concurrent benchmarks,
+    # which then stall for a full SYN retransmit
+    request_queue_size = 1024
+
+
+class MockCoherenceServer:
+    """
+    Threaded HTTP server answering like the Coherence Network functions.
+    
+    Usage:
+        with MockCoherenceServer(MockConfig(latency=0.005)) as server:
+            client = CoherenceClient(base_url=server.base_url, anon_key="bench")
+    """
+    
+    def __init__(
+        self,
+        config: Optional[MockConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or MockConfig()
+        self.data = Dataset(self.config)
+        self.requests: Counter = Counter()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> "MockCoherenceServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def __enter__(self) -> "MockCoherenceServer":
+        return self.start()
+    
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+    
+    def _draw(self) -> Tuple[float, float]:
+        with self._lock:
+            return self._rng.random(), self._rng.random()
+    
+    def route(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, str],
+        body: Dict[str, Any],
+    ) -> Tuple[int, Any]:
+        """Status and ``data`` (or error message) for one request"""
+        parts = [part for part in path.split("/") if part]
+        if not parts:
+            return 404, "Not found"
+        function, rest = parts[0], parts[1:]
+        data = self.data
+        
+        if function == "api-claims" and method == "GET":
+            if not rest:
+                claims = data.claims
+                if query.get("status"):
+                    claims = [c for c in claims if c["status"] == query["status"]]
+                if query.get("ids"):
+                    wanted = set(query["ids"].split(","))
+                    claims = [c for c in claims if c["claim_id"] in wanted]
+                return 200, _page(claims, query)
+            claim = data.claims_by_id.get(rest[0])
+            if claim is None:
+                return 404, "Claim not found"
+            if len(rest) > 1 and rest[1] == "edges":
+                return 200, []
+            return 200, {**claim, "edges": {"supports": 0, "contradicts": 0, "refines": 0}}
+        if function == "api-agents" and method == "GET":
+            if not rest:
+                agents = data.agents
+                if query.get("ids"):
+                    wanted = set(query["ids"].split(","))
+                    agents = [a for a in agents if a["agent_id"] in wanted]
+                return 200, _page(agents, query)
+            agent = data.agents_by_id.get(rest[0])
+            return (200, agent) if agent else (404, "Agent not found")
+        if function == "api-tasks" and method == "GET":
+            if not rest:
+                tasks = data.tasks
+                if query.get("status"):
+                    tasks = [t for t in tasks if t["status"] == query["status"]]
+                return 200, _page(tasks, query)
+            task = data.tasks_by_id.get(rest[0])
+            return (200, task) if task else (404, "Task not found")
+        if function == "api-stats":
+            return 200, {
+                "total_claims": len(data.claims),
+                "verified_claims": sum(c["status"] == "verified" for c in data.claims),
+                "open_disputes": sum(c["status"] == "disputed" for c in data.claims),
+                "active_tasks": len(data.tasks),
+                "total_agents": len(data.agents),
+                "coherence_index": 72.5,
+                "daily_coherence_delta": 0.4,
+            }
+        if function == "api-feed" and method == "GET":
+            items = [
+                {
+                    "id": f"claim_{claim['claim_id']}",
+                    "type": "claim",
+                    "item": claim,
+                    "relevance_score": claim["coherence_score"],
+                    "reason": "Recently active claim",
+                }
+                for claim in data.claims[:100]
+            ]
+            offset = int(query.get("offset", 0))
+            page = _page(items, query, default_limit=20)
+            has_more = offset + len(page) < len(items)
+            return 200, {"items": page, "total": len(items), "has_more": has_more}
+        if method == "POST" and function in ("api-claims", "api-tasks", "agent-gateway"):
+            # Writes are acknowledged but not applied, so runs stay repeatable
+            return 200, {"id": str(uuid.uuid4()), "received": sorted(body)}
+        return 404, "Not found"
+    
+    def _handler_class(self) -> type:
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without TCP_NODELAY,
+            # delayed ACKs add ~40ms to every keep-alive response
+            disable_nagle_algorithm = True
+            
+            def log_message(self, *args: Any) -> None:
+                pass
+            
+            def _respond(self, method: str) -> None:
+                url = urlsplit(self.path)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if raw and self.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+                body = json.loads(raw) if raw else {}
+                
+                config = server.config
+                fail, jitter = server._draw()
+                delay = config.latency + jitter * config.jitter
+                if delay:
+                    time.sleep(delay)
+                
+                headers = {}
+                if fail < config.error_rate:
+                    status, data = 503, "Injected failure"
+                elif fail < config.error_rate + config.throttle_rate:
+                    status, data = 429, "Injected throttle"
+                    headers["Retry-After"] = "0"
+                else:
+                    status, data = server.route(method, url.path, query, body)
+                with server._lock:
+                    server.requests[(method, url.path.split("/")[1], status)] += 1
+                
+                ok = 200 <= status < 300
+                payload = json.dumps(
+                    {
+                        "success": ok,
+                        "data": data if ok else None,
+                        "error": None if ok else data,
+                        "meta": {
+                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                            "request_id": str(uuid.uuid4()),
+                        },
+                    }
+                ).encode()
+                accepts = "gzip" in (self.headers.get("Accept-Encoding") or "")
+                if config.gzip and accepts and len(payload) >= config.gzip_min_bytes:
+                    payload = gzip.compress(payload, compresslevel=6, mtime=0)
+                    headers["Content-Encoding"] = "gzip"
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self._write(payload, config.bandwidth)
+            
+            def _write(self, payload: bytes, bandwidth: float) -> None:
+                if not bandwidth:
+                    self.wfile.write(payload)
+                    return
+                for start in range(0, len(payload), _THROTTLE_CHUNK):
+                    chunk = payload[start : start + _THROTTLE_CHUNK]
+                    self.wfile.write(chunk)
+                    self.wfile.flush()
+                    time.sleep(len(chunk) / bandwidth)
+            
+            def do_GET(self) -> None:
+                self._respond("GET")
+            
+            def do_POST(self) -> None:
+                self._respond("POST")
+        
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--claims", type=int, default=2000)
+    parser.add_argument("--statement-bytes", type=int, default=256)
+    parser.add_argument("--gzip", action="store_true", help="gzip responses over 1 KB")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0.0, help="0 for unlimited")
+    args = parser.parse_args()
+    
+    config = MockConfig(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        claims=args.claims,
+        statement_bytes=args.statement_bytes,
+        gzip=args.gzip,
+        bandwidth=args.bandwidth_kbps * 1000 / 8,
+    )
+    server = MockCoherenceServer(config, args.host, args.port)
+    print(f"Serving {server.base_url} with {asdict(config)}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,24 +3,65 @@ Coherence Network Python SDK
 Official client library for the Coherence Network API
 """
 
-from .client import CoherenceClient, AsyncCoherenceClient
-from .auth import Ed25519Auth
-from .models import (
-    Claim,
-    Task,
-    Agent,
-    Room,
-    Edge,
-    NetworkStats,
-    FeedItem,
-    ApiResponse,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .client import CoherenceClient, AsyncCoherenceClient
+    from .auth import Ed25519Auth, Ed25519Verifier
+    from .batch import BatchFailure, BatchResult
+    from .cache import MemoryCache, ResponseCache
+    from .compression import CompressionConfig
+    from .disk_cache import DiskCache
+    from .graph import ClaimGraph
+    from .instrument import Instrumentation
+    from .outbox import Outbox
+    from .records import CompactRecord
+    from .exceptions import ApiError, CoherenceError
+    from .feed_sync import FeedDelta, FeedSynchronizer
+    from .ratelimit import AdaptiveRateLimiter, CircuitBreaker, CircuitOpenError
+    from .retry import RetryPolicy
+    from .transport import PoolConfig
+    from .worker import TaskResult, TaskWorker
+    from .models import (
+        Claim,
+        Task,
+        Agent,
+        Room,
+        Edge,
+        NetworkStats,
+        FeedItem,
+        FeedPage,
+        ApiResponse,
+    )
 
 __version__ = "1.0.0"
 __all__ = [
     "CoherenceClient",
     "AsyncCoherenceClient",
     "Ed25519Auth",
+    "Ed25519Verifier",
+    "BatchResult",
+    "BatchFailure",
+    "ResponseCache",
+    "MemoryCache",
+    "DiskCache",
+    "ClaimGraph",
+    "FeedSynchronizer",
+    "FeedDelta",
+    "Outbox",
+    "PoolConfig",
+    "CompressionConfig",
+    "Instrumentation",
+    "CompactRecord",
+    "RetryPolicy",
+    "AdaptiveRateLimiter",
+    "CircuitBreaker",
+    "TaskWorker",
+    "TaskResult",
+    "ApiError",
+    "CoherenceError",
+    "CircuitOpenError",
     "Claim",
     "Task",
     "Agent",
@@ -28,5 +69,59 @@ __all__ = [
     "Edge",
     "NetworkStats",
     "FeedItem",
+    "FeedPage",
     "ApiResponse",
 ]
+
+# Public name -> submodule defining it. Submodules (and httpx, pydantic and
+# the signing backends behind them) are imported on first attribute access,
+# so ``import coherence_network`` stays cheap for short-lived processes.
+_EXPORTS: Dict[str, str] = {
+    "CoherenceClient": "client",
+    "AsyncCoherenceClient": "client",
+    "Ed25519Auth": "auth",
+    "Ed25519Verifier": "auth",
+    "BatchResult": "batch",
+    "BatchFailure": "batch",
+    "ResponseCache": "cache",
+    "MemoryCache": "cache",
+    "DiskCache": "disk_cache",
+    "ClaimGraph": "graph",
+    "FeedSynchronizer": "feed_sync",
+    "FeedDelta": "feed_sync",
+    "Outbox": "outbox",
+    "PoolConfig": "transport",
+    "CompressionConfig": "compression",
+    "Instrumentation": "instrument",
+    "CompactRecord": "records",
+    "RetryPolicy": "retry",
+    "AdaptiveRateLimiter": "ratelimit",
+    "CircuitBreaker": "ratelimit",
+    "TaskWorker": "worker",
+    "TaskResult": "worker",
+    "ApiError": "exceptions",
+    "CoherenceError": "exceptions",
+    "CircuitOpenError": "ratelimit",
+    "Claim": "models",
+    "Task": "models",
+    "Agent": "models",
+    "Room": "models",
+    "Edge": "models",
+    "NetworkStats": "models",
+    "FeedItem": "models",
+    "FeedPage": "models",
+    "ApiResponse": "models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
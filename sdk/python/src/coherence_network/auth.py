@@ -2,9 +2,27 @@
 Ed25519 authentication for Alephnet mesh integration
 """
 
+import os
 import time
-from typing import Tuple
-import ed25519
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .signing import (
+    DEFAULT_KEY_CACHE_SIZE,
+    KeyCache,
+    SignerBackend,
+    init_verify_worker,
+    init_worker,
+    load_signer,
+    sign_in_worker,
+    verify_in_worker,
+)
+
+# The gateway rejects signatures whose timestamp is further than this from now
+DEFAULT_MAX_SKEW = 300.0
+
+# A signed payload as sent: (body, signature_hex, pubkey_hex, timestamp_ms)
+SignedPayload = Tuple[Union[str, bytes], str, str, Union[str, int]]
 
 
 class Ed25519Auth:
@@ -14,65 +32,327 @@ class Ed25519Auth:
     Usage:
         auth = Ed25519Auth(private_key_hex="your-64-char-hex-private-key")
         signature, pubkey, timestamp = auth.sign(request_body)
+    
+    Signing uses the fastest installed backend (PyNaCl, then cryptography,
+    then the ``ed25519`` package); pass ``backend=`` to pin one.
     """
     
-    def __init__(self, private_key_hex: str):
+    def __init__(self, private_key_hex: str, backend: Optional[str] = None):
         """
         Initialize with a hex-encoded Ed25519 private key.
         
         Args:
             private_key_hex: 64-character hex string representing the 32-byte private key
+            backend: Signing backend name (``"pynacl"``, ``"cryptography"``,
+                ``"ed25519"``); default picks the fastest installed one
         """
         if len(private_key_hex) != 64:
             raise ValueError("Private key must be 64 hex characters (32 bytes)")
         
-        private_key_bytes = bytes.fromhex(private_key_hex)
-        self._signing_key = ed25519.SigningKey(private_key_bytes)
-        self._verifying_key = self._signing_key.get_verifying_key()
+        self._seed = bytes.fromhex(private_key_hex)
+        self._signer: SignerBackend = load_signer(self._seed, backend)
+        self._public_key_hex = self._signer.public_key.hex()
+        self._pool: Optional[Executor] = None
+        self._pool_key: Optional[Tuple[bool, int]] = None
+    
+    @property
+    def backend(self) -> str:
+        """Name of the signing backend in use"""
+        return self._signer.name
     
     @property
     def public_key_hex(self) -> str:
         """Get the hex-encoded public key"""
-        return self._verifying_key.to_bytes().hex()
+        return self._public_key_hex
+    
+    def _sign_body(self, body: Union[str, bytes]) -> Tuple[bytes, str]:
+        """Sign ``timestamp:body`` and return (signature, timestamp)"""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        timestamp = str(int(time.time() * 1000))
+        # Ed25519 hashes the whole message twice and has no incremental API, so
+        # the prefix and body must be contiguous: one join, no re-encoding.
+        return self._signer.sign(b"%s:%s" % (timestamp.encode("ascii"), body)), timestamp
     
-    def sign(self, message: str) -> Tuple[str, str, str]:
+    def sign(self, message: Union[str, bytes]) -> Tuple[str, str, str]:
         """
         Sign a message with timestamp for API authentication.
         
         Args:
-            message: The request body to sign
-            
+            message: The request body to sign, as text or the exact UTF-8 bytes sent
+        
         Returns:
             Tuple of (signature_hex, public_key_hex, timestamp_ms)
         """
-        timestamp = str(int(time.time() * 1000))
-        full_message = f"{timestamp}:{message}"
-        
-        signature = self._signing_key.sign(full_message.encode("utf-8"))
+        signature, timestamp = self._sign_body(message)
         
         return (
             signature.hex(),
-            self.public_key_hex,
+            self._public_key_hex,
             timestamp,
         )
     
-    def get_headers(self, body: str) -> dict:
+    def _headers(self, signature: bytes, timestamp: str) -> Dict[str, str]:
+        return {
+            "X-Alephnet-Pubkey": self._public_key_hex,
+            "X-Alephnet-Signature": signature.hex(),
+            "X-Alephnet-Timestamp": timestamp,
+        }
+    
+    def get_headers(self, body: Union[str, bytes]) -> dict:
         """
         Get authentication headers for a request.
         
         Args:
-            body: The request body as a string
-            
+            body: The request body, as text or the exact UTF-8 bytes sent
+        
         Returns:
             Dictionary of headers to include in the request
         """
-        signature, pubkey, timestamp = self.sign(body)
+        return self._headers(*self._sign_body(body))
+    
+    def _executor(self, processes: bool, workers: int) -> Executor:
+        if self._pool is not None and self._pool_key != (processes, workers):
+            self.close()
+        if self._pool is None:
+            if processes:
+                # Imported here: it pulls in multiprocessing, which most callers never use
+                from concurrent.futures import ProcessPoolExecutor
+                
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=init_worker,
+                    initargs=(self._seed, self._signer.name),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="coherence-sign"
+                )
+            self._pool_key = (processes, workers)
+        return self._pool
+    
+    def sign_many(
+        self,
+        bodies: Iterable[Union[str, bytes]],
+        workers: Optional[int] = None,
+        processes: bool = False,
+        chunksize: int = 64,
+    ) -> List[Dict[str, str]]:
+        """
+        Sign many request bodies in parallel for bulk gateway submissions.
         
-        return {
-            "X-Alephnet-Pubkey": pubkey,
-            "X-Alephnet-Signature": signature,
-            "X-Alephnet-Timestamp": timestamp,
-        }
+        Threads help with backends that release the GIL (PyNaCl). Processes
+        scale every backend across cores; the key is loaded once per worker
+        process. The pool is kept for later calls until ``close()``.
+        
+        Args:
+            bodies: Request bodies, exactly as they will be sent
+            workers: Pool size (default: CPU count)
+            processes: Use a process pool instead of threads
+            chunksize: Bodies sent to a worker process at a time
+        
+        Returns:
+            Header dicts in the same order as ``bodies``
+        """
+        prefix = str(int(time.time() * 1000))
+        timestamp = prefix.encode("ascii")
+        messages = [
+            b"%s:%s" % (timestamp, body if isinstance(body, bytes) else body.encode("utf-8"))
+            for body in bodies
+        ]
+        pool = self._executor(processes, workers or os.cpu_count() or 1)
+        if processes:
+            signatures = pool.map(sign_in_worker, messages, chunksize=chunksize)
+        else:
+            signatures = pool.map(self._signer.sign, messages)
+        return [self._headers(signature, prefix) for signature in signatures]
+    
+    def close(self) -> None:
+        """Shut down the ``sign_many`` worker pool, if one was started"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_key = None
+
+
+class Ed25519Verifier:
+    """
+    Check Alephnet signatures made by ``Ed25519Auth`` (or any peer using the
+    same ``timestamp:body`` scheme), as the agent gateway does.
+    
+    Usage:
+        verifier = Ed25519Verifier()
+        if verifier.verify_headers(body, request.headers):
+            ...
+        results = verifier.verify_many(payloads)  # bulk, across processes
+    
+    Verifiers for peers' public keys are kept in an LRU cache, so a key is
+    decoded and checked once rather than per message. A signature is only accepted when its
+    timestamp is within ``max_skew`` seconds of now.
+    """
+    
+    def __init__(
+        self,
+        max_skew: float = DEFAULT_MAX_SKEW,
+        backend: Optional[str] = None,
+        cache_size: int = DEFAULT_KEY_CACHE_SIZE,
+    ):
+        """
+        Args:
+            max_skew: Seconds a timestamp may differ from now, either way
+            backend: Verification backend name (``"pynacl"``, ``"cryptography"``,
+                ``"ed25519"``); default picks the fastest installed one
+            cache_size: Public keys kept parsed
+        """
+        self.max_skew = max_skew
+        self.keys = KeyCache(backend, cache_size)
+        self._pool: Optional[Executor] = None
+        self._pool_key: Optional[Tuple[bool, int]] = None
+    
+    @property
+    def backend(self) -> str:
+        """Name of the verification backend in use"""
+        return self.keys.backend
+    
+    def _prepare(
+        self,
+        body: Union[str, bytes],
+        signature_hex: str,
+        pubkey_hex: str,
+        timestamp: Union[str, int],
+        now_ms: float,
+    ) -> Optional[Tuple[str, bytes, bytes]]:
+        """``(pubkey_hex, signature, message)`` to check, or ``None`` if it can't pass"""
+        try:
+            # Signed as sent, so "0123" must not be normalised to "123"
+            stamp = str(timestamp).encode("ascii")
+            sent_ms = int(stamp)
+            signature = bytes.fromhex(signature_hex)
+        except (TypeError, ValueError):
+            return None
+        if len(signature) != 64 or not isinstance(pubkey_hex, str):
+            return None
+        if abs(now_ms - sent_ms) > self.max_skew * 1000:
+            return None
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return pubkey_hex, signature, b"%s:%s" % (stamp, body)
+    
+    def verify(
+        self,
+        body: Union[str, bytes],
+        signature_hex: str,
+        pubkey_hex: str,
+        timestamp: Union[str, int],
+        now: Optional[float] = None,
+    ) -> bool:
+        """
+        Check one signed payload.
+        
+        Args:
+            body: The payload, as text or the exact UTF-8 bytes that were signed
+            signature_hex: Hex signature (``X-Alephnet-Signature``)
+            pubkey_hex: Hex public key of the signer (``X-Alephnet-Pubkey``)
+            timestamp: Milliseconds since the epoch (``X-Alephnet-Timestamp``)
+            now: Current time in seconds (default: ``time.time()``)
+        
+        Returns:
+            True if the signature is valid and the timestamp is within
+            ``max_skew``; False for anything malformed, stale or forged
+        """
+        now_ms = (time.time() if now is None else now) * 1000
+        item = self._prepare(body, signature_hex, pubkey_hex, timestamp, now_ms)
+        return item is not None and self.keys.verify(*item)
+    
+    def verify_headers(
+        self,
+        body: Union[str, bytes],
+        headers: Mapping[str, str],
+        now: Optional[float] = None,
+    ) -> bool:
+        """Check a payload against its ``X-Alephnet-*`` headers (names in any case)"""
+        lowered = {name.lower(): value for name, value in headers.items()}
+        signature = lowered.get("x-alephnet-signature")
+        pubkey = lowered.get("x-alephnet-pubkey")
+        timestamp = lowered.get("x-alephnet-timestamp")
+        if not (signature and pubkey and timestamp):
+            return False
+        return self.verify(body, signature, pubkey, timestamp, now)
+    
+    def _executor(self, processes: bool, workers: int) -> Executor:
+        if self._pool is not None and self._pool_key != (processes, workers):
+            self.close()
+        if self._pool is None:
+            if processes:
+                from concurrent.futures import ProcessPoolExecutor
+                
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=init_verify_worker,
+                    initargs=(self.keys.backend, self.keys.size),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="coherence-verify"
+                )
+            self._pool_key = (processes, workers)
+        return self._pool
+    
+    def verify_many(
+        self,
+        payloads: Iterable[SignedPayload],
+        workers: Optional[int] = None,
+        processes: bool = True,
+        chunksize: int = 256,
+        now: Optional[float] = None,
+    ) -> List[bool]:
+        """
+        Check many signed payloads in parallel.
+        
+        Hex decoding and timestamp checks run here; only well-formed, fresh
+        payloads are sent to the pool. Each worker process keeps its own key
+        cache across calls. Batches smaller than ``chunksize`` are verified
+        inline, since the pool round trip would cost more than it saves. The
+        pool is kept for later calls until ``close()``.
+        
+        Args:
+            payloads: ``(body, signature_hex, pubkey_hex, timestamp_ms)`` tuples
+            workers: Pool size (default: CPU count)
+            processes: Use a process pool; ``False`` uses threads, which only
+                helps with backends that release the GIL (PyNaCl)
+            chunksize: Payloads sent to a worker process at a time
+            now: Current time in seconds (default: ``time.time()``)
+        
+        Returns:
+            One result per payload, in order
+        """
+        now_ms = (time.time() if now is None else now) * 1000
+        items = [self._prepare(*payload, now_ms) for payload in payloads]
+        results = [False] * len(items)
+        ready: List[Tuple[int, Tuple[str, bytes, bytes]]] = [
+            (index, item) for index, item in enumerate(items) if item is not None
+        ]
+        if len(ready) < chunksize:
+            for index, item in ready:
+                results[index] = self.keys.verify(*item)
+            return results
+        
+        pool = self._executor(processes, workers or os.cpu_count() or 1)
+        checks = [item for _, item in ready]
+        if processes:
+            verified = pool.map(verify_in_worker, checks, chunksize=chunksize)
+        else:
+            verified = pool.map(lambda item: self.keys.verify(*item), checks)
+        for (index, _), ok in zip(ready, verified):
+            results[index] = ok
+        return results
+    
+    def close(self) -> None:
+        """Shut down the ``verify_many`` worker pool, if one was started"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_key = None
 
 
 def generate_keypair() -> Tuple[str, str]:
@@ -82,6 +362,8 @@ def generate_keypair() -> Tuple[str, str]:
     Returns:
         Tuple of (private_key_hex, public_key_hex)
     """
+    import ed25519
+    
     signing_key, verifying_key = ed25519.create_keypair()
     return (
         signing_key.to_bytes().hex(),
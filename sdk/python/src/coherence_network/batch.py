@@ -0,0 +1,239 @@
+"""
+Bulk ingestion helpers: chunked validation and pipelined uploads
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .decoding import envelope_error, envelope_success
+from .models import ApiResponse
+
+M = TypeVar("M", bound=BaseModel)
+
+DEFAULT_BATCH_CONCURRENCY = 16
+DEFAULT_CHUNK_SIZE = 500
+
+
+@dataclass
+class BatchFailure:
+    """A single item that could not be validated or uploaded"""
+    index: int
+    error: str
+    item: Any = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a bulk upload, with one result slot per input item"""
+    results: List[Optional[ApiResponse]] = field(default_factory=list)
+    failures: List[BatchFailure] = field(default_factory=list)
+    
+    @property
+    def succeeded(self) -> int:
+        """Number of items uploaded successfully"""
+        return len(self.results) - len(self.failures)
+    
+    @property
+    def failed(self) -> int:
+        """Number of items that failed validation or upload"""
+        return len(self.failures)
+    
+    @property
+    def ok(self) -> bool:
+        """True if every item was uploaded successfully"""
+        return not self.failures
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+_ADAPTERS: Dict[type, TypeAdapter] = {}
+
+
+def _list_adapter(model: Type[M]) -> TypeAdapter:
+    adapter = _ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _ADAPTERS[model] = TypeAdapter(List[model])  # type: ignore[valid-type]
+    return adapter
+
+
+def validate_chunk(
+    model: Type[M],
+    chunk: List[Union[M, Dict[str, Any]]],
+    start: int,
+) -> Tuple[List[Tuple[int, M]], List[BatchFailure]]:
+    """
+    Validate a chunk of request items in one pass.
+    
+    The whole chunk is validated with a cached ``TypeAdapter``; only when it
+    fails are items re-checked one by one so that every bad item is reported
+    against its index in the original input.
+    """
+    adapter = _list_adapter(model)
+    try:
+        validated = adapter.validate_python(chunk)
+        return [(start + i, item) for i, item in enumerate(validated)], []
+    except ValidationError:
+        pass
+    
+    valid: List[Tuple[int, M]] = []
+    failures: List[BatchFailure] = []
+    for i, item in enumerate(chunk):
+        try:
+            valid.append((start + i, model.model_validate(item)))
+        except ValidationError as exc:
+            failures.append(BatchFailure(start + i, str(exc), item))
+    return valid, failures
+
+
+def _record(
+    result: BatchResult,
+    index: int,
+    item: BaseModel,
+    response: Optional[ApiResponse] = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    if error is not None:
+        result.failures.append(BatchFailure(index, str(error) or type(error).__name__, item))
+        return
+    result.results[index] = response
+    if not envelope_success(response):
+        message = envelope_error(response) or "Unknown API error"
+        result.failures.append(BatchFailure(index, message, item))
+
+
+def run_batch(
+    send: Callable[[M], ApiResponse],
+    model: Type[M],
+    items: Iterable[Union[M, Dict[str, Any]]],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BatchResult:
+    """
+    Validate and upload items with a bounded thread pool.
+    
+    Items are consumed in chunks, so the input can be a generator of any
+    length. While one chunk is being validated, uploads from the previous
+    chunk keep running; at most ``concurrency * 2`` uploads are queued.
+    
+    Args:
+        send: Callable that uploads one validated request model
+        model: Request model used to validate each item
+        items: Request models or dicts to upload
+        concurrency: Number of uploads in flight
+        chunk_size: Number of items validated at a time
+    
+    Returns:
+        BatchResult with per-item responses and a failure report
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    
+    result = BatchResult()
+    pending: Deque[Tuple[int, M, Future]] = deque()
+    
+    def collect(index: int, item: M, future: Future) -> None:
+        try:
+            _record(result, index, item, response=future.result())
+        except Exception as exc:
+            _record(result, index, item, error=exc)
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for chunk in _chunks(items, chunk_size):
+            start = len(result.results)
+            result.results.extend([None] * len(chunk))
+            valid, failures = validate_chunk(model, chunk, start)
+            result.failures.extend(failures)
+            
+            for index, item in valid:
+                pending.append((index, item, executor.submit(send, item)))
+                while len(pending) > concurrency * 2:
+                    collect(*pending.popleft())
+        
+        while pending:
+            collect(*pending.popleft())
+    
+    result.failures.sort(key=lambda failure: failure.index)
+    return result
+
+
+async def arun_batch(
+    send: Callable[[M], Awaitable[ApiResponse]],
+    model: Type[M],
+    items: Iterable[Union[M, Dict[str, Any]]],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BatchResult:
+    """Async counterpart of ``run_batch`` using tasks on the running loop"""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    
+    result = BatchResult()
+    in_flight: Set[asyncio.Task] = set()
+    owners: Dict[asyncio.Task, Tuple[int, M]] = {}
+    
+    def collect(done: Iterable[asyncio.Task]) -> None:
+        for task in done:
+            index, item = owners.pop(task)
+            if task.exception() is not None:
+                _record(result, index, item, error=task.exception())
+            else:
+                _record(result, index, item, response=task.result())
+    
+    try:
+        for chunk in _chunks(items, chunk_size):
+            start = len(result.results)
+            result.results.extend([None] * len(chunk))
+            valid, failures = validate_chunk(model, chunk, start)
+            result.failures.extend(failures)
+            
+            for index, item in valid:
+                if len(in_flight) >= concurrency:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    collect(done)
+                task = asyncio.ensure_future(send(item))
+                owners[task] = (index, item)
+                in_flight.add(task)
+        
+        if in_flight:
+            done, _ = await asyncio.wait(in_flight)
+            collect(done)
+    finally:
+        for task in owners:
+            task.cancel()
+    
+    result.failures.sort(key=lambda failure: failure.index)
+    return result
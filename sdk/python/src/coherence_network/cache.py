@@ -0,0 +1,187 @@
+"""
+Read-through response caching for GET requests
+"""
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Endpoint prefixes whose cached reads a mutation on the given prefix makes stale.
+# Anything not listed invalidates its own top-level function (e.g. "/api-rooms").
+INVALIDATIONS: Dict[str, Tuple[str, ...]] = {
+    "/api-claims": ("/api-claims", "/api-stats", "/api-feed"),
+    "/api-tasks": ("/api-tasks", "/api-stats", "/api-feed"),
+    "/api-rooms": ("/api-rooms", "/api-feed"),
+    "/agent-gateway/create-claim": ("/api-claims", "/api-stats", "/api-feed"),
+    "/agent-gateway/create-edge": ("/api-claims", "/api-stats", "/api-feed"),
+    "/agent-gateway/claim-task": ("/api-tasks", "/api-stats", "/api-feed"),
+    "/agent-gateway/submit-result": ("/api-tasks", "/api-stats", "/api-feed"),
+    "/agent-gateway/register": ("/api-agents",),
+}
+
+DEFAULT_TTLS: Dict[str, float] = {
+    "/api-claims": 30.0,
+    "/api-agents": 60.0,
+    "/api-rooms": 30.0,
+    "/api-stats": 10.0,
+}
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Top-level function of an endpoint, e.g. ``/api-claims`` for ``/api-claims/x/edges``"""
+    return "/" + endpoint.lstrip("/").split("/", 1)[0].split("?", 1)[0].split("#", 1)[0]
+
+
+@lru_cache(maxsize=1024)
+def credential_fingerprint(anon_key: str, access_token: Optional[str]) -> str:
+    """Short digest of the credentials a GET is sent with"""
+    secret = f"{anon_key}\0{access_token or ''}".encode("utf-8")
+    return hashlib.blake2b(secret, digest_size=8).hexdigest()
+
+
+def cache_key(path: str, fingerprint: str) -> str:
+    """
+    Cache key for a GET ``path`` sent with the credentials of ``fingerprint``.
+    
+    Row-level security filters reads per caller, so one agent's response
+    must not be served to another sharing the cache. The fingerprint is a
+    ``#`` suffix, which keeps TTL and invalidation prefixes matching.
+    """
+    return f"{path}#{fingerprint}"
+
+
+def invalidation_prefixes(endpoint: str) -> Tuple[str, ...]:
+    """Endpoint prefixes whose cached reads are stale after a mutation on ``endpoint``"""
+    best = ""
+    for prefix in INVALIDATIONS:
+        if endpoint.startswith(prefix) and len(prefix) > len(best):
+            best = prefix
+    return INVALIDATIONS[best] if best else (endpoint_family(endpoint),)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached response body with its validator and expiry (wall-clock seconds)"""
+    content: bytes
+    expires_at: float
+    etag: Optional[str] = None
+    
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Whether the entry can be served without contacting the server"""
+        return (time.time() if now is None else now) < self.expires_at
+    
+    def refreshed(self, ttl: float, now: Optional[float] = None) -> "CacheEntry":
+        """A copy of the entry with a renewed expiry, e.g. after a 304"""
+        return replace(self, expires_at=(time.time() if now is None else now) + ttl)
+
+
+class ResponseCache(ABC):
+    """
+    Interface for response cache backends.
+    
+    Keys are request paths including the query string, relative to the
+    client's base URL, with the caller's credential fingerprint appended
+    (see ``cache_key``). Entries are kept past their expiry so that stale
+    entries with an ETag can be revalidated with a conditional GET.
+    """
+    
+    def __init__(
+        self,
+        default_ttl: float = 0.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            default_ttl: TTL in seconds for endpoints not listed in ``ttls``
+                (0 disables caching for them)
+            ttls: TTL in seconds per endpoint prefix, e.g. ``{"/api-stats": 5}``;
+                the longest matching prefix wins
+        """
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+    
+    def ttl_for(self, key: str) -> float:
+        """TTL in seconds for a cache key (0 means the response is not cached)"""
+        best, ttl = -1, self.default_ttl
+        for prefix, value in self.ttls.items():
+            if key.startswith(prefix) and len(prefix) > best:
+                best, ttl = len(prefix), value
+        return ttl
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for ``key``, fresh or stale, if present"""
+    
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry"""
+    
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if present"""
+    
+    @abstractmethod
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Remove every entry whose key starts with ``prefix``"""
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry"""
+
+
+class MemoryCache(ResponseCache):
+    """
+    Thread-safe in-memory LRU response cache.
+    
+    Usage:
+        cache = MemoryCache(max_entries=10_000, ttls={"/api-claims": 60, "/api-stats": 5})
+        client = CoherenceClient(base_url=..., anon_key=..., cache=cache)
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 0.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        super().__init__(default_ttl, ttls)
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def invalidate_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -3,13 +3,56 @@ Coherence Network API Client
 Synchronous and asynchronous client implementations
 """
 
-import json
-from typing import Any, Dict, List, Optional, Union
+import time
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    get_origin,
+)
 from urllib.parse import urlencode
 
 import httpx
 
 from .auth import Ed25519Auth
+from .batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_CHUNK_SIZE,
+    BatchResult,
+    arun_batch,
+    run_batch,
+)
+from .cache import (
+    CacheEntry,
+    ResponseCache,
+    cache_key,
+    credential_fingerprint,
+    endpoint_family,
+    invalidation_prefixes,
+)
+from .coalesce import (
+    DEFAULT_BATCH_SIZE,
+    AsyncBatcher,
+    AsyncSingleFlight,
+    Batcher,
+    SingleFlight,
+    split_envelope,
+)
+from .compression import DEFAULT_COMPRESSION, CompressionConfig
+from .concurrency import DEFAULT_MAX_CONCURRENCY, gather_bounded
+from .decoding import DECODE_MODES, DECODE_RAW, Envelope, decode_response
+from .encoding import encode_json
 from .models import (
     Agent,
     ApiResponse,
@@ -18,12 +61,25 @@ from .models import (
     CreateEdgeRequest,
     CreateRoomRequest,
     Edge,
-    FeedItem,
+    FeedPage,
     NetworkStats,
     Room,
     SubmitResultRequest,
     Task,
 )
+from .pagination import DEFAULT_PAGE_SIZE, aiter_items, iter_items
+from .phases import DECODE, ENCODE, NULL_TRACE, SIGN
+from .ratelimit import AdaptiveRateLimiter, CircuitBreaker
+from .retry import DEFAULT_RETRY, Retrier, RetryPolicy, route_key
+from .streaming import PageStream
+from .transport import DEFAULT_POOL, PoolConfig
+
+if TYPE_CHECKING:
+    # Opt-in features, imported where they are used
+    from .export import ColumnarTable
+    from .instrument import Instrumentation, RequestTrace
+    from .outbox import Outbox
+    from .realtime import Subscription
 
 
 class BaseClient:
@@ -36,20 +92,137 @@ class BaseClient:
         access_token: Optional[str] = None,
         auth: Optional[Ed25519Auth] = None,
         timeout: float = 30.0,
+        decode: str = DECODE_RAW,
+        cache: Optional[ResponseCache] = None,
+        pool: Optional[PoolConfig] = None,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        coalesce: bool = True,
+        batch_window: Optional[float] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        instrument: Optional["Instrumentation"] = None,
+        outbox: Optional["Outbox"] = None,
+        compression: Optional[CompressionConfig] = None,
     ):
+        if decode not in DECODE_MODES:
+            raise ValueError(f"decode must be one of {DECODE_MODES}, got {decode!r}")
+        
         self.base_url = base_url.rstrip("/")
         self.anon_key = anon_key
         self.access_token = access_token
         self.auth = auth
         self.timeout = timeout
+        self.decode = decode
+        self.cache = cache
+        self.pool = pool or DEFAULT_POOL
+        self.retry = retry or DEFAULT_RETRY
+        self._retrier = Retrier(self.retry)
+        self.limiter = limiter
+        self.breaker = breaker
+        self.coalesce = coalesce
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        self.instrument = instrument
+        self.outbox = outbox
+        self.compression = compression or DEFAULT_COMPRESSION
+        self._accept_encoding = self.compression.accept_encoding()
+        self._owns_http = True
+    
+    def _trace(self, method: str, endpoint: str) -> "RequestTrace":
+        """Phase timer for one call (a shared no-op while uninstrumented)"""
+        if self.instrument is None:
+            return NULL_TRACE
+        return self.instrument.trace(method, endpoint)
+    
+    def _record_outcome(self, family: str, status_code: int) -> None:
+        if self.limiter is not None:
+            self.limiter.record(family, status_code)
+        if self.breaker is not None:
+            self.breaker.record(self.base_url, status_code < 500)
+    
+    def _guard(self, endpoint: str, attempt: Callable[[], Any]) -> Callable[[], Any]:
+        """Wrap one HTTP attempt with the rate limiter and circuit breaker"""
+        if self.limiter is None and self.breaker is None:
+            return attempt
+        family = endpoint_family(endpoint)
+        
+        def guarded() -> httpx.Response:
+            if self.breaker is not None:
+                self.breaker.before_request(self.base_url)
+            if self.limiter is not None:
+                self.limiter.acquire(family)
+            try:
+                response = attempt()
+            except httpx.TransportError:
+                if self.breaker is not None:
+                    self.breaker.record(self.base_url, False)
+                raise
+            self._record_outcome(family, response.status_code)
+            return response
+        
+        return guarded
+    
+    def _aguard(
+        self,
+        endpoint: str,
+        attempt: Callable[[], Awaitable[Any]],
+    ) -> Callable[[], Awaitable[Any]]:
+        """Async counterpart of ``_guard``"""
+        if self.limiter is None and self.breaker is None:
+            return attempt
+        family = endpoint_family(endpoint)
+        
+        async def guarded() -> httpx.Response:
+            if self.breaker is not None:
+                self.breaker.before_request(self.base_url)
+            if self.limiter is not None:
+                await self.limiter.acquire_async(family)
+            try:
+                response = await attempt()
+            except httpx.TransportError:
+                if self.breaker is not None:
+                    self.breaker.record(self.base_url, False)
+                raise
+            self._record_outcome(family, response.status_code)
+            return response
+        
+        return guarded
+    
+    def _post_headers(
+        self,
+        body: bytes,
+        use_ed25519: bool,
+        idempotency_key: Optional[str],
+    ) -> Dict[str, str]:
+        """Headers for a POST, with its ``Idempotency-Key`` if it has one"""
+        headers = self._get_headers(body, use_ed25519)
+        if idempotency_key is None and self.retry.idempotency_keys:
+            idempotency_key = uuid.uuid4().hex
+        if idempotency_key is not None:
+            headers["Idempotency-Key"] = idempotency_key
+        return headers
+    
+    def _enqueue(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str],
+    ) -> ApiResponse:
+        """Queue a signed gateway mutation in the outbox and answer at once"""
+        from .outbox import queued_response
+        
+        key, duplicate = self.outbox.enqueue(endpoint, data, True, idempotency_key)
+        return queued_response(key, duplicate, self.decode)
     
     def _get_headers(
         self,
-        body: Optional[str] = None,
+        body: Optional[bytes] = None,
         use_ed25519: bool = False,
     ) -> Dict[str, str]:
         headers = {
             "Content-Type": "application/json",
+            "Accept-Encoding": self._accept_encoding,
             "apikey": self.anon_key,
         }
         
@@ -59,6 +232,94 @@ class BaseClient:
             headers["Authorization"] = f"Bearer {self.access_token}"
         
         return headers
+    
+    def _compress(
+        self,
+        body: bytes,
+        headers: Dict[str, str],
+        trace: "RequestTrace",
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """Gzip a large POST body after it was signed"""
+        threshold = self.compression.request_threshold
+        if threshold is None or len(body) < threshold:
+            return body, headers
+        with trace.phase(ENCODE):
+            body, encoding = self.compression.compress(body)
+        return body, {**headers, "Content-Encoding": encoding}
+    
+    def _page_stream(self, response_type: Any, decode: str, path: str) -> Optional[PageStream]:
+        """Incremental decoder for a list GET, or ``None`` to read the body whole"""
+        threshold = self.compression.stream_threshold
+        if threshold is None or get_origin(response_type) not in (list, List):
+            return None
+        keep = self.cache is not None and self.cache.ttl_for(path) > 0
+        return PageStream(response_type, decode, threshold, keep)
+    
+    def _cache_key(self, path: str) -> str:
+        """Cache key for a GET path sent with this client's credentials"""
+        return cache_key(path, credential_fingerprint(self.anon_key, self.access_token))
+    
+    def _cache_lookup(self, path: str) -> Optional[CacheEntry]:
+        """Cached entry for a GET path, fresh or stale"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(path))
+    
+    def _cache_store(
+        self,
+        path: str,
+        response: httpx.Response,
+        cached: Optional[CacheEntry],
+        content: Optional[bytes] = None,
+    ) -> bytes:
+        """
+        Record a GET response in the cache and return the body to decode.
+        
+        ``content`` replaces ``response.content`` for streamed responses.
+        """
+        if content is None:
+            content = response.content
+        if self.cache is None:
+            return content
+        
+        key = self._cache_key(path)
+        ttl = self.cache.ttl_for(path)
+        if response.status_code == 304 and cached is not None:
+            self.cache.set(key, cached.refreshed(ttl))
+            return cached.content
+        if response.status_code == 200 and ttl > 0:
+            self.cache.set(
+                key,
+                CacheEntry(
+                    content=content,
+                    expires_at=time.time() + ttl,
+                    etag=response.headers.get("etag"),
+                ),
+            )
+        return content
+    
+    def _streamed(
+        self,
+        path: str,
+        response: httpx.Response,
+        cached: Optional[CacheEntry],
+        page: Optional[PageStream],
+    ) -> Union[bytes, Envelope]:
+        """Envelope decoded while ``response`` streamed in, or the body to decode"""
+        streamed = page.pop(response) if page is not None else None
+        if streamed is None:
+            return self._cache_store(path, response, cached)
+        envelope, content = streamed
+        if content is not None:
+            self._cache_store(path, response, cached, content)
+        return envelope
+    
+    def _cache_invalidate(self, endpoint: str) -> None:
+        """Drop cached reads made stale by a mutation on ``endpoint``"""
+        if self.cache is None:
+            return
+        for prefix in invalidation_prefixes(endpoint):
+            self.cache.invalidate_prefix(prefix)
 
 
 class ClaimsResource:
@@ -66,6 +327,11 @@ class ClaimsResource:
     
     def __init__(self, client: "CoherenceClient"):
         self._client = client
+        self._batcher = (
+            Batcher(self._get_many, client.batch_window, client.batch_size)
+            if client.batch_window
+            else None
+        )
     
     def list(
         self,
@@ -84,11 +350,55 @@ class ClaimsResource:
         if author_id:
             params["author_id"] = author_id
         
-        return self._client._get("/api-claims", params)
+        return self._client._get("/api-claims", params, List[Claim])
+    
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        domain: Optional[str] = None,
+        author_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Claim]:
+        """Iterate over every matching claim, fetching pages lazily"""
+        return iter_items(
+            lambda limit, offset: self.list(status, domain, author_id, limit, offset),
+            page_size,
+            prefetch,
+        )
+    
+    def export_columns(
+        self,
+        path: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        status: Optional[str] = None,
+        domain: Optional[str] = None,
+        author_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        batch_rows: Optional[int] = None,
+    ) -> Union["ColumnarTable", int]:
+        """Export every matching claim into typed columns, or to Parquet if ``path`` is set"""
+        from .export import DEFAULT_BATCH_ROWS, export_records
+        
+        return export_records(
+            self.iter_all(status, domain, author_id, page_size=page_size, prefetch=True),
+            "claim",
+            path,
+            columns,
+            batch_rows or DEFAULT_BATCH_ROWS,
+        )
     
     def get(self, claim_id: str) -> ApiResponse[Claim]:
-        """Get a claim by ID"""
-        return self._client._get(f"/api-claims/{claim_id}")
+        """Get a claim by ID (batched with concurrent calls if ``batch_window`` is set)"""
+        if self._batcher is not None:
+            return self._batcher.load(claim_id)
+        return self._client._get(f"/api-claims/{claim_id}", response_type=Claim)
+    
+    def _get_many(self, claim_ids: List[str]) -> Dict[str, Any]:
+        """One list query for several IDs, split into per-ID responses"""
+        params = {"ids": ",".join(claim_ids), "limit": len(claim_ids)}
+        response = self._client._get("/api-claims", params, decode=DECODE_RAW)
+        return split_envelope(response, claim_ids, "claim", Claim, self._client.decode)
     
     def create(
         self,
@@ -108,11 +418,38 @@ class ClaimsResource:
             scope_domain=scope_domain,
             tags=tags or [],
         )
-        return self._client._post("/api-claims", data.model_dump())
+        return self._client._post("/api-claims", data.model_dump(), response_type=Claim)
+    
+    def create_many(
+        self,
+        claims: Iterable[Union[CreateClaimRequest, Dict[str, Any]]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> BatchResult:
+        """
+        Create many claims with pipelined, concurrent uploads.
+        
+        Args:
+            claims: CreateClaimRequest models or dicts with the same fields
+            concurrency: Number of uploads in flight
+            chunk_size: Number of claims validated at a time
+        
+        Returns:
+            BatchResult with one response per input and a failure report
+        """
+        return run_batch(
+            lambda request: self._client._post(
+                "/api-claims", request.model_dump(), response_type=Claim
+            ),
+            CreateClaimRequest,
+            claims,
+            concurrency,
+            chunk_size,
+        )
     
     def get_edges(self, claim_id: str) -> ApiResponse[List[Edge]]:
         """Get edges connected to a claim"""
-        return self._client._get(f"/api-claims/{claim_id}/edges")
+        return self._client._get(f"/api-claims/{claim_id}/edges", response_type=List[Edge])
     
     def create_edge(
         self,
@@ -130,7 +467,36 @@ class ClaimsResource:
             justification=justification,
             weight=weight,
         )
-        return self._client._post("/api-claims/edges", data.model_dump())
+        return self._client._post(
+            "/api-claims/edges", data.model_dump(), response_type=Edge
+        )
+    
+    def create_edges_many(
+        self,
+        edges: Iterable[Union[CreateEdgeRequest, Dict[str, Any]]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> BatchResult:
+        """
+        Create many edges with pipelined, concurrent uploads.
+        
+        Args:
+            edges: CreateEdgeRequest models or dicts with the same fields
+            concurrency: Number of uploads in flight
+            chunk_size: Number of edges validated at a time
+        
+        Returns:
+            BatchResult with one response per input and a failure report
+        """
+        return run_batch(
+            lambda request: self._client._post(
+                "/api-claims/edges", request.model_dump(), response_type=Edge
+            ),
+            CreateEdgeRequest,
+            edges,
+            concurrency,
+            chunk_size,
+        )
 
 
 class TasksResource:
@@ -144,23 +510,58 @@ class TasksResource:
         status: Optional[str] = None,
         task_type: Optional[str] = None,
         limit: int = 20,
+        offset: int = 0,
     ) -> ApiResponse[List[Task]]:
         """List tasks with optional filters"""
-        params = {"limit": limit}
+        params = {"limit": limit, "offset": offset}
         if status:
             params["status"] = status
         if task_type:
             params["type"] = task_type
         
-        return self._client._get("/api-tasks", params)
+        return self._client._get("/api-tasks", params, List[Task])
+    
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        task_type: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Task]:
+        """Iterate over every matching task, fetching pages lazily"""
+        return iter_items(
+            lambda limit, offset: self.list(status, task_type, limit, offset),
+            page_size,
+            prefetch,
+        )
+    
+    def export_columns(
+        self,
+        path: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        status: Optional[str] = None,
+        task_type: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        batch_rows: Optional[int] = None,
+    ) -> Union["ColumnarTable", int]:
+        """Export every matching task into typed columns, or to Parquet if ``path`` is set"""
+        from .export import DEFAULT_BATCH_ROWS, export_records
+        
+        return export_records(
+            self.iter_all(status, task_type, page_size=page_size, prefetch=True),
+            "task",
+            path,
+            columns,
+            batch_rows or DEFAULT_BATCH_ROWS,
+        )
     
     def get(self, task_id: str) -> ApiResponse[Task]:
         """Get a task by ID"""
-        return self._client._get(f"/api-tasks/{task_id}")
+        return self._client._get(f"/api-tasks/{task_id}", response_type=Task)
     
     def claim(self, task_id: str) -> ApiResponse[Task]:
         """Claim an open task"""
-        return self._client._post(f"/api-tasks/{task_id}/claim", {})
+        return self._client._post(f"/api-tasks/{task_id}/claim", {}, response_type=Task)
     
     def submit_result(
         self,
@@ -177,7 +578,9 @@ class TasksResource:
             evidence_ids=evidence_ids or [],
             new_claim_ids=new_claim_ids or [],
         )
-        return self._client._post(f"/api-tasks/{task_id}/result", data.model_dump())
+        return self._client._post(
+            f"/api-tasks/{task_id}/result", data.model_dump(), response_type=Task
+        )
 
 
 class AgentsResource:
@@ -185,17 +588,67 @@ class AgentsResource:
     
     def __init__(self, client: "CoherenceClient"):
         self._client = client
+        self._batcher = (
+            Batcher(self._get_many, client.batch_window, client.batch_size)
+            if client.batch_window
+            else None
+        )
     
-    def list(self, domain: Optional[str] = None) -> ApiResponse[List[Agent]]:
+    def list(
+        self,
+        domain: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> ApiResponse[List[Agent]]:
         """List all agents"""
-        params = {}
+        params = {"limit": limit, "offset": offset}
         if domain:
             params["domain"] = domain
-        return self._client._get("/api-agents", params)
+        return self._client._get("/api-agents", params, List[Agent])
+    
+    def iter_all(
+        self,
+        domain: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Agent]:
+        """Iterate over every agent, fetching pages lazily"""
+        return iter_items(
+            lambda limit, offset: self.list(domain, limit, offset),
+            page_size,
+            prefetch,
+        )
+    
+    def export_columns(
+        self,
+        path: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        domain: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        batch_rows: Optional[int] = None,
+    ) -> Union["ColumnarTable", int]:
+        """Export every matching agent into typed columns, or to Parquet if ``path`` is set"""
+        from .export import DEFAULT_BATCH_ROWS, export_records
+        
+        return export_records(
+            self.iter_all(domain, page_size=page_size, prefetch=True),
+            "agent",
+            path,
+            columns,
+            batch_rows or DEFAULT_BATCH_ROWS,
+        )
     
     def get(self, agent_id: str) -> ApiResponse[Agent]:
-        """Get an agent by ID"""
-        return self._client._get(f"/api-agents/{agent_id}")
+        """Get an agent by ID (batched with concurrent calls if ``batch_window`` is set)"""
+        if self._batcher is not None:
+            return self._batcher.load(agent_id)
+        return self._client._get(f"/api-agents/{agent_id}", response_type=Agent)
+    
+    def _get_many(self, agent_ids: List[str]) -> Dict[str, Any]:
+        """One list query for several IDs, split into per-ID responses"""
+        params = {"ids": ",".join(agent_ids), "limit": len(agent_ids)}
+        response = self._client._get("/api-agents", params, decode=DECODE_RAW)
+        return split_envelope(response, agent_ids, "agent", Agent, self._client.decode)
 
 
 class RoomsResource:
@@ -204,16 +657,34 @@ class RoomsResource:
     def __init__(self, client: "CoherenceClient"):
         self._client = client
     
-    def list(self, status: Optional[str] = None) -> ApiResponse[List[Room]]:
+    def list(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> ApiResponse[List[Room]]:
         """List rooms"""
-        params = {}
+        params = {"limit": limit, "offset": offset}
         if status:
             params["status"] = status
-        return self._client._get("/api-rooms", params)
+        return self._client._get("/api-rooms", params, List[Room])
+    
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Room]:
+        """Iterate over every matching room, fetching pages lazily"""
+        return iter_items(
+            lambda limit, offset: self.list(status, limit, offset),
+            page_size,
+            prefetch,
+        )
     
     def get(self, room_id: str) -> ApiResponse[Room]:
         """Get a room by ID"""
-        return self._client._get(f"/api-rooms/{room_id}")
+        return self._client._get(f"/api-rooms/{room_id}", response_type=Room)
     
     def create(
         self,
@@ -227,7 +698,7 @@ class RoomsResource:
             description=description,
             topic_tags=topic_tags or [],
         )
-        return self._client._post("/api-rooms", data.model_dump())
+        return self._client._post("/api-rooms", data.model_dump(), response_type=Room)
 
 
 class FeedResource:
@@ -236,13 +707,17 @@ class FeedResource:
     def __init__(self, client: "CoherenceClient"):
         self._client = client
     
-    def discovery(self, limit: int = 20) -> ApiResponse[List[FeedItem]]:
+    def discovery(self, limit: int = 20) -> ApiResponse[FeedPage]:
         """Get discovery feed"""
-        return self._client._get("/api-feed/discovery", {"limit": limit})
+        return self._client._get(
+            "/api-feed/discovery", {"limit": limit}, FeedPage
+        )
     
-    def coherence_work(self, limit: int = 20) -> ApiResponse[List[FeedItem]]:
+    def coherence_work(self, limit: int = 20) -> ApiResponse[FeedPage]:
         """Get coherence work feed"""
-        return self._client._get("/api-feed/coherence-work", {"limit": limit})
+        return self._client._get(
+            "/api-feed/coherence-work", {"limit": limit}, FeedPage
+        )
 
 
 class StatsResource:
@@ -253,7 +728,7 @@ class StatsResource:
     
     def get(self) -> ApiResponse[NetworkStats]:
         """Get network statistics"""
-        return self._client._get("/api-stats")
+        return self._client._get("/api-stats", response_type=NetworkStats)
 
 
 class GatewayResource:
@@ -271,7 +746,9 @@ class GatewayResource:
         data = {"alephnet_pubkey": alephnet_pubkey}
         if node_url:
             data["node_url"] = node_url
-        return self._client._post("/agent-gateway/register", data)
+        return self._client._post(
+            "/agent-gateway/register", data, response_type=Dict[str, Any]
+        )
     
     def claim_task(self, task_id: str) -> ApiResponse[Dict[str, str]]:
         """Claim a task using Ed25519 authentication"""
@@ -279,6 +756,7 @@ class GatewayResource:
             "/agent-gateway/claim-task",
             {"task_id": task_id},
             use_ed25519=True,
+            response_type=Dict[str, Any],
         )
     
     def submit_result(
@@ -288,8 +766,9 @@ class GatewayResource:
         summary: str,
         evidence_ids: Optional[List[str]] = None,
         new_claim_ids: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> ApiResponse[Dict[str, str]]:
-        """Submit task result using Ed25519 authentication"""
+        """Submit task result using Ed25519 authentication; queued when the client has an outbox"""
         data = {
             "task_id": task_id,
             "success": success,
@@ -297,10 +776,14 @@ class GatewayResource:
             "evidence_ids": evidence_ids or [],
             "new_claim_ids": new_claim_ids or [],
         }
+        if self._client.outbox is not None:
+            return self._client._enqueue("/agent-gateway/submit-result", data, idempotency_key)
         return self._client._post(
             "/agent-gateway/submit-result",
             data,
             use_ed25519=True,
+            response_type=Dict[str, Any],
+            idempotency_key=idempotency_key,
         )
     
     def create_claim(
@@ -310,8 +793,9 @@ class GatewayResource:
         confidence: float = 0.5,
         domain: str = "general",
         tags: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> ApiResponse[Dict[str, str]]:
-        """Create a claim using Ed25519 authentication"""
+        """Create a claim using Ed25519 authentication; queued when the client has an outbox"""
         data = {
             "title": title,
             "statement": statement,
@@ -319,10 +803,14 @@ class GatewayResource:
             "domain": domain,
             "tags": tags or [],
         }
+        if self._client.outbox is not None:
+            return self._client._enqueue("/agent-gateway/create-claim", data, idempotency_key)
         return self._client._post(
             "/agent-gateway/create-claim",
             data,
             use_ed25519=True,
+            response_type=Dict[str, Any],
+            idempotency_key=idempotency_key,
         )
     
     def create_edge(
@@ -332,8 +820,9 @@ class GatewayResource:
         edge_type: str,
         justification: Optional[str] = None,
         weight: float = 0.5,
+        idempotency_key: Optional[str] = None,
     ) -> ApiResponse[Dict[str, str]]:
-        """Create an edge using Ed25519 authentication"""
+        """Create an edge using Ed25519 authentication; queued when the client has an outbox"""
         data = {
             "from_claim_id": from_claim_id,
             "to_claim_id": to_claim_id,
@@ -341,10 +830,14 @@ class GatewayResource:
             "justification": justification,
             "weight": weight,
         }
+        if self._client.outbox is not None:
+            return self._client._enqueue("/agent-gateway/create-edge", data, idempotency_key)
         return self._client._post(
             "/agent-gateway/create-edge",
             data,
             use_ed25519=True,
+            response_type=Dict[str, Any],
+            idempotency_key=idempotency_key,
         )
 
 
@@ -359,6 +852,37 @@ class CoherenceClient(BaseClient):
         )
         
         claims = client.claims.list(status="active")
+    
+    Responses are plain dicts by default. Pass ``decode="validate"`` to parse
+    response bytes straight into the pydantic models (``ApiResponse[List[Claim]]``
+    and so on), or ``decode="trusted"`` to build the models with
+    ``model_construct`` and skip validation on high-volume reads.
+    ``decode="compact"`` returns slotted ``CompactRecord``s instead, for
+    result sets too large to hold as models.
+    
+    Connections are pooled according to ``pool`` (a ``PoolConfig``). Clients for
+    several agents can share one pool: build them with ``with_credentials`` or
+    pass the same ``http_client``, which the client then never closes.
+    
+    Responses are accepted gzipped, large list pages are decoded while they
+    download, and large POST bodies are gzipped after signing; tune or turn
+    these off with ``compression`` (a ``CompressionConfig``). Coalesced
+    callers of a streamed page share its decoded envelope.
+    
+    Failed requests are retried according to ``retry`` (a ``RetryPolicy``):
+    GETs on 429/5xx and network errors, POSTs only when that is known to be safe.
+    Set ``RetryPolicy(hedge=True)`` to hedge slow GETs.
+    
+    Pass a shared ``AdaptiveRateLimiter`` and ``CircuitBreaker`` to pace
+    requests per endpoint family and fail fast while the server is down.
+    
+    Identical GETs issued concurrently share one request unless
+    ``coalesce=False``. With ``batch_window`` set, ``claims.get`` and
+    ``agents.get`` calls arriving within the window become one list query.
+    
+    With an ``outbox``, signed gateway mutations (``submit_result``,
+    ``create_claim``, ``create_edge``) are written to a local log and sent
+    in the background; see ``Outbox``.
     """
     
     def __init__(
@@ -368,10 +892,46 @@ class CoherenceClient(BaseClient):
         access_token: Optional[str] = None,
         auth: Optional[Ed25519Auth] = None,
         timeout: float = 30.0,
+        decode: str = DECODE_RAW,
+        cache: Optional[ResponseCache] = None,
+        pool: Optional[PoolConfig] = None,
+        http_client: Optional[httpx.Client] = None,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        coalesce: bool = True,
+        batch_window: Optional[float] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        instrument: Optional["Instrumentation"] = None,
+        outbox: Optional["Outbox"] = None,
+        compression: Optional[CompressionConfig] = None,
     ):
-        super().__init__(base_url, anon_key, access_token, auth, timeout)
+        super().__init__(
+            base_url,
+            anon_key,
+            access_token,
+            auth,
+            timeout,
+            decode,
+            cache,
+            pool,
+            retry,
+            limiter,
+            breaker,
+            coalesce,
+            batch_window,
+            batch_size,
+            instrument,
+            outbox,
+            compression,
+        )
         
-        self._http = httpx.Client(timeout=timeout)
+        if http_client is None:
+            self._http = self.pool.sync_client(timeout)
+        else:
+            self._http = http_client
+            self._owns_http = False
+        self._flight = SingleFlight() if coalesce else None
         
         # Initialize resources
         self.claims = ClaimsResource(self)
@@ -381,35 +941,175 @@ class CoherenceClient(BaseClient):
         self.feed = FeedResource(self)
         self.stats = StatsResource(self)
         self.gateway = GatewayResource(self)
+        if outbox is not None:
+            outbox.attach(self)
     
     def _get(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
+        response_type: Any = Any,
+        decode: Optional[str] = None,
     ) -> ApiResponse:
-        url = f"{self.base_url}{endpoint}"
-        if params:
-            url = f"{url}?{urlencode(params)}"
+        path = f"{endpoint}?{urlencode(params)}" if params else endpoint
+        decode = decode or self.decode
+        with self._trace("GET", endpoint) as trace:
+            cached = self._cache_lookup(path)
+            if cached is not None and cached.is_fresh():
+                trace.mark_cached()
+                content = cached.content
+            else:
+                page = self._page_stream(response_type, decode, path)
+                key = path if page is None else (path, decode)
+                if self._flight is None:
+                    content = self._fetch(endpoint, path, cached, trace, page)
+                else:
+                    content = self._flight.do(
+                        key, lambda: self._fetch(endpoint, path, cached, trace, page)
+                    )
+            if not isinstance(content, bytes):
+                return content  # decoded while it streamed in
+            with trace.phase(DECODE):
+                return decode_response(content, response_type, decode)
+    
+    def _fetch(
+        self,
+        endpoint: str,
+        path: str,
+        cached: Optional[CacheEntry],
+        trace: "RequestTrace" = NULL_TRACE,
+        page: Optional[PageStream] = None,
+    ) -> Union[bytes, Envelope]:
+        """
+        Body for a GET that missed the cache, revalidating a stale entry.
         
-        response = self._http.get(url, headers=self._get_headers())
-        return response.json()
+        With ``page``, a large list page is decoded as it arrives and the
+        decoded envelope is returned instead of the body.
+        """
+        headers = self._get_headers()
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        response = self._send_get(endpoint, path, headers, trace, page)
+        if response.status_code == 304 and cached is not None:
+            trace.mark_cached()
+        return self._streamed(path, response, cached, page)
+    
+    def _send_get(
+        self,
+        endpoint: str,
+        path: str,
+        headers: Dict[str, str],
+        trace: "RequestTrace" = NULL_TRACE,
+        page: Optional[PageStream] = None,
+    ) -> httpx.Response:
+        """GET ``path`` through the limiter, breaker and retrier, bypassing the cache"""
+        url = f"{self.base_url}{path}"
+        
+        def attempt() -> httpx.Response:
+            extensions = trace.extensions()
+            if page is None:
+                return trace.observe(self._http.get(url, headers=headers, extensions=extensions))
+            request = self._http.build_request("GET", url, headers=headers, extensions=extensions)
+            return trace.observe(page.read(self._http.send(request, stream=True)))
+        
+        return self._retrier.send(
+            route_key(endpoint),
+            self._guard(endpoint, attempt),
+            idempotent=True,
+            hedge=True,
+        )
     
     def _post(
         self,
         endpoint: str,
         data: Dict[str, Any],
         use_ed25519: bool = False,
+        response_type: Any = Any,
+        idempotency_key: Optional[str] = None,
     ) -> ApiResponse:
+        with self._trace("POST", endpoint) as trace:
+            with trace.phase(ENCODE):
+                body = encode_json(data)
+            with trace.phase(SIGN):
+                headers = self._post_headers(body, use_ed25519, idempotency_key)
+            response = self._send_post(endpoint, body, headers, False, trace)
+            with trace.phase(DECODE):
+                return decode_response(response.content, response_type, self.decode)
+    
+    def _send_post(
+        self,
+        endpoint: str,
+        body: bytes,
+        headers: Dict[str, str],
+        idempotent: bool,
+        trace: "RequestTrace" = NULL_TRACE,
+    ) -> httpx.Response:
+        """POST an encoded (and signed) body through the limiter, breaker and retrier"""
         url = f"{self.base_url}{endpoint}"
-        body = json.dumps(data)
-        headers = self._get_headers(body, use_ed25519)
+        body, headers = self._compress(body, headers, trace)
+        
+        def attempt() -> httpx.Response:
+            extensions = trace.extensions()
+            return trace.observe(
+                self._http.post(url, content=body, headers=headers, extensions=extensions)
+            )
+        
+        response = self._retrier.send(
+            route_key(endpoint),
+            self._guard(endpoint, attempt),
+            idempotent=idempotent,
+        )
+        self._cache_invalidate(endpoint)
+        return response
+    
+    def with_credentials(
+        self,
+        access_token: Optional[str] = None,
+        auth: Optional[Ed25519Auth] = None,
+        outbox: Optional["Outbox"] = None,
+    ) -> "CoherenceClient":
+        """
+        Client for another agent that shares this client's connection pool and cache.
+        
+        An outbox signs with the one client it is attached to, so this
+        client's outbox is not shared: the new client sends gateway
+        mutations directly unless it is given its own ``outbox``.
         
-        response = self._http.post(url, content=body, headers=headers)
-        return response.json()
+        Args:
+            access_token: The other agent's access token
+            auth: The other agent's Ed25519 key
+            outbox: Outbox for the other agent's gateway mutations
+        """
+        client = CoherenceClient(
+            self.base_url,
+            self.anon_key,
+            access_token=access_token,
+            auth=auth,
+            timeout=self.timeout,
+            decode=self.decode,
+            cache=self.cache,
+            pool=self.pool,
+            http_client=self._http,
+            retry=self.retry,
+            limiter=self.limiter,
+            breaker=self.breaker,
+            coalesce=self.coalesce,
+            batch_window=self.batch_window,
+            batch_size=self.batch_size,
+            instrument=self.instrument,
+            outbox=outbox,
+            compression=self.compression,
+        )
+        client._retrier = self._retrier
+        return client
     
     def close(self):
-        """Close the HTTP client"""
-        self._http.close()
+        """Stop the outbox flusher, then close the HTTP client unless it was passed in or shared"""
+        if self.outbox is not None:
+            self.outbox.close()
+        if self._owns_http:
+            self._retrier.close()
+            self._http.close()
     
     def __enter__(self):
         return self
@@ -418,6 +1118,553 @@ class CoherenceClient(BaseClient):
         self.close()
 
 
+class AsyncClaimsResource:
+    """Claims API resource (async)"""
+    
+    def __init__(self, client: "AsyncCoherenceClient"):
+        self._client = client
+        self._batcher = (
+            AsyncBatcher(self._get_many, client.batch_window, client.batch_size)
+            if client.batch_window
+            else None
+        )
+    
+    async def list(
+        self,
+        status: Optional[str] = None,
+        domain: Optional[str] = None,
+        author_id: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> ApiResponse[List[Claim]]:
+        """List claims with optional filters"""
+        params = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        if domain:
+            params["domain"] = domain
+        if author_id:
+            params["author_id"] = author_id
+        
+        return await self._client._get("/api-claims", params, List[Claim])
+    
+    async def aiter_all(
+        self,
+        status: Optional[str] = None,
+        domain: Optional[str] = None,
+        author_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Claim]:
+        """Iterate over every matching claim, fetching pages lazily"""
+        async for claim in aiter_items(
+            lambda limit, offset: self.list(status, domain, author_id, limit, offset),
+            page_size,
+            prefetch,
+        ):
+            yield claim
+    
+    async def export_columns(
+        self,
+        path: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        status: Optional[str] = None,
+        domain: Optional[str] = None,
+        author_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        batch_rows: Optional[int] = None,
+    ) -> Union["ColumnarTable", int]:
+        """Export every matching claim into typed columns, or to Parquet if ``path`` is set"""
+        from .export import DEFAULT_BATCH_ROWS, aexport_records
+        
+        return await aexport_records(
+            self.aiter_all(status, domain, author_id, page_size=page_size, prefetch=True),
+            "claim",
+            path,
+            columns,
+            batch_rows or DEFAULT_BATCH_ROWS,
+        )
+    
+    async def get(self, claim_id: str) -> ApiResponse[Claim]:
+        """Get a claim by ID (batched with concurrent calls if ``batch_window`` is set)"""
+        if self._batcher is not None:
+            return await self._batcher.load(claim_id)
+        return await self._client._get(f"/api-claims/{claim_id}", response_type=Claim)
+    
+    async def _get_many(self, claim_ids: List[str]) -> Dict[str, Any]:
+        """One list query for several IDs, split into per-ID responses"""
+        params = {"ids": ",".join(claim_ids), "limit": len(claim_ids)}
+        response = await self._client._get("/api-claims", params, decode=DECODE_RAW)
+        return split_envelope(response, claim_ids, "claim", Claim, self._client.decode)
+    
+    async def create(
+        self,
+        title: str,
+        statement: str,
+        confidence: float = 0.5,
+        assumptions: Optional[List[str]] = None,
+        scope_domain: str = "general",
+        tags: Optional[List[str]] = None,
+    ) -> ApiResponse[Claim]:
+        """Create a new claim"""
+        data = CreateClaimRequest(
+            title=title,
+            statement=statement,
+            confidence=confidence,
+            assumptions=assumptions or [],
+            scope_domain=scope_domain,
+            tags=tags or [],
+        )
+        return await self._client._post("/api-claims", data.model_dump(), response_type=Claim)
+    
+    async def create_many(
+        self,
+        claims: Iterable[Union[CreateClaimRequest, Dict[str, Any]]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> BatchResult:
+        """
+        Create many claims with pipelined, concurrent uploads.
+        
+        Args:
+            claims: CreateClaimRequest models or dicts with the same fields
+            concurrency: Number of uploads in flight
+            chunk_size: Number of claims validated at a time
+        
+        Returns:
+            BatchResult with one response per input and a failure report
+        """
+        return await arun_batch(
+            lambda request: self._client._post(
+                "/api-claims", request.model_dump(), response_type=Claim
+            ),
+            CreateClaimRequest,
+            claims,
+            concurrency,
+            chunk_size,
+        )
+    
+    async def get_edges(self, claim_id: str) -> ApiResponse[List[Edge]]:
+        """Get edges connected to a claim"""
+        return await self._client._get(f"/api-claims/{claim_id}/edges", response_type=List[Edge])
+    
+    async def create_edge(
+        self,
+        from_claim_id: str,
+        to_claim_id: str,
+        edge_type: str,
+        justification: Optional[str] = None,
+        weight: float = 0.5,
+    ) -> ApiResponse[Edge]:
+        """Create an edge between claims"""
+        data = CreateEdgeRequest(
+            from_claim_id=from_claim_id,
+            to_claim_id=to_claim_id,
+            type=edge_type,
+            justification=justification,
+            weight=weight,
+        )
+        return await self._client._post(
+            "/api-claims/edges", data.model_dump(), response_type=Edge
+        )
+    
+    async def create_edges_many(
+        self,
+        edges: Iterable[Union[CreateEdgeRequest, Dict[str, Any]]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> BatchResult:
+        """
+        Create many edges with pipelined, concurrent uploads.
+        
+        Args:
+            edges: CreateEdgeRequest models or dicts with the same fields
+            concurrency: Number of uploads in flight
+            chunk_size: Number of edges validated at a time
+        
+        Returns:
+            BatchResult with one response per input and a failure report
+        """
+        return await arun_batch(
+            lambda request: self._client._post(
+                "/api-claims/edges", request.model_dump(), response_type=Edge
+            ),
+            CreateEdgeRequest,
+            edges,
+            concurrency,
+            chunk_size,
+        )
+
+
+class AsyncTasksResource:
+    """Tasks API resource (async)"""
+    
+    def __init__(self, client: "AsyncCoherenceClient"):
+        self._client = client
+    
+    async def list(
+        self,
+        status: Optional[str] = None,
+        task_type: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> ApiResponse[List[Task]]:
+        """List tasks with optional filters"""
+        params = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        if task_type:
+            params["type"] = task_type
+        
+        return await self._client._get("/api-tasks", params, List[Task])
+    
+    async def aiter_all(
+        self,
+        status: Optional[str] = None,
+        task_type: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Task]:
+        """Iterate over every matching task, fetching pages lazily"""
+        async for task in aiter_items(
+            lambda limit, offset: self.list(status, task_type, limit, offset),
+            page_size,
+            prefetch,
+        ):
+            yield task
+    
+    async def export_columns(
+        self,
+        path: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        status: Optional[str] = None,
+        task_type: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        batch_rows: Optional[int] = None,
+    ) -> Union["ColumnarTable", int]:
+        """Export every matching task into typed columns, or to Parquet if ``path`` is set"""
+        from .export import DEFAULT_BATCH_ROWS, aexport_records
+        
+        return await aexport_records(
+            self.aiter_all(status, task_type, page_size=page_size, prefetch=True),
+            "task",
+            path,
+            columns,
+            batch_rows or DEFAULT_BATCH_ROWS,
+        )
+    
+    async def get(self, task_id: str) -> ApiResponse[Task]:
+        """Get a task by ID"""
+        return await self._client._get(f"/api-tasks/{task_id}", response_type=Task)
+    
+    async def claim(self, task_id: str) -> ApiResponse[Task]:
+        """Claim an open task"""
+        return await self._client._post(f"/api-tasks/{task_id}/claim", {}, response_type=Task)
+    
+    async def submit_result(
+        self,
+        task_id: str,
+        success: bool,
+        summary: str,
+        evidence_ids: Optional[List[str]] = None,
+        new_claim_ids: Optional[List[str]] = None,
+    ) -> ApiResponse[Task]:
+        """Submit result for a task"""
+        data = SubmitResultRequest(
+            success=success,
+            summary=summary,
+            evidence_ids=evidence_ids or [],
+            new_claim_ids=new_claim_ids or [],
+        )
+        return await self._client._post(
+            f"/api-tasks/{task_id}/result", data.model_dump(), response_type=Task
+        )
+
+
+class AsyncAgentsResource:
+    """Agents API resource (async)"""
+    
+    def __init__(self, client: "AsyncCoherenceClient"):
+        self._client = client
+        self._batcher = (
+            AsyncBatcher(self._get_many, client.batch_window, client.batch_size)
+            if client.batch_window
+            else None
+        )
+    
+    async def list(
+        self,
+        domain: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> ApiResponse[List[Agent]]:
+        """List all agents"""
+        params = {"limit": limit, "offset": offset}
+        if domain:
+            params["domain"] = domain
+        return await self._client._get("/api-agents", params, List[Agent])
+    
+    async def aiter_all(
+        self,
+        domain: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Agent]:
+        """Iterate over every agent, fetching pages lazily"""
+        async for agent in aiter_items(
+            lambda limit, offset: self.list(domain, limit, offset),
+            page_size,
+            prefetch,
+        ):
+            yield agent
+    
+    async def export_columns(
+        self,
+        path: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        domain: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        batch_rows: Optional[int] = None,
+    ) -> Union["ColumnarTable", int]:
+        """Export every matching agent into typed columns, or to Parquet if ``path`` is set"""
+        from .export import DEFAULT_BATCH_ROWS, aexport_records
+        
+        return await aexport_records(
+            self.aiter_all(domain, page_size=page_size, prefetch=True),
+            "agent",
+            path,
+            columns,
+            batch_rows or DEFAULT_BATCH_ROWS,
+        )
+    
+    async def get(self, agent_id: str) -> ApiResponse[Agent]:
+        """Get an agent by ID (batched with concurrent calls if ``batch_window`` is set)"""
+        if self._batcher is not None:
+            return await self._batcher.load(agent_id)
+        return await self._client._get(f"/api-agents/{agent_id}", response_type=Agent)
+    
+    async def _get_many(self, agent_ids: List[str]) -> Dict[str, Any]:
+        """One list query for several IDs, split into per-ID responses"""
+        params = {"ids": ",".join(agent_ids), "limit": len(agent_ids)}
+        response = await self._client._get("/api-agents", params, decode=DECODE_RAW)
+        return split_envelope(response, agent_ids, "agent", Agent, self._client.decode)
+
+
+class AsyncRoomsResource:
+    """Rooms API resource (async)"""
+    
+    def __init__(self, client: "AsyncCoherenceClient"):
+        self._client = client
+    
+    async def list(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> ApiResponse[List[Room]]:
+        """List rooms"""
+        params = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        return await self._client._get("/api-rooms", params, List[Room])
+    
+    async def aiter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Room]:
+        """Iterate over every matching room, fetching pages lazily"""
+        async for room in aiter_items(
+            lambda limit, offset: self.list(status, limit, offset),
+            page_size,
+            prefetch,
+        ):
+            yield room
+    
+    async def get(self, room_id: str) -> ApiResponse[Room]:
+        """Get a room by ID"""
+        return await self._client._get(f"/api-rooms/{room_id}", response_type=Room)
+    
+    async def create(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        topic_tags: Optional[List[str]] = None,
+    ) -> ApiResponse[Room]:
+        """Create a new room"""
+        data = CreateRoomRequest(
+            title=title,
+            description=description,
+            topic_tags=topic_tags or [],
+        )
+        return await self._client._post("/api-rooms", data.model_dump(), response_type=Room)
+
+
+class AsyncFeedResource:
+    """Feed API resource (async)"""
+    
+    def __init__(self, client: "AsyncCoherenceClient"):
+        self._client = client
+    
+    async def discovery(self, limit: int = 20) -> ApiResponse[FeedPage]:
+        """Get discovery feed"""
+        return await self._client._get(
+            "/api-feed/discovery", {"limit": limit}, FeedPage
+        )
+    
+    async def coherence_work(self, limit: int = 20) -> ApiResponse[FeedPage]:
+        """Get coherence work feed"""
+        return await self._client._get(
+            "/api-feed/coherence-work", {"limit": limit}, FeedPage
+        )
+
+
+class AsyncStatsResource:
+    """Stats API resource (async)"""
+    
+    def __init__(self, client: "AsyncCoherenceClient"):
+        self._client = client
+    
+    async def get(self) -> ApiResponse[NetworkStats]:
+        """Get network statistics"""
+        return await self._client._get("/api-stats", response_type=NetworkStats)
+
+
+class AsyncGatewayResource:
+    """Agent Gateway API resource for Alephnet mesh (async)"""
+    
+    def __init__(self, client: "AsyncCoherenceClient"):
+        self._client = client
+    
+    def subscribe(
+        self,
+        event_types: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        max_queue: int = 1000,
+        overflow: str = "block",
+    ) -> "Subscription":
+        """
+        Subscribe to realtime gateway events (task created/claimed/completed,
+        claim creation and status changes, edge creation) instead of polling.
+        
+        Args:
+            event_types: Only deliver these types, e.g. ``[TASK_CREATED]``
+            cursor: Resume after an earlier ``Event.cursor``
+            max_queue: Events buffered for a slow consumer
+            overflow: ``"block"`` (backpressure) or ``"drop_oldest"``
+        
+        Returns:
+            A ``Subscription``; use it with ``async with`` and ``async for``
+        """
+        from .realtime import Subscription
+        
+        return Subscription(self._client, event_types, cursor, max_queue, overflow)
+    
+    async def register(
+        self,
+        alephnet_pubkey: str,
+        node_url: Optional[str] = None,
+    ) -> ApiResponse[Dict[str, str]]:
+        """Register Alephnet identity"""
+        data = {"alephnet_pubkey": alephnet_pubkey}
+        if node_url:
+            data["node_url"] = node_url
+        return await self._client._post(
+            "/agent-gateway/register", data, response_type=Dict[str, Any]
+        )
+    
+    async def claim_task(self, task_id: str) -> ApiResponse[Dict[str, str]]:
+        """Claim a task using Ed25519 authentication"""
+        return await self._client._post(
+            "/agent-gateway/claim-task",
+            {"task_id": task_id},
+            use_ed25519=True,
+            response_type=Dict[str, Any],
+        )
+    
+    async def submit_result(
+        self,
+        task_id: str,
+        success: bool,
+        summary: str,
+        evidence_ids: Optional[List[str]] = None,
+        new_claim_ids: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> ApiResponse[Dict[str, str]]:
+        """Submit task result using Ed25519 authentication; queued when the client has an outbox"""
+        data = {
+            "task_id": task_id,
+            "success": success,
+            "summary": summary,
+            "evidence_ids": evidence_ids or [],
+            "new_claim_ids": new_claim_ids or [],
+        }
+        if self._client.outbox is not None:
+            return self._client._enqueue("/agent-gateway/submit-result", data, idempotency_key)
+        return await self._client._post(
+            "/agent-gateway/submit-result",
+            data,
+            use_ed25519=True,
+            response_type=Dict[str, Any],
+            idempotency_key=idempotency_key,
+        )
+    
+    async def create_claim(
+        self,
+        title: str,
+        statement: str,
+        confidence: float = 0.5,
+        domain: str = "general",
+        tags: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> ApiResponse[Dict[str, str]]:
+        """Create a claim using Ed25519 authentication; queued when the client has an outbox"""
+        data = {
+            "title": title,
+            "statement": statement,
+            "confidence": confidence,
+            "domain": domain,
+            "tags": tags or [],
+        }
+        if self._client.outbox is not None:
+            return self._client._enqueue("/agent-gateway/create-claim", data, idempotency_key)
+        return await self._client._post(
+            "/agent-gateway/create-claim",
+            data,
+            use_ed25519=True,
+            response_type=Dict[str, Any],
+            idempotency_key=idempotency_key,
+        )
+    
+    async def create_edge(
+        self,
+        from_claim_id: str,
+        to_claim_id: str,
+        edge_type: str,
+        justification: Optional[str] = None,
+        weight: float = 0.5,
+        idempotency_key: Optional[str] = None,
+    ) -> ApiResponse[Dict[str, str]]:
+        """Create an edge using Ed25519 authentication; queued when the client has an outbox"""
+        data = {
+            "from_claim_id": from_claim_id,
+            "to_claim_id": to_claim_id,
+            "type": edge_type,
+            "justification": justification,
+            "weight": weight,
+        }
+        if self._client.outbox is not None:
+            return self._client._enqueue("/agent-gateway/create-edge", data, idempotency_key)
+        return await self._client._post(
+            "/agent-gateway/create-edge",
+            data,
+            use_ed25519=True,
+            response_type=Dict[str, Any],
+            idempotency_key=idempotency_key,
+        )
+
+
 class AsyncCoherenceClient(BaseClient):
     """
     Asynchronous Coherence Network API client.
@@ -425,6 +1672,15 @@ class AsyncCoherenceClient(BaseClient):
     Usage:
         async with AsyncCoherenceClient(...) as client:
             claims = await client.claims.list()
+            
+            # Fan out many calls with at most max_concurrency in flight
+            results = await client.gather(
+                client.claims.get(claim_id) for claim_id in claim_ids
+            )
+    
+    Pool settings and sharing work as in ``CoherenceClient`` (``pool``,
+    ``http_client``, ``with_credentials``), and so do ``coalesce``,
+    ``batch_window``, ``outbox`` and ``compression``.
     """
     
     def __init__(
@@ -434,42 +1690,252 @@ class AsyncCoherenceClient(BaseClient):
         access_token: Optional[str] = None,
         auth: Optional[Ed25519Auth] = None,
         timeout: float = 30.0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        decode: str = DECODE_RAW,
+        cache: Optional[ResponseCache] = None,
+        pool: Optional[PoolConfig] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        coalesce: bool = True,
+        batch_window: Optional[float] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        instrument: Optional["Instrumentation"] = None,
+        outbox: Optional["Outbox"] = None,
+        compression: Optional[CompressionConfig] = None,
     ):
-        super().__init__(base_url, anon_key, access_token, auth, timeout)
+        super().__init__(
+            base_url,
+            anon_key,
+            access_token,
+            auth,
+            timeout,
+            decode,
+            cache,
+            pool,
+            retry,
+            limiter,
+            breaker,
+            coalesce,
+            batch_window,
+            batch_size,
+            instrument,
+            outbox,
+            compression,
+        )
         
-        self._http = httpx.AsyncClient(timeout=timeout)
+        if http_client is None:
+            self._http = self.pool.async_client(timeout)
+        else:
+            self._http = http_client
+            self._owns_http = False
+        self._flight = AsyncSingleFlight() if coalesce else None
+        self.max_concurrency = max_concurrency
         
-        # Note: Async resources would need separate implementation
-        # For simplicity, this shows the pattern
+        # Initialize resources
+        self.claims = AsyncClaimsResource(self)
+        self.tasks = AsyncTasksResource(self)
+        self.agents = AsyncAgentsResource(self)
+        self.rooms = AsyncRoomsResource(self)
+        self.feed = AsyncFeedResource(self)
+        self.stats = AsyncStatsResource(self)
+        self.gateway = AsyncGatewayResource(self)
+        if outbox is not None:
+            outbox.attach(self)
+    
+    async def gather(
+        self,
+        aws: Iterable[Awaitable[Any]],
+        limit: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run many API calls concurrently, bounded by a semaphore.
+        
+        Args:
+            aws: Awaitables to run, e.g. ``client.claims.get(id)`` coroutines
+            limit: Maximum calls in flight (defaults to ``max_concurrency``)
+            return_exceptions: Return exceptions as results instead of raising
+        
+        Returns:
+            List of results in input order
+        """
+        if limit is None:
+            limit = self.max_concurrency
+        elif limit < 1:
+            raise ValueError("limit must be at least 1")
+        return await gather_bounded(aws, limit=limit, return_exceptions=return_exceptions)
     
     async def _get(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
+        response_type: Any = Any,
+        decode: Optional[str] = None,
     ) -> ApiResponse:
-        url = f"{self.base_url}{endpoint}"
-        if params:
-            url = f"{url}?{urlencode(params)}"
+        path = f"{endpoint}?{urlencode(params)}" if params else endpoint
+        decode = decode or self.decode
+        with self._trace("GET", endpoint) as trace:
+            cached = self._cache_lookup(path)
+            if cached is not None and cached.is_fresh():
+                trace.mark_cached()
+                content = cached.content
+            else:
+                page = self._page_stream(response_type, decode, path)
+                key = path if page is None else (path, decode)
+                if self._flight is None:
+                    content = await self._fetch(endpoint, path, cached, trace, page)
+                else:
+                    content = await self._flight.do(
+                        key, lambda: self._fetch(endpoint, path, cached, trace, page)
+                    )
+            if not isinstance(content, bytes):
+                return content  # decoded while it streamed in
+            with trace.phase(DECODE):
+                return decode_response(content, response_type, decode)
+    
+    async def _fetch(
+        self,
+        endpoint: str,
+        path: str,
+        cached: Optional[CacheEntry],
+        trace: "RequestTrace" = NULL_TRACE,
+        page: Optional[PageStream] = None,
+    ) -> Union[bytes, Envelope]:
+        """
+        Body for a GET that missed the cache, revalidating a stale entry.
+        
+        With ``page``, a large list page is decoded as it arrives and the
+        decoded envelope is returned instead of the body.
+        """
+        headers = self._get_headers()
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        response = await self._send_get(endpoint, path, headers, trace, page)
+        if response.status_code == 304 and cached is not None:
+            trace.mark_cached()
+        return self._streamed(path, response, cached, page)
+    
+    async def _send_get(
+        self,
+        endpoint: str,
+        path: str,
+        headers: Dict[str, str],
+        trace: "RequestTrace" = NULL_TRACE,
+        page: Optional[PageStream] = None,
+    ) -> httpx.Response:
+        """GET ``path`` through the limiter, breaker and retrier, bypassing the cache"""
+        url = f"{self.base_url}{path}"
+        
+        async def attempt() -> httpx.Response:
+            extensions = trace.async_extensions()
+            if page is None:
+                return trace.observe(
+                    await self._http.get(url, headers=headers, extensions=extensions)
+                )
+            request = self._http.build_request("GET", url, headers=headers, extensions=extensions)
+            return trace.observe(await page.aread(await self._http.send(request, stream=True)))
         
-        response = await self._http.get(url, headers=self._get_headers())
-        return response.json()
+        return await self._retrier.asend(
+            route_key(endpoint),
+            self._aguard(endpoint, attempt),
+            idempotent=True,
+            hedge=True,
+        )
     
     async def _post(
         self,
         endpoint: str,
         data: Dict[str, Any],
         use_ed25519: bool = False,
+        response_type: Any = Any,
+        idempotency_key: Optional[str] = None,
     ) -> ApiResponse:
+        with self._trace("POST", endpoint) as trace:
+            with trace.phase(ENCODE):
+                body = encode_json(data)
+            with trace.phase(SIGN):
+                headers = self._post_headers(body, use_ed25519, idempotency_key)
+            response = await self._send_post(endpoint, body, headers, False, trace)
+            with trace.phase(DECODE):
+                return decode_response(response.content, response_type, self.decode)
+    
+    async def _send_post(
+        self,
+        endpoint: str,
+        body: bytes,
+        headers: Dict[str, str],
+        idempotent: bool,
+        trace: "RequestTrace" = NULL_TRACE,
+    ) -> httpx.Response:
+        """POST an encoded (and signed) body through the limiter, breaker and retrier"""
         url = f"{self.base_url}{endpoint}"
-        body = json.dumps(data)
-        headers = self._get_headers(body, use_ed25519)
+        body, headers = self._compress(body, headers, trace)
+        
+        async def attempt() -> httpx.Response:
+            extensions = trace.async_extensions()
+            return trace.observe(
+                await self._http.post(url, content=body, headers=headers, extensions=extensions)
+            )
+        
+        response = await self._retrier.asend(
+            route_key(endpoint),
+            self._aguard(endpoint, attempt),
+            idempotent=idempotent,
+        )
+        self._cache_invalidate(endpoint)
+        return response
+    
+    def with_credentials(
+        self,
+        access_token: Optional[str] = None,
+        auth: Optional[Ed25519Auth] = None,
+        outbox: Optional["Outbox"] = None,
+    ) -> "AsyncCoherenceClient":
+        """
+        Client for another agent that shares this client's connection pool and cache.
+        
+        An outbox signs with the one client it is attached to, so this
+        client's outbox is not shared: the new client sends gateway
+        mutations directly unless it is given its own ``outbox``.
         
-        response = await self._http.post(url, content=body, headers=headers)
-        return response.json()
+        Args:
+            access_token: The other agent's access token
+            auth: The other agent's Ed25519 key
+            outbox: Outbox for the other agent's gateway mutations
+        """
+        client = AsyncCoherenceClient(
+            self.base_url,
+            self.anon_key,
+            access_token=access_token,
+            auth=auth,
+            timeout=self.timeout,
+            max_concurrency=self.max_concurrency,
+            decode=self.decode,
+            cache=self.cache,
+            pool=self.pool,
+            http_client=self._http,
+            retry=self.retry,
+            limiter=self.limiter,
+            breaker=self.breaker,
+            coalesce=self.coalesce,
+            batch_window=self.batch_window,
+            batch_size=self.batch_size,
+            instrument=self.instrument,
+            outbox=outbox,
+            compression=self.compression,
+        )
+        client._retrier = self._retrier
+        return client
     
     async def close(self):
-        """Close the HTTP client"""
-        await self._http.aclose()
+        """Stop the outbox flusher, then close the HTTP client unless it was passed in or shared"""
+        if self.outbox is not None:
+            await self.outbox.aclose()
+        if self._owns_http:
+            self._retrier.close()
+            await self._http.aclose()
     
     async def __aenter__(self):
         return self
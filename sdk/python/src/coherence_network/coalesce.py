@@ -0,0 +1,260 @@
+"""
+Single-flight deduplication and micro-batching for concurrent reads
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Set
+
+from .decoding import (
+    DECODE_COMPACT,
+    DECODE_RAW,
+    DECODE_VALIDATE,
+    construct_response,
+    record_id,
+    response_adapter,
+)
+from .exceptions import ApiError
+
+DEFAULT_BATCH_SIZE = 100
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between threads asking for the same key.
+    
+    The first caller runs ``fn``; callers arriving while it runs block on
+    the same future and get the same result or exception. Nothing is kept
+    once the call finishes, so this is deduplication, not caching.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+        self.shared = 0
+    
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+        
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Share one in-flight coroutine between tasks asking for the same key.
+    
+    The call runs as its own task and every caller awaits it through
+    ``asyncio.shield``. A caller that is cancelled therefore does not cancel
+    the request for the others.
+    """
+    
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.shared = 0
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+
+def split_envelope(
+    response: Dict[str, Any],
+    ids: Sequence[str],
+    kind: str,
+    data_type: Any,
+    mode: str = DECODE_RAW,
+) -> Dict[str, Any]:
+    """
+    Split a raw list response into one single-record envelope per requested ID.
+    
+    Records are decoded per ``mode`` one at a time, so a record that fails
+    validation only fails its own caller (its entry is the exception). IDs
+    missing from the list get an unsuccessful envelope, as a lone ``get``
+    for an unknown ID would.
+    
+    Args:
+        response: List envelope decoded as plain JSON
+        ids: Requested IDs
+        kind: Record kind used to read IDs (``"claim"``, ``"agent"``)
+        data_type: Model of one record, e.g. ``Claim``
+        mode: The client's decode mode
+    """
+    records = {}
+    if response.get("success") and isinstance(response.get("data"), list):
+        records = {record_id(record, kind): record for record in response["data"]}
+    error = response.get("error") if not response.get("success") else None
+    meta = response.get("meta")
+    
+    def wrap(record: Optional[Dict[str, Any]]) -> Any:
+        envelope = {
+            "success": record is not None,
+            "data": record,
+            "error": None if record is not None else error or f"{kind.capitalize()} not found",
+            "meta": meta,
+        }
+        if mode == DECODE_RAW:
+            return envelope
+        try:
+            if mode == DECODE_VALIDATE:
+                return response_adapter(data_type).validate_python(envelope)
+            return construct_response(envelope, data_type, mode == DECODE_COMPACT)
+        except ValueError as exc:
+            return exc
+    
+    return {item_id: wrap(records.get(item_id)) for item_id in ids}
+
+
+def _settle(future: Any, results: Dict[str, Any], key: str) -> None:
+    """Resolve one caller's future from its entry; an ID ``fetch_many`` left out is not found"""
+    result = results.get(key)
+    if result is None:
+        result = ApiError(f"{key} not found", status_code=404)
+    if isinstance(result, BaseException):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.futures: Dict[str, Any] = {}
+        self.full = threading.Event()
+
+
+class Batcher:
+    """
+    Fold ``get(id)`` calls from many threads into one ``fetch_many(ids)``.
+    
+    The first caller opens a batch and waits up to ``window`` seconds (or
+    until ``max_size`` IDs have joined) before fetching them all at once.
+    Every caller then gets its own entry of the result; an entry that is an
+    exception is raised to that caller alone, and an ID missing from the
+    result raises a 404 ``ApiError``.
+    """
+    
+    def __init__(
+        self,
+        fetch_many: Callable[[List[str]], Dict[str, Any]],
+        window: float,
+        max_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self._fetch_many = fetch_many
+        self.window = window
+        self.max_size = max_size
+        self.batches = 0
+        self._lock = threading.Lock()
+        self._open: Optional[_Batch] = None
+    
+    def load(self, key: str) -> Any:
+        with self._lock:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = self._open = _Batch()
+            future = batch.futures.get(key)
+            if future is None:
+                future = batch.futures[key] = Future()
+            if len(batch.futures) >= self.max_size:
+                self._open = None
+                batch.full.set()
+        
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._open is batch:
+                    self._open = None
+            self._run(batch)
+        return future.result()
+    
+    def _run(self, batch: _Batch) -> None:
+        self.batches += 1
+        try:
+            results = self._fetch_many(list(batch.futures))
+        except BaseException as exc:
+            for future in batch.futures.values():
+                future.set_exception(exc)
+            return
+        for key, future in batch.futures.items():
+            _settle(future, results, key)
+
+
+class AsyncBatcher:
+    """
+    Fold concurrent ``await get(id)`` calls into one ``fetch_many(ids)``.
+    
+    The first call opens a batch that is flushed ``window`` seconds later,
+    or as soon as ``max_size`` IDs have joined.
+    """
+    
+    def __init__(
+        self,
+        fetch_many: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        window: float,
+        max_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self._fetch_many = fetch_many
+        self.window = window
+        self.max_size = max_size
+        self.batches = 0
+        self._open: Optional[Dict[str, "asyncio.Future[Any]"]] = None
+        self._running: Set["asyncio.Task[None]"] = set()
+    
+    async def load(self, key: str) -> Any:
+        loop = asyncio.get_running_loop()
+        batch = self._open
+        if batch is None:
+            batch = self._open = {}
+            loop.call_later(self.window, self._flush, batch)
+        future = batch.get(key)
+        if future is None:
+            future = batch[key] = loop.create_future()
+        if len(batch) >= self.max_size:
+            self._flush(batch)
+        return await asyncio.shield(future)
+    
+    def _flush(self, batch: Dict[str, "asyncio.Future[Any]"]) -> None:
+        if self._open is not batch:
+            return
+        self._open = None
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+    
+    async def _run(self, batch: Dict[str, "asyncio.Future[Any]"]) -> None:
+        self.batches += 1
+        try:
+            results = await self._fetch_many(list(batch))
+        except BaseException as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return
+        for key, future in batch.items():
+            if not future.done():
+                _settle(future, results, key)
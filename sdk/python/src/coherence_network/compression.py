@@ -0,0 +1,76 @@
+"""
+Transport compression: negotiated response encodings and gzip request bodies
+"""
+
+import gzip
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Optional, Tuple
+
+# POST bodies below this size are sent as-is: gzip saves little on a small
+# claim and the functions would spend more time inflating it
+DEFAULT_REQUEST_THRESHOLD = 8 * 1024
+
+# List pages at least this large on the wire (or of unknown length, as gzip
+# responses are) are decoded while they download
+DEFAULT_STREAM_THRESHOLD = 32 * 1024
+
+GZIP = "gzip"
+
+
+@lru_cache(maxsize=None)
+def supported_encodings() -> Tuple[str, ...]:
+    """
+    Response encodings ``httpx`` can decode here, best first.
+    
+    gzip and deflate are always available; ``br`` needs ``brotli`` (or
+    ``brotlicffi``) and ``zstd`` needs ``zstandard``, both installed by the
+    ``coherence-network[compression]`` extra.
+    """
+    encodings = []
+    if find_spec("zstandard") is not None:
+        encodings.append("zstd")
+    if find_spec("brotli") is not None or find_spec("brotlicffi") is not None:
+        encodings.append("br")
+    return (*encodings, GZIP, "deflate")
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    """
+    Compression of responses and request bodies.
+    
+    The edge functions gzip JSON responses over 1 KB for clients that ask
+    for it and inflate gzip request bodies, which pays off on the long
+    ``statement``, ``justification`` and ``result_summary`` text of list
+    pages and bulk writes.
+    
+    Attributes:
+        accept: Advertise ``supported_encodings()``; ``False`` asks for identity
+        request_threshold: Gzip POST bodies of at least this many bytes;
+            ``None`` never compresses them. Signatures always cover the
+            uncompressed body.
+        level: gzip level for request bodies, 1 (fastest) to 9 (smallest)
+        stream_threshold: Decode list pages record by record as they arrive
+            when at least this many bytes on the wire or of unknown length;
+            ``None`` reads every page whole before decoding it
+    """
+    
+    accept: bool = True
+    request_threshold: Optional[int] = DEFAULT_REQUEST_THRESHOLD
+    level: int = 6
+    stream_threshold: Optional[int] = DEFAULT_STREAM_THRESHOLD
+    
+    def accept_encoding(self) -> str:
+        """Value of the ``Accept-Encoding`` request header"""
+        return ", ".join(supported_encodings()) if self.accept else "identity"
+    
+    def compress(self, body: bytes) -> Tuple[bytes, Optional[str]]:
+        """``body`` gzipped if it reaches the threshold, and its ``Content-Encoding``"""
+        if self.request_threshold is None or len(body) < self.request_threshold:
+            return body, None
+        return gzip.compress(body, compresslevel=self.level, mtime=0), GZIP
+
+
+DEFAULT_COMPRESSION = CompressionConfig()
@@ -0,0 +1,47 @@
+"""
+Concurrency helpers for fanning out API calls
+"""
+
+import asyncio
+from typing import Any, Awaitable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 64
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[T]],
+    limit: int = DEFAULT_MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> List[Any]:
+    """
+    Run awaitables concurrently with at most ``limit`` in flight.
+    
+    Works like ``asyncio.gather`` and returns results in input order, but
+    never has more than ``limit`` awaitables running at once. Pass a shared
+    ``semaphore`` to bound several ``gather_bounded`` calls together.
+    
+    Args:
+        aws: Coroutines or futures to run
+        limit: Maximum number of awaitables in flight (ignored if semaphore is given)
+        return_exceptions: Return exceptions as results instead of raising the first one
+        semaphore: Optional semaphore shared with other callers
+    
+    Returns:
+        List of results in the same order as ``aws``
+    """
+    if semaphore is None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        semaphore = asyncio.Semaphore(limit)
+    
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(
+        *(run(aw) for aw in aws),
+        return_exceptions=return_exceptions,
+    )
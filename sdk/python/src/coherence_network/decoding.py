@@ -0,0 +1,216 @@
+"""
+Response decoding: raw dicts, validated models, trusted construction or compact records
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from .models import ApiMeta, ApiResponse
+from .records import MISSING, compact_builder, field_paths, lookup, nested_converter
+
+DECODE_RAW = "raw"
+DECODE_VALIDATE = "validate"
+DECODE_TRUSTED = "trusted"
+DECODE_COMPACT = "compact"
+DECODE_MODES = (DECODE_RAW, DECODE_VALIDATE, DECODE_TRUSTED, DECODE_COMPACT)
+
+Envelope = Union[Dict[str, Any], ApiResponse]
+
+
+@lru_cache(maxsize=None)
+def response_adapter(data_type: Any) -> TypeAdapter:
+    """Cached TypeAdapter for ``ApiResponse[data_type]``"""
+    return TypeAdapter(ApiResponse[data_type])
+
+
+@lru_cache(maxsize=None)
+def _model_builder(model: Type[BaseModel]) -> Callable[[Dict[str, Any]], BaseModel]:
+    """
+    Cached unvalidated constructor for ``model``.
+    
+    Equivalent to ``model.model_construct(**values)`` for plain models, but
+    field defaults are resolved once per class instead of once per instance,
+    which makes it several times faster on large pages. Like validation, it
+    reads fields from their aliases' key paths too (``claim_id``,
+    ``author.agent_id``) and builds nested models (``FeedPage.items``).
+    Models with private attributes or extra fields fall back to
+    ``model_construct``.
+    """
+    if model.__private_attributes__ or model.model_config.get("extra") == "allow":
+        return lambda values: model.model_construct(**values)
+    
+    fields = model.model_fields
+    aliased = field_paths(model)
+    plan = tuple(
+        (name, aliased.get(name), nested_converter(field.annotation, _model_builder))
+        for name, field in fields.items()
+    )
+    defaults = {
+        name: field.default
+        for name, field in fields.items()
+        if not field.is_required() and field.default_factory is None
+    }
+    factories = {
+        name: field.default_factory
+        for name, field in fields.items()
+        if field.default_factory is not None
+    }
+    new = model.__new__
+    set_attr = object.__setattr__
+    
+    def build(values: Dict[str, Any]) -> BaseModel:
+        data: Dict[str, Any] = {}
+        fields_set = set()
+        for name, paths, convert in plan:
+            value = values.get(name, MISSING) if paths is None else lookup(values, paths)
+            if value is not MISSING:
+                data[name] = value if convert is None or value is None else convert(value)
+                fields_set.add(name)
+            elif name in defaults:
+                data[name] = defaults[name]
+            elif name in factories:
+                data[name] = factories[name]()
+        instance = new(model)
+        set_attr(instance, "__dict__", data)
+        set_attr(instance, "__pydantic_fields_set__", fields_set)
+        set_attr(instance, "__pydantic_extra__", None)
+        set_attr(instance, "__pydantic_private__", None)
+        return instance
+    
+    return build
+
+
+def _construct(value: Any, data_type: Any, compact: bool = False) -> Any:
+    """Build models (or compact records) from already-parsed JSON without validating them"""
+    if value is None:
+        return None
+    builder = compact_builder if compact else _model_builder
+    if isinstance(data_type, type) and issubclass(data_type, BaseModel):
+        return builder(data_type)(value) if isinstance(value, dict) else value
+    if get_origin(data_type) in (list, List):
+        (item_type,) = get_args(data_type) or (Any,)
+        if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+            build = builder(item_type)
+            return [build(item) for item in value]
+    return value
+
+
+def construct_response(
+    payload: Dict[str, Any],
+    data_type: Any = Any,
+    compact: bool = False,
+) -> ApiResponse:
+    """
+    Wrap a parsed response envelope in models using ``model_construct``.
+    
+    No validation or type coercion happens: timestamps stay strings and
+    unknown fields are dropped. Only use this for trusted, high-volume reads.
+    With ``compact``, records become slotted ``CompactRecord``s instead of
+    models; the envelope itself is still an ``ApiResponse``.
+    """
+    return wrap_response(payload, data_type, _construct(payload.get("data"), data_type, compact))
+
+
+def wrap_response(payload: Dict[str, Any], data_type: Any, data: Any) -> ApiResponse:
+    """Unvalidated envelope of ``payload`` around already-decoded ``data``"""
+    meta = payload.get("meta")
+    return ApiResponse[data_type].model_construct(
+        success=payload.get("success", False),
+        data=data,
+        error=payload.get("error"),
+        meta=_model_builder(ApiMeta)(meta) if isinstance(meta, dict) else meta,
+    )
+
+
+def decode_response(content: bytes, data_type: Any = Any, mode: str = DECODE_RAW) -> Any:
+    """
+    Decode a response body according to the client's decode mode.
+    
+    Args:
+        content: Raw response bytes
+        data_type: Type of the envelope's ``data`` field, e.g. ``List[Claim]``
+        mode: ``"raw"`` for dicts, ``"validate"`` to parse straight from bytes
+            into validated models, ``"trusted"`` to construct models unvalidated,
+            ``"compact"`` for unvalidated slotted records
+    
+    Returns:
+        The decoded response envelope
+    """
+    if mode == DECODE_VALIDATE:
+        return response_adapter(data_type).validate_json(content)
+    payload = json.loads(content)
+    if mode in (DECODE_TRUSTED, DECODE_COMPACT) and isinstance(payload, dict):
+        return construct_response(payload, data_type, mode == DECODE_COMPACT)
+    return payload
+
+
+def decode_record(value: Dict[str, Any], model: Type[BaseModel], mode: str = DECODE_RAW) -> Any:
+    """Decode one already-parsed record the way ``decode_response`` decodes a page"""
+    decode = record_decoder(model, mode)
+    return value if decode is None else decode(value)
+
+
+def record_decoder(
+    model: Type[BaseModel],
+    mode: str = DECODE_RAW,
+) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Callable decoding one parsed ``model`` record per ``mode``; ``None`` for raw"""
+    if mode == DECODE_VALIDATE:
+        return model.model_validate
+    if mode == DECODE_TRUSTED:
+        return _model_builder(model)
+    if mode == DECODE_COMPACT:
+        return compact_builder(model)
+    return None
+
+
+def envelope_success(response: Envelope) -> bool:
+    """Whether a decoded response (dict or model) reports success"""
+    if isinstance(response, BaseModel):
+        return bool(response.success)
+    return bool(response.get("success", False))
+
+
+def envelope_data(response: Envelope) -> Any:
+    """The ``data`` field of a decoded response (dict or model)"""
+    if isinstance(response, BaseModel):
+        return response.data
+    return response.get("data")
+
+
+def envelope_error(response: Envelope) -> Optional[str]:
+    """The ``error`` field of a decoded response (dict or model)"""
+    if isinstance(response, BaseModel):
+        return response.error
+    return response.get("error")
+
+
+def envelope_request_id(response: Envelope) -> Optional[str]:
+    """The ``meta.request_id`` of a decoded response (dict or model)"""
+    if isinstance(response, BaseModel):
+        meta = response.meta
+        return getattr(meta, "request_id", None) if meta is not None else None
+    return (response.get("meta") or {}).get("request_id")
+
+
+def record_value(record: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a decoded record, whether it is a dict or a model"""
+    if isinstance(record, dict):
+        return record.get(name, default)
+    return getattr(record, name, default)
+
+
+def record_id(record: Any, kind: str) -> Optional[str]:
+    """
+    ID of a claim, task, edge or agent record.
+    
+    Models carry ``id``; the API functions return e.g. ``claim_id`` or
+    ``task_id`` instead, so both spellings are accepted.
+    """
+    value = record_value(record, "id")
+    if value is None:
+        value = record_value(record, f"{kind}_id")
+    return value
@@ -0,0 +1,448 @@
+"""
+Persistent on-disk response cache shared between processes on one host
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .cache import CacheEntry, ResponseCache, endpoint_family
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+MAGIC = b"CNCACHE1"
+
+# Index header: magic, slot count, used slots (live + deleted), end of valid
+# data in the log, bytes held by live records, retired flag.
+_HEADER = struct.Struct("<8sQQQQQ")
+HEADER_SIZE = 64
+
+# Each slot is four little-endian uint64 words: key hash, endpoint family
+# hash, record offset and record length.
+SLOT_WORDS = 4
+SLOT_SIZE = SLOT_WORDS * 8
+HEADER_WORDS = HEADER_SIZE // 8
+
+EMPTY = 0
+DELETED = 1
+
+# Log record header: key length, etag length, content length, expiry.
+_RECORD = struct.Struct("<IIId")
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_SLOTS = 4096
+MAX_LOAD = 0.7
+
+
+def _hash(value: str) -> int:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return max(int.from_bytes(digest, "little"), DELETED + 1)
+
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    os.lseek(fd, offset, os.SEEK_SET)  # pragma: no cover - Windows
+    return os.read(fd, size)  # pragma: no cover - Windows
+
+
+def _pwrite(fd: int, data: bytes, offset: int) -> None:
+    if hasattr(os, "pwrite"):
+        os.pwrite(fd, data, offset)
+        return
+    os.lseek(fd, offset, os.SEEK_SET)  # pragma: no cover - Windows
+    os.write(fd, data)  # pragma: no cover - Windows
+
+
+def _encode_record(key: str, entry: CacheEntry) -> bytes:
+    key_bytes = key.encode("utf-8")
+    etag_bytes = (entry.etag or "").encode("utf-8")
+    header = _RECORD.pack(len(key_bytes), len(etag_bytes), len(entry.content), entry.expires_at)
+    return b"".join((header, key_bytes, etag_bytes, entry.content))
+
+
+def _create_index(
+    path: str,
+    slot_count: int,
+    data_end: int = 0,
+    live_bytes: int = 0,
+    slots: Iterable[Tuple[int, int, int, int]] = (),
+) -> None:
+    """Write a fresh index file holding ``(hash, family, offset, length)`` slots"""
+    header = _HEADER.pack(MAGIC, slot_count, 0, data_end, live_bytes, 0)
+    with open(path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.truncate(HEADER_SIZE + slot_count * SLOT_SIZE)
+    
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        words = memoryview(mm).cast("Q")
+        used = 0
+        for key_hash, family, offset, length in slots:
+            index = key_hash % slot_count
+            while words[HEADER_WORDS + index * SLOT_WORDS] != EMPTY:
+                index = (index + 1) % slot_count
+            base = HEADER_WORDS + index * SLOT_WORDS
+            words[base + 1] = family
+            words[base + 2] = offset
+            words[base + 3] = length
+            words[base] = key_hash
+            used += 1
+        words[2] = used
+        words.release()
+        mm.flush()
+
+
+class DiskCache(ResponseCache):
+    """
+    Response cache persisted in a directory, surviving process restarts.
+    
+    Entries are appended to ``data.log``. ``index.map`` is an open-addressing
+    hash table from key to log offset, memory-mapped by every process that
+    uses the cache. Writers serialize on an ``fcntl`` lock. Readers opened
+    with ``readonly=True`` only map the files, so many short-lived workers
+    can share one warm cache. When the log outgrows ``max_bytes``, or more
+    than half of it is dead records, it is compacted into a new file. Expired
+    entries without an ETag are dropped first, then the oldest entries.
+    
+    Usage:
+        cache = DiskCache("/var/cache/coherence", max_bytes=512 * 1024 * 1024)
+        client = CoherenceClient(base_url=..., anon_key=..., cache=cache)
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        readonly: bool = False,
+        default_ttl: float = 0.0,
+        ttls: Optional[Dict[str, float]] = None,
+        initial_slots: int = DEFAULT_SLOTS,
+    ):
+        """
+        Args:
+            path: Directory holding the cache files (created if missing)
+            max_bytes: Size limit for the data log before compaction evicts entries
+            readonly: Map the cache read-only; writes become no-ops
+            default_ttl: TTL in seconds for endpoints not listed in ``ttls``
+            ttls: TTL in seconds per endpoint prefix
+            initial_slots: Index capacity for a new cache
+        """
+        super().__init__(default_ttl, ttls)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.readonly = readonly
+        self.initial_slots = max(initial_slots, 8)
+        
+        self._data_path = os.path.join(path, "data.log")
+        self._index_path = os.path.join(path, "index.map")
+        self._lock_path = os.path.join(path, "lock")
+        self._thread_lock = threading.RLock()
+        self._lock_fd: Optional[int] = None
+        self._lock_depth = 0
+        self._data_fd: Optional[int] = None
+        self._index_file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._words: Optional[memoryview] = None
+        
+        if not readonly:
+            os.makedirs(path, exist_ok=True)
+            self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        elif os.path.exists(self._lock_path):
+            self._lock_fd = os.open(self._lock_path, os.O_RDONLY)
+        self._open()
+    
+    # -- file management ------------------------------------------------------
+    
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """Cross-process lock; re-entrant so nested helpers don't release it early"""
+        if fcntl is None or self._lock_fd is None or self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+    
+    def _open(self) -> None:
+        with self._file_lock(exclusive=not self.readonly):
+            if not self.readonly and not os.path.exists(self._index_path):
+                open(self._data_path, "wb").close()
+                _create_index(self._index_path, self.initial_slots)
+            if not os.path.exists(self._index_path):
+                return
+            
+            flags = os.O_RDONLY if self.readonly else os.O_RDWR | os.O_CREAT
+            self._data_fd = os.open(self._data_path, flags, 0o644)
+            self._index_file = open(self._index_path, "rb" if self.readonly else "r+b")
+            access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+            self._mmap = mmap.mmap(self._index_file.fileno(), 0, access=access)
+            self._words = memoryview(self._mmap).cast("Q")
+    
+    def _close_files(self) -> None:
+        if self._words is not None:
+            self._words.release()
+            self._words = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+        if self._data_fd is not None:
+            os.close(self._data_fd)
+            self._data_fd = None
+    
+    def close(self) -> None:
+        """Release the cache files"""
+        with self._thread_lock:
+            self._close_files()
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+    
+    def _ensure_current(self) -> bool:
+        """Reopen the files if another process compacted or resized them"""
+        if self._words is None or self._words[5]:
+            self._close_files()
+            self._open()
+        return self._words is not None
+    
+    @contextmanager
+    def _writing(self) -> Iterator[bool]:
+        with self._thread_lock, self._file_lock(exclusive=True):
+            yield not self.readonly and self._ensure_current()
+    
+    # -- header and slots -----------------------------------------------------
+    
+    @property
+    def _slot_count(self) -> int:
+        return self._words[1]
+    
+    def _slot(self, index: int) -> Tuple[int, int, int, int]:
+        base = HEADER_WORDS + index * SLOT_WORDS
+        words = self._words
+        return words[base], words[base + 1], words[base + 2], words[base + 3]
+    
+    def _write_slot(self, index: int, key_hash: int, family: int, offset: int, length: int) -> None:
+        base = HEADER_WORDS + index * SLOT_WORDS
+        words = self._words
+        words[base + 1] = family
+        words[base + 2] = offset
+        words[base + 3] = length
+        words[base] = key_hash
+    
+    def _read_record(self, offset: int, length: int) -> Optional[Tuple[str, CacheEntry]]:
+        if length < _RECORD.size or offset + length > self._words[3]:
+            return None
+        raw = _pread(self._data_fd, length, offset)
+        if len(raw) != length:
+            return None
+        key_len, etag_len, content_len, expires_at = _RECORD.unpack_from(raw)
+        if _RECORD.size + key_len + etag_len + content_len != length:
+            return None
+        start = _RECORD.size
+        key = raw[start:start + key_len].decode("utf-8")
+        start += key_len
+        etag = raw[start:start + etag_len].decode("utf-8") or None
+        start += etag_len
+        return key, CacheEntry(content=raw[start:], expires_at=expires_at, etag=etag)
+    
+    def _find(self, key: str, key_hash: int) -> Tuple[Optional[int], int]:
+        """Slot holding ``key`` (or None) and the first slot it could be inserted into"""
+        count = self._slot_count
+        index = key_hash % count
+        free = -1
+        for _ in range(count):
+            slot_hash, _, offset, length = self._slot(index)
+            if slot_hash == EMPTY:
+                return None, index if free < 0 else free
+            if slot_hash == DELETED:
+                if free < 0:
+                    free = index
+            elif slot_hash == key_hash:
+                record = self._read_record(offset, length)
+                if record is not None and record[0] == key:
+                    return index, index
+            index = (index + 1) % count
+        return None, free
+    
+    def _live_slots(self) -> List[Tuple[int, int, int, int, int]]:
+        slots = []
+        for index in range(self._slot_count):
+            slot_hash, family, offset, length = self._slot(index)
+            if slot_hash > DELETED:
+                slots.append((index, slot_hash, family, offset, length))
+        return slots
+    
+    # -- ResponseCache --------------------------------------------------------
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._thread_lock:
+            if not self._ensure_current():
+                return None
+            index, _ = self._find(key, _hash(key))
+            if index is None:
+                return None
+            _, _, offset, length = self._slot(index)
+            record = self._read_record(offset, length)
+            return record[1] if record is not None else None
+    
+    def set(self, key: str, entry: CacheEntry) -> None:
+        record = _encode_record(key, entry)
+        key_hash = _hash(key)
+        with self._writing() as writable:
+            if not writable:
+                return
+            words = self._words
+            offset = words[3]
+            _pwrite(self._data_fd, record, offset)
+            words[3] = offset + len(record)
+            words[4] += len(record)
+            
+            index, free = self._find(key, key_hash)
+            if index is not None:
+                words[4] -= self._slot(index)[3]
+            else:
+                if free < 0:
+                    self._resize(self._slot_count * 2)
+                    index, free = self._find(key, key_hash)
+                index = free
+                if self._slot(index)[0] == EMPTY:
+                    words[2] += 1
+            self._write_slot(index, key_hash, _hash(endpoint_family(key)), offset, len(record))
+            
+            if self._words[2] > self._slot_count * MAX_LOAD:
+                self._resize(self._slot_count * 2)
+            self._maybe_compact()
+    
+    def delete(self, key: str) -> None:
+        with self._writing() as writable:
+            if not writable:
+                return
+            index, _ = self._find(key, _hash(key))
+            if index is not None:
+                self._words[4] -= self._slot(index)[3]
+                self._words[HEADER_WORDS + index * SLOT_WORDS] = DELETED
+    
+    def invalidate_prefix(self, prefix: str) -> None:
+        family = endpoint_family(prefix)
+        family_hash = _hash(family)
+        with self._writing() as writable:
+            if not writable:
+                return
+            for index, _, slot_family, offset, length in self._live_slots():
+                if slot_family != family_hash:
+                    continue
+                if prefix != family:
+                    record = self._read_record(offset, length)
+                    if record is not None and not record[0].startswith(prefix):
+                        continue
+                self._words[4] -= length
+                self._words[HEADER_WORDS + index * SLOT_WORDS] = DELETED
+    
+    def clear(self) -> None:
+        with self._writing() as writable:
+            if writable:
+                self._rewrite([], self.initial_slots)
+    
+    def __len__(self) -> int:
+        with self._thread_lock:
+            if not self._ensure_current():
+                return 0
+            return len(self._live_slots())
+    
+    # -- maintenance ----------------------------------------------------------
+    
+    def _retire_and_reopen(self) -> None:
+        """Flag the old index so other processes remap, then remap ourselves"""
+        self._words[5] = 1
+        self._mmap.flush()
+        self._close_files()
+        self._open()
+    
+    def _resize(self, slot_count: int) -> None:
+        """Rehash live slots into a larger index; the data log is untouched"""
+        tmp_path = self._index_path + ".tmp"
+        _create_index(
+            tmp_path,
+            slot_count,
+            self._words[3],
+            self._words[4],
+            (slot[1:] for slot in self._live_slots()),
+        )
+        os.replace(tmp_path, self._index_path)
+        self._retire_and_reopen()
+    
+    def _maybe_compact(self) -> None:
+        data_end, live_bytes = self._words[3], self._words[4]
+        if data_end > self.max_bytes or (data_end > 1024 * 1024 and live_bytes < data_end // 2):
+            self._compact()
+    
+    def compact(self) -> None:
+        """
+        Rewrite the log with only live entries, evicting to fit ``max_bytes``.
+        
+        Expired entries without an ETag are dropped. If the rest still exceeds
+        80% of ``max_bytes``, the oldest entries are evicted until it fits.
+        """
+        with self._writing() as writable:
+            if writable:
+                self._compact()
+    
+    def _compact(self) -> None:
+        now = time.time()
+        records = []
+        for _, slot_hash, family, offset, length in sorted(
+            self._live_slots(), key=lambda slot: slot[3]
+        ):
+            record = self._read_record(offset, length)
+            if record is None:
+                continue
+            key, entry = record
+            if not entry.is_fresh(now) and not entry.etag:
+                continue
+            records.append((slot_hash, family, _encode_record(key, entry)))
+        
+        budget = int(self.max_bytes * 0.8)
+        total = sum(len(raw) for _, _, raw in records)
+        start = 0
+        while total > budget and start < len(records):
+            total -= len(records[start][2])
+            start += 1
+        
+        records = records[start:]
+        slots = self.initial_slots
+        while len(records) > slots * MAX_LOAD / 2:
+            slots *= 2
+        self._rewrite(records, slots)
+    
+    def _rewrite(self, records: List[Tuple[int, int, bytes]], slot_count: int) -> None:
+        data_tmp = self._data_path + ".tmp"
+        index_tmp = self._index_path + ".tmp"
+        offset = 0
+        slots = []
+        with open(data_tmp, "wb") as f:
+            for key_hash, family, raw in records:
+                f.write(raw)
+                slots.append((key_hash, family, offset, len(raw)))
+                offset += len(raw)
+        _create_index(index_tmp, slot_count, offset, offset, slots)
+        os.replace(data_tmp, self._data_path)
+        os.replace(index_tmp, self._index_path)
+        self._retire_and_reopen()
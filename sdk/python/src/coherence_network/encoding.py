@@ -0,0 +1,27 @@
+"""
+Request body serialization: one pass from Python objects to UTF-8 bytes
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_json(data: Any) -> bytes:
+    """
+    Serialize ``data`` to compact UTF-8 JSON bytes.
+    
+    Uses ``orjson`` when installed, which writes bytes directly. The
+    fallback produces the same compact form with the standard library. The
+    result is the exact body that is signed and sent, so it is built once
+    per request.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return _encoder.encode(data).encode("utf-8")
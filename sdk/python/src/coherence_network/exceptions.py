@@ -0,0 +1,47 @@
+"""
+Exceptions raised by the Coherence Network SDK
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .decoding import Envelope
+
+
+class CoherenceError(Exception):
+    """Base class for all SDK errors"""
+
+
+class ApiError(CoherenceError):
+    """The API returned an unsuccessful response"""
+    
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        request_id: Optional[str] = None,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.request_id = request_id
+    
+    @classmethod
+    def from_response(
+        cls,
+        response: "Envelope",
+        status_code: Optional[int] = None,
+    ) -> "ApiError":
+        """Build an error from a decoded API response envelope (dict or model)"""
+        from .decoding import envelope_error, envelope_request_id
+        
+        return cls(
+            envelope_error(response) or "Unknown API error",
+            status_code=status_code,
+            request_id=envelope_request_id(response),
+        )
+    
+    def __str__(self) -> str:
+        if self.request_id:
+            return f"{self.message} (request_id={self.request_id})"
+        return self.message
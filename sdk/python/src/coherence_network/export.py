@@ -0,0 +1,458 @@
+"""
+Columnar export of list endpoints into typed column buffers
+"""
+
+import json
+from abc import ABC, abstractmethod
+from array import array
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from .decoding import record_id, record_value
+from .models import Agent, Claim, Task
+from .records import MISSING, field_paths, lookup
+
+# NumPy and pyarrow are optional and slow to import; they are loaded on
+# first conversion, not when the SDK is imported.
+np: Any = None
+pa: Any = None
+pq: Any = None
+
+DEFAULT_BATCH_ROWS = 65536
+
+MODELS: Dict[str, Type[BaseModel]] = {"claim": Claim, "task": Task, "agent": Agent}
+
+
+def _load_numpy() -> None:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "NumPy is required; install it with `pip install coherence-network[numpy]`"
+            ) from None
+        np = numpy
+
+
+def _load_arrow() -> None:
+    global pa, pq
+    if pq is None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "pyarrow is required; install it with `pip install coherence-network[arrow]`"
+            ) from None
+        _load_numpy()
+        pa, pq = pyarrow, pyarrow.parquet
+
+
+class Column(ABC):
+    """Append-only typed buffer with a validity byte per row"""
+    
+    arrow_type: str = ""
+    
+    def __init__(self) -> None:
+        self.valid = bytearray()
+    
+    def __len__(self) -> int:
+        return len(self.valid)
+    
+    @abstractmethod
+    def append(self, value: Any) -> None:
+        """Append one value; ``None`` is recorded as missing"""
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every row, leaving arrays handed out earlier untouched"""
+    
+    def _validity_bitmap(self) -> Optional[Any]:
+        if all(self.valid):
+            return None
+        bits = np.packbits(np.frombuffer(self.valid, dtype=np.uint8), bitorder="little")
+        return pa.py_buffer(bits)
+    
+    @abstractmethod
+    def to_numpy(self) -> Any:
+        """The column as a NumPy array"""
+    
+    @abstractmethod
+    def to_arrow(self) -> Any:
+        """The column as a pyarrow array"""
+
+
+class _FixedColumn(Column):
+    typecode = "d"
+    numpy_dtype = "float64"
+    missing: Any = 0
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.values = array(self.typecode)
+    
+    def _convert(self, value: Any) -> Any:
+        return value
+    
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.values.append(self.missing)
+            self.valid.append(0)
+        else:
+            self.values.append(self._convert(value))
+            self.valid.append(1)
+    
+    def clear(self) -> None:
+        self.values = array(self.typecode)
+        self.valid = bytearray()
+    
+    def to_numpy(self) -> Any:
+        """Zero-copy NumPy view of the values (missing entries hold a placeholder)"""
+        _load_numpy()
+        return np.frombuffer(self.values, dtype=self.numpy_dtype)
+    
+    def to_arrow(self) -> Any:
+        """Arrow array sharing the value buffer"""
+        _load_arrow()
+        arrow_type = getattr(pa, self.arrow_type)()
+        return pa.Array.from_buffers(
+            arrow_type,
+            len(self),
+            [self._validity_bitmap(), pa.py_buffer(self.values)],
+        )
+
+
+class FloatColumn(_FixedColumn):
+    typecode = "d"
+    numpy_dtype = "float64"
+    arrow_type = "float64"
+    missing = float("nan")
+    
+    def _convert(self, value: Any) -> float:
+        return float(value)
+
+
+class IntColumn(_FixedColumn):
+    typecode = "q"
+    numpy_dtype = "int64"
+    arrow_type = "int64"
+    
+    def _convert(self, value: Any) -> int:
+        return int(value)
+
+
+class BoolColumn(_FixedColumn):
+    typecode = "b"
+    numpy_dtype = "int8"
+    
+    def _convert(self, value: Any) -> int:
+        return 1 if value else 0
+    
+    def to_numpy(self) -> Any:
+        return super().to_numpy().view(np.bool_)
+    
+    def to_arrow(self) -> Any:
+        _load_arrow()
+        values = pa.py_buffer(np.packbits(self.to_numpy(), bitorder="little"))
+        return pa.Array.from_buffers(pa.bool_(), len(self), [self._validity_bitmap(), values])
+
+
+class TimestampColumn(_FixedColumn):
+    """Timestamps as int64 microseconds since the epoch (UTC)"""
+    
+    typecode = "q"
+    numpy_dtype = "datetime64[us]"
+    missing = -(2 ** 63)  # NumPy's NaT
+    
+    def _convert(self, value: Any) -> int:
+        if not isinstance(value, datetime):
+            value = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+        return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    
+    def to_arrow(self) -> Any:
+        _load_arrow()
+        return pa.Array.from_buffers(
+            pa.timestamp("us", tz="UTC"),
+            len(self),
+            [self._validity_bitmap(), pa.py_buffer(self.values)],
+        )
+
+
+class StringColumn(Column):
+    """UTF-8 strings in Arrow layout: int64 offsets plus one contiguous data buffer"""
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.offsets = array("q", [0])
+        self.data = bytearray()
+    
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.valid.append(0)
+        else:
+            if not isinstance(value, str):
+                value = json.dumps(value)
+            self.data += value.encode("utf-8")
+            self.valid.append(1)
+        self.offsets.append(len(self.data))
+    
+    def clear(self) -> None:
+        self.offsets = array("q", [0])
+        self.data = bytearray()
+        self.valid = bytearray()
+    
+    def to_numpy(self) -> Any:
+        """Object array of Python strings (strings cannot be zero-copy in NumPy)"""
+        _load_numpy()
+        data, offsets, valid = bytes(self.data), self.offsets, self.valid
+        values = [
+            data[offsets[i]:offsets[i + 1]].decode("utf-8") if valid[i] else None
+            for i in range(len(self))
+        ]
+        return np.array(values, dtype=object)
+    
+    def to_arrow(self) -> Any:
+        """Arrow ``large_string`` array sharing the offset and data buffers"""
+        _load_arrow()
+        return pa.Array.from_buffers(
+            pa.large_string(),
+            len(self),
+            [self._validity_bitmap(), pa.py_buffer(self.offsets), pa.py_buffer(self.data)],
+        )
+
+
+class StringListColumn(Column):
+    """Lists of strings: int64 list offsets over a child ``StringColumn``"""
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.offsets = array("q", [0])
+        self.items = StringColumn()
+    
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.valid.append(0)
+        else:
+            for item in value:
+                self.items.append(item)
+            self.valid.append(1)
+        self.offsets.append(len(self.items))
+    
+    def clear(self) -> None:
+        self.offsets = array("q", [0])
+        self.items = StringColumn()
+        self.valid = bytearray()
+    
+    def to_numpy(self) -> Any:
+        _load_numpy()
+        items = self.items.to_numpy()
+        offsets = self.offsets
+        values = [
+            list(items[offsets[i]:offsets[i + 1]]) if self.valid[i] else None
+            for i in range(len(self))
+        ]
+        return np.array(values + [None], dtype=object)[:-1]
+    
+    def to_arrow(self) -> Any:
+        _load_arrow()
+        return pa.LargeListArray.from_buffers(
+            pa.large_list(pa.large_string()),
+            len(self),
+            [self._validity_bitmap(), pa.py_buffer(self.offsets)],
+            children=[self.items.to_arrow()],
+        )
+
+
+def _column_for(annotation: Any) -> Type[Column]:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else Any
+    if get_origin(annotation) in (list, List):
+        return StringListColumn
+    if annotation is bool:
+        return BoolColumn
+    if annotation is int:
+        return IntColumn
+    if annotation is float:
+        return FloatColumn
+    if annotation is datetime:
+        return TimestampColumn
+    return StringColumn
+
+
+def schema_for(kind: str, columns: Optional[Sequence[str]] = None) -> Dict[str, Type[Column]]:
+    """Column types for a record kind (``claim``, ``task`` or ``agent``), from its model"""
+    fields = MODELS[kind].model_fields
+    names = list(fields) if columns is None else list(columns)
+    return {name: _column_for(fields[name].annotation) for name in names}
+
+
+class ColumnarTable:
+    """
+    Typed column buffers filled straight from API records.
+    
+    Records are read field by field (dicts or models) and appended to the
+    buffers. No per-row model objects are built, and each record can be
+    dropped right after it is appended.
+    """
+    
+    def __init__(self, kind: str, columns: Optional[Sequence[str]] = None):
+        """
+        Args:
+            kind: ``"claim"``, ``"task"`` or ``"agent"``
+            columns: Subset of model fields to export (default: all)
+        """
+        self.kind = kind
+        self.columns: Dict[str, Column] = {
+            name: column_type() for name, column_type in schema_for(kind, columns).items()
+        }
+        # Where the API functions nest fields the models keep flat, per the models' aliases
+        self._paths = field_paths(MODELS[kind])
+    
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+    
+    def _value(self, record: Any, name: str) -> Any:
+        if name == "id":
+            return record_id(record, self.kind)
+        value = record_value(record, name)
+        if value is None and name in self._paths and isinstance(record, dict):
+            value = lookup(record, self._paths[name])
+            if value is MISSING:
+                return None
+        return value
+    
+    def append(self, record: Any) -> None:
+        """Append one record to every column"""
+        for name, column in self.columns.items():
+            column.append(self._value(record, name))
+    
+    def extend(self, records: Iterable[Any]) -> None:
+        """Append many records"""
+        for record in records:
+            self.append(record)
+    
+    def clear(self) -> None:
+        """Empty every column, keeping the schema"""
+        for column in self.columns.values():
+            column.clear()
+    
+    def to_numpy(self) -> Dict[str, Any]:
+        """NumPy arrays per column; numeric columns are zero-copy views"""
+        return {name: column.to_numpy() for name, column in self.columns.items()}
+    
+    def to_arrow(self) -> Any:
+        """
+        ``pyarrow.Table`` whose arrays share this table's buffers.
+        
+        Call ``clear()`` before appending more rows while the Arrow table is alive;
+        Python arrays cannot grow while another object holds their buffer.
+        """
+        _load_arrow()
+        return pa.table({name: column.to_arrow() for name, column in self.columns.items()})
+
+
+class ParquetSink:
+    """Writes a ``ColumnarTable`` to Parquet one row group at a time"""
+    
+    def __init__(self, path: str, table: ColumnarTable, batch_rows: int = DEFAULT_BATCH_ROWS):
+        _load_arrow()
+        self.path = path
+        self.table = table
+        self.batch_rows = batch_rows
+        self.rows = 0
+        self._writer = None
+    
+    def append(self, record: Any) -> None:
+        self.table.append(record)
+        if len(self.table) >= self.batch_rows:
+            self.flush()
+    
+    def flush(self) -> None:
+        if not len(self.table):
+            return
+        arrow_table = self.table.to_arrow()
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, arrow_table.schema)
+        self._writer.write_table(arrow_table)
+        self.rows += len(self.table)
+        self.table.clear()
+    
+    def close(self) -> None:
+        self.flush()
+        if self._writer is None:
+            # No rows: still write a valid, empty file with the schema
+            pq.write_table(self.table.to_arrow(), self.path)
+        else:
+            self._writer.close()
+
+
+def export_records(
+    records: Iterable[Any],
+    kind: str,
+    path: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+) -> Union[ColumnarTable, int]:
+    """
+    Stream records into column buffers, optionally writing them to Parquet.
+    
+    Args:
+        records: Records to export, typically a resource's ``iter_all()``
+        kind: ``"claim"``, ``"task"`` or ``"agent"``
+        path: Parquet file to write; if omitted the table is returned in memory
+        columns: Subset of model fields to export
+        batch_rows: Rows buffered per Parquet row group
+    
+    Returns:
+        The filled ``ColumnarTable``, or the number of rows written to ``path``
+    """
+    table = ColumnarTable(kind, columns)
+    if path is None:
+        table.extend(records)
+        return table
+    
+    sink = ParquetSink(path, table, batch_rows)
+    for record in records:
+        sink.append(record)
+    sink.close()
+    return sink.rows
+
+
+async def aexport_records(
+    records: AsyncIterable[Any],
+    kind: str,
+    path: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+) -> Union[ColumnarTable, int]:
+    """Async counterpart of ``export_records`` for ``aiter_all()`` streams"""
+    table = ColumnarTable(kind, columns)
+    sink = ParquetSink(path, table, batch_rows) if path is not None else None
+    async for record in records:
+        if sink is None:
+            table.append(record)
+        else:
+            sink.append(record)
+    if sink is None:
+        return table
+    sink.close()
+    return sink.rows
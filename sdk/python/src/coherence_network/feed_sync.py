@@ -0,0 +1,186 @@
+"""
+Incremental synchronizer for the discovery and coherence-work feeds
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+
+from .decoding import decode_record
+from .exceptions import ApiError
+from .models import FeedItem
+
+DISCOVERY = "discovery"
+COHERENCE_WORK = "coherence-work"
+FEEDS = (DISCOVERY, COHERENCE_WORK)
+
+
+@dataclass
+class FeedDelta:
+    """What changed in a feed since the previous sync"""
+    
+    added: List[Any] = field(default_factory=list)
+    changed: List[Any] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    not_modified: bool = False
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+class FeedSynchronizer:
+    """
+    Local ordered view of a feed, updated with "since last sync" deltas.
+    
+    Each sync sends the ``ETag`` of the last page as ``If-None-Match``. An
+    unchanged feed costs a bodiless 304. When the page did change, items are
+    merged by ``id``: an item counts as changed when its ``relevance_score``
+    or any part of its payload differs. Only added and changed items are
+    decoded into ``FeedItem`` models, so steady-state syncs do not rebuild
+    the items the caller already holds.
+    
+    Usage:
+        feed = FeedSynchronizer("coherence-work", limit=50)
+        delta = feed.sync(client)
+        for item in delta.added + delta.changed:
+            ...
+        for item in feed:  # highest relevance first
+            ...
+    """
+    
+    def __init__(
+        self,
+        feed: str = DISCOVERY,
+        limit: int = 50,
+        domain: Optional[str] = None,
+        decode: Optional[str] = None,
+    ):
+        """
+        Args:
+            feed: ``"discovery"`` or ``"coherence-work"``
+            limit: Size of the top-N window to track
+            domain: Only track items in this domain
+            decode: Decode mode for items (default: the client's)
+        """
+        if feed not in FEEDS:
+            raise ValueError(f"feed must be 'discovery' or 'coherence-work', got {feed!r}")
+        
+        self.feed = feed
+        self.limit = limit
+        self.domain = domain
+        self.decode = decode
+        self.etag: Optional[str] = None
+        self.total: Optional[int] = None
+        self.last_sync: Optional[float] = None
+        self.syncs = 0
+        self.not_modified = 0
+        self._order: List[str] = []
+        self._items: Dict[str, Any] = {}
+        self._raw: Dict[str, Dict[str, Any]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._items
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items())
+    
+    def items(self) -> List[Any]:
+        """Tracked items in feed order (highest relevance first)"""
+        return [self._items[item_id] for item_id in self._order]
+    
+    def get(self, item_id: str) -> Optional[Any]:
+        """Tracked item by ID, or ``None``"""
+        return self._items.get(item_id)
+    
+    def reset(self) -> None:
+        """Forget the local view; the next sync reports every item as added"""
+        self.etag = None
+        self.total = None
+        self._order = []
+        self._items.clear()
+        self._raw.clear()
+    
+    def _request(self, client: Any) -> Tuple[str, str, Dict[str, str]]:
+        endpoint = f"/api-feed/{self.feed}"
+        params: Dict[str, Any] = {"limit": self.limit}
+        if self.domain:
+            params["domain"] = self.domain
+        headers = client._get_headers()
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        return endpoint, f"{endpoint}?{urlencode(params)}", headers
+    
+    def sync(self, client: Any) -> FeedDelta:
+        """
+        Fetch the feed through a ``CoherenceClient`` and merge it.
+        
+        Returns:
+            Items added, changed and removed since the previous sync
+        """
+        endpoint, path, headers = self._request(client)
+        response = client._send_get(endpoint, path, headers)
+        return self._apply(response, self.decode or client.decode)
+    
+    async def sync_async(self, client: Any) -> FeedDelta:
+        """Async counterpart of ``sync`` for an ``AsyncCoherenceClient``"""
+        endpoint, path, headers = self._request(client)
+        response = await client._send_get(endpoint, path, headers)
+        return self._apply(response, self.decode or client.decode)
+    
+    def _apply(self, response: httpx.Response, mode: str) -> FeedDelta:
+        self.syncs += 1
+        if response.status_code == 304 and self.etag is not None:
+            self.not_modified += 1
+            self.last_sync = time.time()
+            return FeedDelta(not_modified=True)
+        
+        try:
+            payload = json.loads(response.content)
+        except ValueError:
+            raise ApiError(
+                f"Unreadable feed response (HTTP {response.status_code})",
+                status_code=response.status_code,
+            ) from None
+        if not isinstance(payload, dict) or not payload.get("success"):
+            raise ApiError.from_response(
+                payload if isinstance(payload, dict) else {},
+                status_code=response.status_code,
+            )
+        
+        data = payload.get("data") or {}
+        rows = data.get("items", []) if isinstance(data, dict) else data
+        delta = FeedDelta()
+        order: List[str] = []
+        current = set()
+        for raw in rows:
+            item_id = raw.get("id")
+            if item_id is None or item_id in current:
+                continue
+            order.append(item_id)
+            current.add(item_id)
+            previous = self._raw.get(item_id)
+            if previous == raw:
+                continue
+            item = decode_record(raw, FeedItem, mode)
+            self._raw[item_id] = raw
+            self._items[item_id] = item
+            (delta.added if previous is None else delta.changed).append(item)
+        
+        for item_id in self._order:
+            if item_id not in current:
+                delta.removed.append(item_id)
+                del self._raw[item_id]
+                del self._items[item_id]
+        
+        self._order = order
+        self.total = data.get("total") if isinstance(data, dict) else len(order)
+        self.etag = response.headers.get("etag")
+        self.last_sync = time.time()
+        return delta
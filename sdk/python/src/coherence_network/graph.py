@@ -0,0 +1,501 @@
+"""
+Local claim-graph replica with compact adjacency arrays and graph queries
+"""
+
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .decoding import envelope_data, envelope_success, record_id, record_value
+from .exceptions import ApiError
+from .pagination import DEFAULT_PAGE_SIZE
+
+EDGE_TYPES: Tuple[str, ...] = (
+    "SUPPORTS",
+    "CONTRADICTS",
+    "REFINES",
+    "DEPENDS_ON",
+    "EQUIVALENT_TO",
+)
+EDGE_TYPE_CODES: Dict[str, int] = {name: code for code, name in enumerate(EDGE_TYPES)}
+
+# Edges a contradiction cycle may travel along on its way back to the start
+SUPPORTING_TYPES = ("SUPPORTS", "REFINES", "DEPENDS_ON", "EQUIVALENT_TO")
+
+# Edge lists fetched at once by ``sync``
+DEFAULT_EDGE_CONCURRENCY = 8
+
+OUT = "out"
+IN = "in"
+BOTH = "both"
+
+
+def _timestamp(value: Any) -> float:
+    """Seconds since the epoch for a datetime or ISO-8601 string (0 if missing)"""
+    if value is None:
+        return 0.0
+    if isinstance(value, datetime):
+        return value.timestamp()
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _type_mask(edge_types: Optional[Iterable[str]]) -> int:
+    if edge_types is None:
+        return (1 << len(EDGE_TYPES)) - 1
+    mask = 0
+    for name in edge_types:
+        mask |= 1 << EDGE_TYPE_CODES[name.upper()]
+    return mask
+
+
+def _edge_endpoint(edge: Any, side: str) -> Optional[str]:
+    """Claim ID at one end of an edge (model field or nested API object)"""
+    value = record_value(edge, f"{side}_claim_id")
+    if value is None:
+        nested = record_value(edge, f"{side}_claim")
+        if nested is not None:
+            value = record_id(nested, "claim")
+    return value
+
+
+class ClaimGraph:
+    """
+    In-memory replica of the claim graph.
+    
+    Claim IDs are interned to dense integers. Edges are stored column-wise
+    in ``array`` buffers: source, target, type code and weight. Queries use
+    CSR-style adjacency (offsets plus edge indices per node, for both
+    directions), rebuilt lazily after edges are added. Traversals never
+    touch the network.
+    
+    Usage:
+        graph = ClaimGraph()
+        graph.sync(client)                       # bulk load, then incremental
+        graph.sync(client, full=True)            # also picks up later edges
+        graph.neighbors(claim_id, ["SUPPORTS"])
+        graph.shortest_path(a, b)
+        graph.contradiction_cycles()
+        graph.dependency_closure(claim_id)
+    """
+    
+    def __init__(self) -> None:
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.confidence = array("d")
+        self._versions = array("d")
+        self.claims: Dict[str, Any] = {}
+        
+        self._edge_index: Dict[str, int] = {}
+        self._src = array("l")
+        self._dst = array("l")
+        self._type = array("b")
+        self.weight = array("d")
+        
+        self._dirty = True
+        self._out_offsets = array("l")
+        self._out_edges = array("l")
+        self._in_offsets = array("l")
+        self._in_edges = array("l")
+        
+        self.synced_until = 0.0
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __contains__(self, claim_id: object) -> bool:
+        return claim_id in self._index
+    
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the replica"""
+        return len(self._src)
+    
+    # -- loading --------------------------------------------------------------
+    
+    def _intern(self, claim_id: str) -> int:
+        node = self._index.get(claim_id)
+        if node is None:
+            node = self._index[claim_id] = len(self._ids)
+            self._ids.append(claim_id)
+            self.confidence.append(0.0)
+            self._versions.append(0.0)
+            self._dirty = True
+        return node
+    
+    def node_id(self, claim_id: str) -> int:
+        """Dense integer ID of a claim (raises KeyError if unknown)"""
+        return self._index[claim_id]
+    
+    def claim_id(self, node: int) -> str:
+        """Claim ID for a dense integer ID"""
+        return self._ids[node]
+    
+    def add_claims(self, claims: Iterable[Any], keep_records: bool = False) -> int:
+        """
+        Insert or update claims (models or API dicts).
+        
+        A claim is only updated when its ``updated_at``/``created_at`` is newer
+        than the stored version.
+        
+        Args:
+            claims: Claim records
+            keep_records: Also keep each record in ``self.claims``
+        
+        Returns:
+            Number of claims inserted or updated
+        """
+        changed = 0
+        for claim in claims:
+            claim_id = record_id(claim, "claim")
+            if claim_id is None:
+                continue
+            version = max(
+                _timestamp(record_value(claim, "updated_at")),
+                _timestamp(record_value(claim, "created_at")),
+            )
+            node = self._intern(claim_id)
+            if version and version <= self._versions[node]:
+                continue
+            self._versions[node] = version
+            confidence = record_value(claim, "confidence")
+            if confidence is not None:
+                self.confidence[node] = float(confidence)
+            if keep_records:
+                self.claims[claim_id] = claim
+            changed += 1
+        return changed
+    
+    def add_edges(self, edges: Iterable[Any]) -> int:
+        """
+        Insert or update edges (models or API dicts).
+        
+        Edges of unknown types are skipped. Endpoints that are not yet known
+        claims are interned as bare nodes.
+        
+        Returns:
+            Number of edges inserted or updated
+        """
+        changed = 0
+        for edge in edges:
+            source = _edge_endpoint(edge, "from")
+            target = _edge_endpoint(edge, "to")
+            code = EDGE_TYPE_CODES.get(str(record_value(edge, "type", "")).upper())
+            if source is None or target is None or code is None:
+                continue
+            weight = record_value(edge, "weight")
+            weight = 0.5 if weight is None else float(weight)
+            
+            edge_id = record_id(edge, "edge") or f"{source}:{target}:{code}"
+            index = self._edge_index.get(edge_id)
+            if index is not None:
+                self._type[index] = code
+                self.weight[index] = weight
+            else:
+                self._edge_index[edge_id] = len(self._src)
+                self._src.append(self._intern(source))
+                self._dst.append(self._intern(target))
+                self._type.append(code)
+                self.weight.append(weight)
+                self._dirty = True
+            changed += 1
+        return changed
+    
+    # -- syncing --------------------------------------------------------------
+    
+    def _seen_before(self, claim: Any) -> bool:
+        """Whether a claim was created at or before the last sync"""
+        created = _timestamp(record_value(claim, "created_at"))
+        return bool(created) and created <= self.synced_until
+    
+    def _finish_sync(self, fresh: List[Any]) -> None:
+        for claim in fresh:
+            created = _timestamp(record_value(claim, "created_at"))
+            self.synced_until = max(self.synced_until, created)
+    
+    @staticmethod
+    def _edge_page(response: Any) -> List[Any]:
+        if not envelope_success(response):
+            raise ApiError.from_response(response)
+        return envelope_data(response) or []
+    
+    def sync(
+        self,
+        client: Any,
+        full: bool = False,
+        edges: bool = True,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        keep_records: bool = False,
+        concurrency: int = DEFAULT_EDGE_CONCURRENCY,
+    ) -> int:
+        """
+        Pull new claims (and their edges) from a ``CoherenceClient``.
+        
+        The claims list is ordered newest first, so an incremental sync stops
+        at the first claim created at or before the last sync, and fetches
+        edges only for the claims it found. The API has no edge listing to
+        sync from, so an edge added later between two claims the replica
+        already holds, and any claim edited after creation, are only picked
+        up by a ``full`` sync. That pass walks every claim, applies the ones
+        whose ``updated_at`` moved forward and re-reads every edge list; run
+        one periodically to keep the replica correct.
+        
+        Edge lists are fetched ``concurrency`` at a time on a thread pool.
+        
+        Args:
+            client: A ``CoherenceClient``
+            full: Re-scan every claim and edge instead of stopping at the watermark
+            edges: Fetch edges for every new or changed claim
+            page_size: Claims per page
+            keep_records: Keep full claim records in ``self.claims``
+            concurrency: Edge lists fetched at once
+        
+        Returns:
+            Number of claims inserted or updated
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        fresh = []
+        for claim in client.claims.iter_all(page_size=page_size, prefetch=True):
+            if not full and self._seen_before(claim):
+                break
+            fresh.append(claim)
+        changed = self.add_claims(fresh, keep_records)
+        if edges and fresh:
+            claim_ids = [record_id(claim, "claim") for claim in fresh]
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for response in executor.map(client.claims.get_edges, claim_ids):
+                    self.add_edges(self._edge_page(response))
+        self._finish_sync(fresh)
+        return changed
+    
+    async def sync_async(
+        self,
+        client: Any,
+        full: bool = False,
+        edges: bool = True,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        keep_records: bool = False,
+    ) -> int:
+        """
+        Async counterpart of ``sync`` for an ``AsyncCoherenceClient``.
+        
+        Edge lists for new claims are fetched concurrently through
+        ``client.gather``, bounded by the client's ``max_concurrency``. The
+        same caveat applies: edges added between claims already in the
+        replica need a ``full`` sync.
+        """
+        fresh = []
+        async for claim in client.claims.aiter_all(page_size=page_size, prefetch=True):
+            if not full and self._seen_before(claim):
+                break
+            fresh.append(claim)
+        changed = self.add_claims(fresh, keep_records)
+        if edges and fresh:
+            responses = await client.gather(
+                client.claims.get_edges(record_id(claim, "claim")) for claim in fresh
+            )
+            for response in responses:
+                self.add_edges(self._edge_page(response))
+        self._finish_sync(fresh)
+        return changed
+    
+    # -- adjacency ------------------------------------------------------------
+    
+    @staticmethod
+    def _csr(keys: Sequence[int], node_count: int) -> Tuple[array, array]:
+        """Counting-sort edge indices by ``keys`` into (offsets, edge indices)"""
+        offsets = array("l", [0]) * (node_count + 1)
+        for key in keys:
+            offsets[key + 1] += 1
+        for node in range(node_count):
+            offsets[node + 1] += offsets[node]
+        cursor = offsets[:-1]
+        ordered = array("l", [0]) * len(keys)
+        for edge, key in enumerate(keys):
+            ordered[cursor[key]] = edge
+            cursor[key] += 1
+        return offsets, ordered
+    
+    def _build(self) -> None:
+        if not self._dirty:
+            return
+        node_count = len(self._ids)
+        self._out_offsets, self._out_edges = self._csr(self._src, node_count)
+        self._in_offsets, self._in_edges = self._csr(self._dst, node_count)
+        self._dirty = False
+    
+    def _adjacent(self, node: int, mask: int, direction: str) -> Iterable[Tuple[int, int]]:
+        """Yield ``(neighbor node, edge index)`` pairs"""
+        types = self._type
+        if direction in (OUT, BOTH):
+            dst, edges = self._dst, self._out_edges
+            for k in range(self._out_offsets[node], self._out_offsets[node + 1]):
+                edge = edges[k]
+                if mask >> types[edge] & 1:
+                    yield dst[edge], edge
+        if direction in (IN, BOTH):
+            src, edges = self._src, self._in_edges
+            for k in range(self._in_offsets[node], self._in_offsets[node + 1]):
+                edge = edges[k]
+                if mask >> types[edge] & 1:
+                    yield src[edge], edge
+    
+    def adjacency(self, direction: str = OUT) -> Tuple[array, array]:
+        """
+        CSR adjacency arrays ``(offsets, edge_indices)`` for one direction.
+        
+        Edges of node ``n`` are ``edge_indices[offsets[n]:offsets[n + 1]]``;
+        use ``edge_arrays()`` to resolve them to endpoints, types and weights.
+        """
+        self._build()
+        if direction == IN:
+            return self._in_offsets, self._in_edges
+        return self._out_offsets, self._out_edges
+    
+    def edge_arrays(self) -> Tuple[array, array, array, array]:
+        """Column arrays ``(source, target, type_code, weight)`` indexed by edge"""
+        return self._src, self._dst, self._type, self.weight
+    
+    # -- queries --------------------------------------------------------------
+    
+    def neighbors(
+        self,
+        claim_id: str,
+        edge_types: Optional[Iterable[str]] = None,
+        direction: str = OUT,
+    ) -> List[str]:
+        """
+        Claims one hop away from ``claim_id``.
+        
+        Args:
+            claim_id: Starting claim
+            edge_types: Only follow these edge types (default: all)
+            direction: ``"out"``, ``"in"`` or ``"both"``
+        """
+        node = self._index.get(claim_id)
+        if node is None:
+            return []
+        self._build()
+        ids = self._ids
+        return [ids[other] for other, _ in self._adjacent(node, _type_mask(edge_types), direction)]
+    
+    def _bfs_path(
+        self,
+        source: int,
+        target: int,
+        mask: int,
+        direction: str,
+        max_depth: Optional[int],
+    ) -> Optional[List[int]]:
+        if source == target:
+            return [source]
+        parents = {source: -1}
+        frontier = [source]
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for node in frontier:
+                for other, _ in self._adjacent(node, mask, direction):
+                    if other in parents:
+                        continue
+                    parents[other] = node
+                    if other == target:
+                        path = [other]
+                        while parents[path[-1]] != -1:
+                            path.append(parents[path[-1]])
+                        return path[::-1]
+                    next_frontier.append(other)
+            frontier = next_frontier
+        return None
+    
+    def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        edge_types: Optional[Iterable[str]] = None,
+        direction: str = OUT,
+        max_depth: Optional[int] = None,
+    ) -> Optional[List[str]]:
+        """
+        Fewest-hop path between two claims, or None if there is none.
+        
+        Args:
+            source_id: Starting claim
+            target_id: Claim to reach
+            edge_types: Only follow these edge types (default: all)
+            direction: ``"out"`` follows edges forward, ``"both"`` ignores direction
+            max_depth: Give up after this many hops
+        """
+        source = self._index.get(source_id)
+        target = self._index.get(target_id)
+        if source is None or target is None:
+            return None
+        self._build()
+        path = self._bfs_path(source, target, _type_mask(edge_types), direction, max_depth)
+        return None if path is None else [self._ids[node] for node in path]
+    
+    def contradiction_cycles(
+        self,
+        max_depth: Optional[int] = 8,
+        limit: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Find claims that contradict something that leads back to them.
+        
+        For each ``A CONTRADICTS B`` edge, look for the shortest path from
+        ``B`` back to ``A`` along supporting edges (SUPPORTS, REFINES,
+        DEPENDS_ON, EQUIVALENT_TO). Each hit is returned as ``[A, B, ..., A]``,
+        a self-undermining chain worth verifying.
+        
+        Args:
+            max_depth: Longest supporting chain to search
+            limit: Stop after this many cycles
+        """
+        self._build()
+        contradicts = EDGE_TYPE_CODES["CONTRADICTS"]
+        mask = _type_mask(SUPPORTING_TYPES)
+        cycles = []
+        for edge in range(len(self._src)):
+            if self._type[edge] != contradicts:
+                continue
+            source, target = self._src[edge], self._dst[edge]
+            path = self._bfs_path(target, source, mask, OUT, max_depth)
+            if path is not None:
+                cycles.append([self._ids[source]] + [self._ids[node] for node in path])
+                if limit is not None and len(cycles) >= limit:
+                    break
+        return cycles
+    
+    def dependency_closure(
+        self,
+        claim_id: str,
+        edge_types: Iterable[str] = ("DEPENDS_ON",),
+    ) -> Set[str]:
+        """
+        Every claim ``claim_id`` transitively depends on (excluding itself).
+        
+        Args:
+            claim_id: Starting claim
+            edge_types: Edge types treated as dependencies
+        """
+        node = self._index.get(claim_id)
+        if node is None:
+            return set()
+        self._build()
+        mask = _type_mask(edge_types)
+        seen = {node}
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for other, _ in self._adjacent(current, mask, OUT):
+                if other not in seen:
+                    seen.add(other)
+                    queue.append(other)
+        seen.discard(node)
+        return {self._ids[other] for other in seen}
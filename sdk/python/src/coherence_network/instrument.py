@@ -0,0 +1,462 @@
+"""
+Request instrumentation: phase hooks, latency histograms and exporters
+"""
+
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Phase names and NULL_TRACE live in ``phases``; they are re-exported here
+from .phases import (  # noqa: F401
+    CONNECT,
+    DECODE,
+    ENCODE,
+    NULL_TRACE,
+    RECEIVE,
+    REQUEST,
+    SEND,
+    SIGN,
+    TLS,
+    WAIT,
+)
+from .retry import route_key
+
+# httpcore trace events (minus their "connection."/"http11."/"http2." prefix)
+_HTTP_STARTS = {
+    "connect_tcp.started": CONNECT,
+    "start_tls.started": TLS,
+    "send_request_headers.started": SEND,
+    "receive_response_headers.started": WAIT,
+    "receive_response_body.started": RECEIVE,
+}
+_HTTP_ENDS = {
+    "connect_tcp.complete": CONNECT,
+    "connect_tcp.failed": CONNECT,
+    "start_tls.complete": TLS,
+    "start_tls.failed": TLS,
+    "send_request_body.complete": SEND,
+    "send_request_body.failed": SEND,
+    "receive_response_headers.complete": WAIT,
+    "receive_response_headers.failed": WAIT,
+    "receive_response_body.complete": RECEIVE,
+    "receive_response_body.failed": RECEIVE,
+}
+
+DEFAULT_PROMETHEUS_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Values below 2 ** (SUB_BITS + 1) microseconds get exact buckets; above that,
+# every power of two is split into 2 ** SUB_BITS buckets (about 3% wide).
+SUB_BITS = 5
+_SUB = 1 << SUB_BITS
+_LINEAR = _SUB << 1
+
+
+def _bucket(micros: int) -> int:
+    if micros < _LINEAR:
+        return micros
+    shift = micros.bit_length() - SUB_BITS - 1
+    return _LINEAR + (shift - 1) * _SUB + (micros >> shift) - _SUB
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    """Lowest and highest microsecond value counted in a bucket"""
+    if index < _LINEAR:
+        return index, index
+    shift = (index - _LINEAR) // _SUB + 1
+    mantissa = (index - _LINEAR) % _SUB + _SUB
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class Histogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+    
+    Durations are counted in microsecond buckets whose width grows with the
+    value, so quantiles stay within about 3% from microseconds to hours in
+    a few kilobytes. Recording is an index computation and one increment.
+    """
+    
+    def __init__(self) -> None:
+        self.counts = array("Q")
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+    
+    def record(self, seconds: float) -> None:
+        index = _bucket(max(int(seconds * 1e6), 0))
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+    
+    def merge(self, other: "Histogram") -> None:
+        """Add another histogram's counts into this one"""
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, value in enumerate(other.counts):
+            self.counts[index] += value
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding quantile ``q``, in seconds"""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for index, value in enumerate(self.counts):
+            seen += value
+            if seen >= rank:
+                return min(_bucket_bounds(index)[1] / 1e6, self.max)
+        return self.max
+    
+    def cumulative(self, bounds: Sequence[float]) -> List[int]:
+        """Number of values at or below each bound (seconds, ascending)"""
+        result = []
+        seen = 0
+        index = 0
+        counts = self.counts
+        for bound in bounds:
+            limit = bound * 1e6
+            while index < len(counts) and _bucket_bounds(index)[1] <= limit:
+                seen += counts[index]
+                index += 1
+            result.append(seen)
+        return result
+    
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": round(self.mean(), 6),
+            "p50": round(self.quantile(0.5), 6),
+            "p95": round(self.quantile(0.95), 6),
+            "p99": round(self.quantile(0.99), 6),
+            "max": round(self.max, 6),
+        }
+
+
+@dataclass
+class PhaseEvent:
+    """One timed phase of a request, passed to every hook"""
+    
+    phase: str
+    method: str
+    route: str
+    start: float  # seconds since the epoch
+    duration: float  # seconds
+    status: Optional[int] = None
+    error: Optional[str] = None
+    cached: bool = False
+    # The phases of a finished request (only on ``phase == "request"``)
+    phases: List["PhaseEvent"] = field(default_factory=list)
+
+
+Hook = Callable[[PhaseEvent], None]
+HistogramKey = Tuple[str, str, str, str]
+
+
+class _Phase:
+    __slots__ = ("_trace", "_name", "_start")
+    
+    def __init__(self, trace: "RequestTrace", name: str):
+        self._trace = trace
+        self._name = name
+    
+    def __enter__(self) -> "_Phase":
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        error = exc_type.__name__ if exc_type is not None else None
+        self._trace.record(self._name, self._start, time.perf_counter(), error)
+
+
+class RequestTrace:
+    """Timings of one ``_get``/``_post`` call, emitted when the call ends"""
+    
+    def __init__(self, instrumentation: "Instrumentation", method: str, endpoint: str):
+        self._instrumentation = instrumentation
+        self.method = method
+        self.route = route_key(endpoint)
+        self.status: Optional[int] = None
+        self.cached = False
+        self.phases: List[PhaseEvent] = []
+        self._lock = threading.Lock()
+    
+    def __enter__(self) -> "RequestTrace":
+        self._wall = time.time()
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self._instrumentation.emit(
+            PhaseEvent(
+                REQUEST,
+                self.method,
+                self.route,
+                self._wall,
+                time.perf_counter() - self._start,
+                status=self.status,
+                error=exc_type.__name__ if exc_type is not None else None,
+                cached=self.cached,
+                phases=self.phases,
+            )
+        )
+    
+    def phase(self, name: str) -> _Phase:
+        """Context manager timing one phase"""
+        return _Phase(self, name)
+    
+    def record(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a phase from two ``time.perf_counter()`` readings"""
+        event = PhaseEvent(
+            name,
+            self.method,
+            self.route,
+            self._wall + (start - self._start),
+            end - start,
+            error=error,
+        )
+        # Hedged attempts report from other threads
+        with self._lock:
+            self.phases.append(event)
+        self._instrumentation.emit(event)
+    
+    def mark_cached(self) -> None:
+        self.cached = True
+    
+    def observe(self, response: Any) -> Any:
+        """Note the status of a response and pass it through"""
+        self.status = response.status_code
+        return response
+    
+    def _on_http_event(self, started: Dict[str, float], name: str) -> None:
+        now = time.perf_counter()
+        event = name.partition(".")[2]
+        phase = _HTTP_STARTS.get(event)
+        if phase is not None:
+            started.setdefault(phase, now)
+            return
+        phase = _HTTP_ENDS.get(event)
+        if phase is not None and phase in started:
+            failed = "failed" if event.endswith(".failed") else None
+            self.record(phase, started.pop(phase), now, failed)
+    
+    def extensions(self) -> Dict[str, Any]:
+        """httpx request extensions reporting connect, TLS and transfer phases"""
+        started: Dict[str, float] = {}
+        
+        def trace(name: str, info: Dict[str, Any]) -> None:
+            self._on_http_event(started, name)
+        
+        return {"trace": trace}
+    
+    def async_extensions(self) -> Dict[str, Any]:
+        """``extensions`` for an ``httpx.AsyncClient``"""
+        started: Dict[str, float] = {}
+        
+        async def trace(name: str, info: Dict[str, Any]) -> None:
+            self._on_http_event(started, name)
+        
+        return {"trace": trace}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Instrumentation:
+    """
+    Collects request phase timings into histograms and forwards them to hooks.
+    
+    Each call through the client is split into phases: ``encode`` and
+    ``sign`` for POST bodies, ``connect`` (DNS and TCP), ``tls``, ``send``,
+    ``wait`` (server time plus a round trip), ``receive``, ``decode`` (JSON
+    and model building), and ``request`` for the whole call including
+    retries. Histograms are kept per phase, method and route; ``request``
+    histograms are also split by status. Hooks are called with a
+    ``PhaseEvent`` as each phase ends.
+    
+    A client without instrumentation skips all of this.
+    
+    Usage:
+        instrument = Instrumentation()
+        client = CoherenceClient(base_url="...", anon_key="...", instrument=instrument)
+        ...
+        print(instrument.prometheus())
+    """
+    
+    def __init__(self, hooks: Iterable[Hook] = (), histograms: bool = True):
+        """
+        Args:
+            hooks: Callables receiving every ``PhaseEvent``
+            histograms: Keep latency histograms (turn off when only hooks are needed)
+        """
+        self.hooks: List[Hook] = list(hooks)
+        self.keep_histograms = histograms
+        self.hook_errors = 0
+        self._histograms: Dict[HistogramKey, Histogram] = {}
+        self._lock = threading.Lock()
+    
+    def add_hook(self, hook: Hook) -> None:
+        self.hooks.append(hook)
+    
+    def remove_hook(self, hook: Hook) -> None:
+        self.hooks.remove(hook)
+    
+    def trace(self, method: str, endpoint: str) -> RequestTrace:
+        """Start timing one request"""
+        return RequestTrace(self, method, endpoint)
+    
+    def emit(self, event: PhaseEvent) -> None:
+        if self.keep_histograms:
+            if event.phase != REQUEST:
+                status = ""
+            elif event.cached:
+                status = "cached"
+            elif event.status is not None:
+                status = str(event.status)
+            else:
+                status = "error"
+            key = (event.phase, event.method, event.route, status)
+            with self._lock:
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram()
+                histogram.record(event.duration)
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                # A broken exporter must not fail the request being measured
+                self.hook_errors += 1
+    
+    def histograms(self) -> Dict[HistogramKey, Histogram]:
+        """Copy of every histogram, keyed by ``(phase, method, route, status)``"""
+        with self._lock:
+            copies = {}
+            for key, histogram in self._histograms.items():
+                copy = Histogram()
+                copy.merge(histogram)
+                copies[key] = copy
+            return copies
+    
+    def histogram(
+        self,
+        phase: str = REQUEST,
+        method: Optional[str] = None,
+        route: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Histogram:
+        """One histogram merging every series that matches the given labels"""
+        merged = Histogram()
+        for (p, m, r, s), histogram in self.histograms().items():
+            if p == phase and method in (None, m) and route in (None, r) and status in (None, s):
+                merged.merge(histogram)
+        return merged
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean and p50/p95/p99/max per series, keyed ``"phase METHOD route status"``"""
+        return {
+            " ".join(part for part in key if part): histogram.summary()
+            for key, histogram in sorted(self.histograms().items())
+        }
+    
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+    
+    def prometheus(
+        self,
+        name: str = "coherence_client_phase_seconds",
+        buckets: Sequence[float] = DEFAULT_PROMETHEUS_BUCKETS,
+    ) -> str:
+        """All histograms in the Prometheus text exposition format"""
+        lines = [
+            f"# HELP {name} Time spent in each phase of a Coherence Network API request",
+            f"# TYPE {name} histogram",
+        ]
+        for (phase, method, route, status), histogram in sorted(self.histograms().items()):
+            labels = f'phase="{phase}",method="{method}",route="{_escape(route)}"'
+            if status:
+                labels += f',status="{status}"'
+            for bound, count in zip(buckets, histogram.cumulative(buckets)):
+                lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook:
+    """
+    Hook exporting each finished request as an OpenTelemetry span tree.
+    
+    The request becomes a client span (a child of whatever span is current
+    when the call is made) with one child span per phase.
+    Requires ``opentelemetry-api``.
+    """
+    
+    def __init__(self, tracer: Any = None, tracer_name: str = "coherence_network"):
+        try:
+            from opentelemetry import trace
+        except ImportError:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "OpenTelemetryHook requires opentelemetry-api; "
+                "install it with `pip install coherence-network[otel]`"
+            ) from None
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer(tracer_name)
+    
+    def __call__(self, event: PhaseEvent) -> None:
+        if event.phase != REQUEST:
+            return
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.template": event.route,
+            "coherence.cached": event.cached,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        span = self.tracer.start_span(
+            f"{event.method} {event.route}",
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=int(event.start * 1e9),
+            attributes=attributes,
+        )
+        context = self._trace.set_span_in_context(span)
+        for phase in event.phases:
+            child = self.tracer.start_span(
+                phase.phase,
+                context=context,
+                start_time=int(phase.start * 1e9),
+            )
+            if phase.error:
+                child.set_status(self._trace.Status(self._trace.StatusCode.ERROR, phase.error))
+            child.end(end_time=int((phase.start + phase.duration) * 1e9))
+        if event.error or (event.status is not None and event.status >= 500):
+            description = event.error or f"HTTP {event.status}"
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, description))
+        span.end(end_time=int((event.start + event.duration) * 1e9))
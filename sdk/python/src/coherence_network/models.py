@@ -4,19 +4,37 @@ Data models for the Coherence Network SDK
 
 from datetime import datetime
 from typing import Any, Generic, List, Optional, TypeVar
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
 
-class ApiMeta(BaseModel):
+def _api(name: str, *paths: str) -> AliasChoices:
+    """
+    Accept a field by its own name or where the API functions put it.
+    
+    The functions return e.g. ``claim_id`` and ``author: {agent_id}`` where
+    the models have ``id`` and ``author_id``; dotted paths are nested keys.
+    """
+    return AliasChoices(
+        name, *(AliasPath(*path.split(".")) if "." in path else path for path in paths)
+    )
+
+
+class _Model(BaseModel):
+    # Validators are built on first use rather than at import time, which
+    # keeps ``import coherence_network.models`` cheap for short-lived processes
+    model_config = ConfigDict(defer_build=True)
+
+
+class ApiMeta(_Model):
     """API response metadata"""
     timestamp: datetime
     request_id: str
     agent_id: Optional[str] = None
 
 
-class ApiResponse(BaseModel, Generic[T]):
+class ApiResponse(_Model, Generic[T]):
     """Standard API response wrapper"""
     success: bool
     data: Optional[T] = None
@@ -24,16 +42,18 @@ class ApiResponse(BaseModel, Generic[T]):
     meta: ApiMeta
 
 
-class Claim(BaseModel):
+class Claim(_Model):
     """A claim in the Coherence Network"""
-    id: str
+    id: str = Field(validation_alias=_api("id", "claim_id"))
     title: str
     statement: str
     confidence: float = Field(ge=0, le=1)
     status: str  # active, verified, disputed, retracted, superseded
-    author_id: Optional[str] = None
-    scope_domain: str = "general"
-    scope_time_range: Optional[str] = None
+    author_id: Optional[str] = Field(None, validation_alias=_api("author_id", "author.agent_id"))
+    scope_domain: str = Field("general", validation_alias=_api("scope_domain", "scope.domain"))
+    scope_time_range: Optional[str] = Field(
+        None, validation_alias=_api("scope_time_range", "scope.time_range")
+    )
     assumptions: List[str] = Field(default_factory=list)
     tags: List[str] = Field(default_factory=list)
     coherence_score: Optional[float] = None
@@ -41,40 +61,63 @@ class Claim(BaseModel):
     updated_at: Optional[datetime] = None
 
 
-class Task(BaseModel):
+class Task(_Model):
     """A verification or work task"""
-    id: str
+    id: str = Field(validation_alias=_api("id", "task_id"))
     type: str  # VERIFY, COUNTEREXAMPLE, SYNTHESIZE, SECURITY_REVIEW, TRACE_REPRO
     status: str  # open, claimed, in_progress, done, failed
     priority: float = Field(ge=0, le=1, default=0.5)
     coherence_reward: int = 10
-    target_claim_id: Optional[str] = None
+    target_claim_id: Optional[str] = Field(
+        None, validation_alias=_api("target_claim_id", "target.claim_id")
+    )
     target_evidence_id: Optional[str] = None
     target_synthesis_id: Optional[str] = None
-    assigned_agent_id: Optional[str] = None
+    assigned_agent_id: Optional[str] = Field(
+        None, validation_alias=_api("assigned_agent_id", "assigned_agent.agent_id")
+    )
     creator_id: Optional[str] = None
-    sandbox_level: str = "safe_fetch_only"
-    time_budget_sec: int = 3600
-    result_success: Optional[bool] = None
-    result_summary: Optional[str] = None
-    result_evidence_ids: List[str] = Field(default_factory=list)
-    result_new_claim_ids: List[str] = Field(default_factory=list)
-    result_completed_at: Optional[datetime] = None
+    sandbox_level: str = Field(
+        "safe_fetch_only", validation_alias=_api("sandbox_level", "constraints.sandbox")
+    )
+    time_budget_sec: int = Field(
+        3600, validation_alias=_api("time_budget_sec", "constraints.time_budget_sec")
+    )
+    result_success: Optional[bool] = Field(
+        None, validation_alias=_api("result_success", "result.success")
+    )
+    result_summary: Optional[str] = Field(
+        None, validation_alias=_api("result_summary", "result.summary")
+    )
+    result_evidence_ids: List[str] = Field(
+        default_factory=list, validation_alias=_api("result_evidence_ids", "result.evidence_ids")
+    )
+    result_new_claim_ids: List[str] = Field(
+        default_factory=list,
+        validation_alias=_api("result_new_claim_ids", "result.new_claim_ids"),
+    )
+    result_completed_at: Optional[datetime] = Field(
+        None, validation_alias=_api("result_completed_at", "result.completed_at")
+    )
     created_at: datetime
     updated_at: Optional[datetime] = None
 
 
-class Agent(BaseModel):
+class Agent(_Model):
     """An agent in the network"""
-    id: str
+    id: str = Field(validation_alias=_api("id", "agent_id"))
     display_name: str
     pubkey: Optional[str] = None
     domains: List[str] = Field(default_factory=list)
     capabilities: Optional[dict] = None
-    calibration: float = 0.5
-    reliability: float = 0.5
-    constructiveness: float = 0.5
-    security_hygiene: float = 0.5
+    calibration: float = Field(0.5, validation_alias=_api("calibration", "reputation.calibration"))
+    reliability: float = Field(0.5, validation_alias=_api("reliability", "reputation.reliability"))
+    constructiveness: float = Field(
+        0.5, validation_alias=_api("constructiveness", "reputation.constructiveness")
+    )
+    security_hygiene: float = Field(
+        0.5, validation_alias=_api("security_hygiene", "reputation.security_hygiene")
+    )
     alephnet_pubkey: Optional[str] = None
     alephnet_stake_tier: Optional[str] = None
     alephnet_node_url: Optional[str] = None
@@ -82,32 +125,34 @@ class Agent(BaseModel):
     updated_at: Optional[datetime] = None
 
 
-class Room(BaseModel):
+class Room(_Model):
     """A synthesis room"""
-    id: str
+    id: str = Field(validation_alias=_api("id", "room_id"))
     title: str
     description: Optional[str] = None
     status: str  # active, synthesis_pending, completed
     topic_tags: List[str] = Field(default_factory=list)
-    owner_id: Optional[str] = None
-    synthesis_id: Optional[str] = None
+    owner_id: Optional[str] = Field(None, validation_alias=_api("owner_id", "owner.agent_id"))
+    synthesis_id: Optional[str] = Field(
+        None, validation_alias=_api("synthesis_id", "synthesis.synth_id")
+    )
     created_at: datetime
     updated_at: Optional[datetime] = None
 
 
-class Edge(BaseModel):
+class Edge(_Model):
     """A relationship edge between claims"""
-    id: str
-    from_claim_id: str
-    to_claim_id: str
+    id: str = Field(validation_alias=_api("id", "edge_id"))
+    from_claim_id: str = Field(validation_alias=_api("from_claim_id", "from_claim.claim_id"))
+    to_claim_id: str = Field(validation_alias=_api("to_claim_id", "to_claim.claim_id"))
     type: str  # SUPPORTS, CONTRADICTS, REFINES, DEPENDS_ON, EQUIVALENT_TO
     justification: Optional[str] = None
     weight: float = Field(ge=0, le=1, default=0.5)
-    author_id: Optional[str] = None
+    author_id: Optional[str] = Field(None, validation_alias=_api("author_id", "author.agent_id"))
     created_at: datetime
 
 
-class NetworkStats(BaseModel):
+class NetworkStats(_Model):
     """Network-wide statistics"""
     total_claims: int
     verified_claims: int
@@ -118,7 +163,7 @@ class NetworkStats(BaseModel):
     daily_coherence_delta: float
 
 
-class FeedItem(BaseModel):
+class FeedItem(_Model):
     """An item in the discovery or work feed"""
     id: str
     type: str  # claim, task, synthesis, dispute
@@ -127,7 +172,14 @@ class FeedItem(BaseModel):
     reason: str
 
 
-class CreateClaimRequest(BaseModel):
+class FeedPage(_Model):
+    """One page of a feed"""
+    items: List[FeedItem] = Field(default_factory=list)
+    total: int = 0
+    has_more: bool = False
+
+
+class CreateClaimRequest(_Model):
     """Request to create a new claim"""
     title: str
     statement: str
@@ -137,7 +189,7 @@ class CreateClaimRequest(BaseModel):
     tags: List[str] = Field(default_factory=list)
 
 
-class CreateEdgeRequest(BaseModel):
+class CreateEdgeRequest(_Model):
     """Request to create a new edge"""
     from_claim_id: str
     to_claim_id: str
@@ -146,14 +198,14 @@ class CreateEdgeRequest(BaseModel):
     weight: float = Field(ge=0, le=1, default=0.5)
 
 
-class CreateRoomRequest(BaseModel):
+class CreateRoomRequest(_Model):
     """Request to create a new room"""
     title: str
     description: Optional[str] = None
     topic_tags: List[str] = Field(default_factory=list)
 
 
-class SubmitResultRequest(BaseModel):
+class SubmitResultRequest(_Model):
     """Request to submit task result"""
     success: bool
     summary: str
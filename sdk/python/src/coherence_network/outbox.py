@@ -0,0 +1,583 @@
+"""
+Durable outbox for gateway mutations, flushed in the background
+"""
+
+import asyncio
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from .concurrency import gather_bounded
+from .decoding import decode_response
+from .encoding import encode_json
+from .ratelimit import CircuitOpenError
+from .retry import UNSENT_ERRORS
+
+if TYPE_CHECKING:
+    from .client import AsyncCoherenceClient, CoherenceClient
+
+PENDING = "pending"
+SENT = "sent"
+FAILED = "failed"
+
+DEFAULT_OUTBOX_BATCH = 64
+DEFAULT_OUTBOX_CONCURRENCY = 8
+DEFAULT_RETENTION = 24 * 3600.0
+
+# Statuses sent before a function runs (the rate limiter's 429, the
+# platform's 503 while no worker is available); any other error is final,
+# since the function does not deduplicate and may already have applied it
+RETRY_STATUSES = frozenset({429, 503})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    endpoint TEXT NOT NULL,
+    body BLOB NOT NULL,
+    signed INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    next_attempt REAL NOT NULL,
+    done_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (state, next_attempt, seq);
+"""
+
+_COLUMNS = "key, endpoint, body, signed, state, attempts, created_at, last_error"
+
+
+@dataclass
+class OutboxEntry:
+    """One queued mutation: an encoded body waiting to be signed and sent"""
+    key: str
+    endpoint: str
+    body: bytes
+    signed: bool
+    state: str = PENDING
+    attempts: int = 0
+    created_at: float = 0.0
+    last_error: Optional[str] = None
+
+
+def _entry(row: Tuple[Any, ...]) -> OutboxEntry:
+    key, endpoint, body, signed, state, attempts, created_at, last_error = row
+    return OutboxEntry(
+        key, endpoint, bytes(body), bool(signed), state, attempts, created_at, last_error
+    )
+
+
+class OutboxStore:
+    """
+    SQLite write-ahead log of outbox entries.
+    
+    Delivered entries are kept, without their body, until pruned. A mutation
+    enqueued again under the same idempotency key is therefore recognised as
+    a duplicate rather than sent twice. One process should flush a given
+    file at a time.
+    """
+    
+    def __init__(self, path: str, synchronous: str = "NORMAL"):
+        """
+        Args:
+            path: Database file; ``":memory:"`` keeps the queue in memory only
+            synchronous: SQLite ``synchronous`` level. ``"NORMAL"`` (with WAL)
+                survives a process crash; ``"FULL"`` also survives power loss
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(f"PRAGMA synchronous={synchronous}")
+        self._db.execute("PRAGMA busy_timeout=5000")
+        self._db.executescript(_SCHEMA)
+    
+    def add(self, entry: OutboxEntry) -> bool:
+        """Append ``entry``; False if its key is already queued or was delivered"""
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO outbox "
+                "(key, endpoint, body, signed, state, created_at, next_attempt) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.key,
+                    entry.endpoint,
+                    entry.body,
+                    int(entry.signed),
+                    PENDING,
+                    entry.created_at,
+                    entry.created_at,
+                ),
+            )
+            return cursor.rowcount == 1
+    
+    def due(self, limit: int, now: float) -> List[OutboxEntry]:
+        """Pending entries whose next attempt is due, oldest first"""
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE state = ? AND next_attempt <= ? "
+                "ORDER BY seq LIMIT ?",
+                (PENDING, now, limit),
+            ).fetchall()
+        return [_entry(row) for row in rows]
+    
+    def next_due(self) -> Optional[float]:
+        """When the earliest pending entry is due, or None if nothing is pending"""
+        with self._lock:
+            (value,) = self._db.execute(
+                "SELECT MIN(next_attempt) FROM outbox WHERE state = ?", (PENDING,)
+            ).fetchone()
+        return value
+    
+    def record(
+        self,
+        sent: List[str],
+        retries: List[Tuple[str, float, str]],
+        failed: List[Tuple[str, str]],
+        now: float,
+    ) -> None:
+        """
+        Apply the outcome of one flushed batch in a single transaction.
+        
+        Args:
+            sent: Keys delivered
+            retries: ``(key, next_attempt, error)`` for entries to try again
+            failed: ``(key, error)`` for entries given up on
+            now: Current time
+        """
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "UPDATE outbox SET state = ?, body = X'', attempts = attempts + 1, "
+                    "done_at = ?, last_error = NULL WHERE key = ?",
+                    [(SENT, now, key) for key in sent],
+                )
+                self._db.executemany(
+                    "UPDATE outbox SET attempts = attempts + 1, next_attempt = ?, "
+                    "last_error = ? WHERE key = ?",
+                    [(when, error, key) for key, when, error in retries],
+                )
+                self._db.executemany(
+                    "UPDATE outbox SET state = ?, attempts = attempts + 1, done_at = ?, "
+                    "last_error = ? WHERE key = ?",
+                    [(FAILED, now, error, key) for key, error in failed],
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+    
+    def count(self, state: str = PENDING) -> int:
+        with self._lock:
+            (value,) = self._db.execute(
+                "SELECT COUNT(*) FROM outbox WHERE state = ?", (state,)
+            ).fetchone()
+        return value
+    
+    def failed(self) -> List[OutboxEntry]:
+        """Entries given up on, oldest first"""
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE state = ? ORDER BY seq", (FAILED,)
+            ).fetchall()
+        return [_entry(row) for row in rows]
+    
+    def requeue_failed(self, now: float) -> int:
+        """Move failed entries back to pending, with fresh attempt counts"""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE outbox SET state = ?, attempts = 0, next_attempt = ?, done_at = NULL "
+                "WHERE state = ?",
+                (PENDING, now, FAILED),
+            )
+            return cursor.rowcount
+    
+    def prune(self, before: float) -> int:
+        """Forget delivered entries finished before ``before``"""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM outbox WHERE state = ? AND done_at < ?", (SENT, before)
+            )
+            return cursor.rowcount
+    
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def queued_response(key: str, duplicate: bool, mode: str) -> Any:
+    """
+    Envelope returned by a gateway call that was queued instead of sent.
+    
+    ``data`` is ``{"status": "queued" | "duplicate", "idempotency_key": key}``,
+    decoded in the client's decode mode like a real response.
+    """
+    envelope = {
+        "success": True,
+        "data": {"status": "duplicate" if duplicate else "queued", "idempotency_key": key},
+        "error": None,
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "request_id": key,
+        },
+    }
+    return decode_response(encode_json(envelope), Dict[str, Any], mode)
+
+
+def _response_error(response: httpx.Response) -> str:
+    try:
+        error = response.json().get("error")
+    except ValueError:
+        error = None
+    return f"HTTP {response.status_code}: {error or response.reason_phrase}"
+
+
+class Outbox:
+    """
+    Write-ahead queue that takes gateway mutations off the request path.
+    
+    With an outbox, ``gateway.submit_result``, ``create_claim`` and
+    ``create_edge`` append the encoded body to a local SQLite log and return
+    at once with a ``"queued"`` envelope. A background flusher reads due
+    entries in batches, signs each one at send time (so the gateway's
+    timestamp window is met) and sends them ``concurrency`` at a time.
+    
+    The idempotency key only deduplicates locally: enqueueing a key the log
+    already holds is a no-op. The gateway does not read the key, so an
+    entry is only retried (with exponential backoff) when it cannot have
+    been applied: a connect error, an open circuit, or a 429 or 503 sent
+    before the function ran. Anything else, including a read timeout, is
+    final and kept for inspection in ``failed()``. Anything still pending
+    when the process stops is replayed when an outbox is next opened on
+    the file.
+    
+    Usage:
+        outbox = Outbox("agent-outbox.db")
+        client = CoherenceClient(base_url=..., anon_key=..., auth=auth, outbox=outbox)
+        client.gateway.submit_result(task_id, True, "done")  # returns immediately
+        outbox.flush(timeout=30)
+        client.close()
+    
+    Sync clients flush from a background thread; async clients from a task
+    on their event loop.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_OUTBOX_BATCH,
+        concurrency: int = DEFAULT_OUTBOX_CONCURRENCY,
+        max_attempts: int = 10,
+        backoff_base: float = 0.5,
+        backoff_max: float = 60.0,
+        linger: float = 0.005,
+        retention: float = DEFAULT_RETENTION,
+        synchronous: str = "NORMAL",
+    ):
+        """
+        Args:
+            path: SQLite file holding the queue (``":memory:"`` is not durable)
+            batch_size: Entries read and sent per flush round
+            concurrency: Sends in flight at once
+            max_attempts: Attempts before an entry is marked failed
+            backoff_base: Delay before the second attempt, doubled each time
+            backoff_max: Longest delay between attempts
+            linger: Seconds to wait after a wake-up so entries enqueued
+                together go out in one batch
+            retention: Seconds a delivered key is remembered, so enqueueing it
+                again is still a no-op
+            synchronous: SQLite durability level, see ``OutboxStore``
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.store = OutboxStore(path, synchronous)
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.linger = linger
+        self.retention = retention
+        self.sent = 0
+        self.retried = 0
+        self.failures = 0
+        self.duplicates = 0
+        self._client: Optional[Union["CoherenceClient", "AsyncCoherenceClient"]] = None
+        self._async = False
+        self._closed = False
+        self._pruned_at = 0.0
+        self._progress = threading.Condition()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._async_wake: Optional[asyncio.Event] = None
+    
+    def __len__(self) -> int:
+        """Entries still waiting to be delivered"""
+        return self.store.count(PENDING)
+    
+    def attach(self, client: Union["CoherenceClient", "AsyncCoherenceClient"]) -> None:
+        """Bind the client whose credentials sign and send the entries (done by the client)"""
+        if self._client is not None and self._client is not client:
+            raise ValueError("Outbox is already attached to another client")
+        self._client = client
+        self._async = asyncio.iscoroutinefunction(client._send_post)
+        if not self._async:
+            self.start()
+    
+    def start(self) -> None:
+        """
+        Start the flusher, replaying whatever the file still holds.
+        
+        Sync clients start it on ``attach``. Async clients start it on the
+        first enqueue or ``aflush``; call this from the event loop to replay
+        a backlog sooner.
+        """
+        if self._client is None:
+            raise RuntimeError("Outbox is not attached to a client")
+        if self._closed:
+            raise RuntimeError("Outbox is closed")
+        if self._async:
+            if self._task is None or self._task.done():
+                self._async_wake = asyncio.Event()
+                self._task = asyncio.ensure_future(self._arun())
+        elif self._thread is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="coherence-outbox"
+            )
+            self._thread = threading.Thread(
+                target=self._run, name="coherence-outbox-flusher", daemon=True
+            )
+            self._thread.start()
+    
+    def enqueue(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        use_ed25519: bool = True,
+        idempotency_key: Optional[str] = None,
+    ) -> Tuple[str, bool]:
+        """
+        Append a mutation to the log and wake the flusher.
+        
+        Args:
+            endpoint: Gateway path, e.g. ``"/agent-gateway/submit-result"``
+            data: Request body; encoded now, signed when sent
+            use_ed25519: Sign with the client's Ed25519 key at send time
+            idempotency_key: Key deduplicating enqueues into this log
+                (default: a new random key)
+        
+        Returns:
+            ``(idempotency_key, duplicate)``; a duplicate is not queued again
+        """
+        key = idempotency_key or uuid.uuid4().hex
+        entry = OutboxEntry(key, endpoint, encode_json(data), use_ed25519, created_at=time.time())
+        added = self.store.add(entry)
+        if not added:
+            self.duplicates += 1
+        elif self._async:
+            if self._task is None:
+                self.start()
+            self._async_wake.set()
+        else:
+            self._wake.set()
+        return key, not added
+    
+    def failed(self) -> List[OutboxEntry]:
+        """Entries that were given up on, with their last error"""
+        return self.store.failed()
+    
+    def requeue_failed(self) -> int:
+        """Send failed entries again (e.g. after fixing credentials)"""
+        count = self.store.requeue_failed(time.time())
+        self._wake.set()
+        if self._async_wake is not None:
+            self._async_wake.set()
+        return count
+    
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * 2 ** max(attempts - 1, 0))
+        return random.uniform(delay / 2, delay)
+    
+    def _classify(
+        self,
+        entry: OutboxEntry,
+        outcome: Union[httpx.Response, BaseException],
+    ) -> Tuple[str, Optional[str]]:
+        """``(SENT | PENDING | FAILED, error)`` for one delivery attempt"""
+        if isinstance(outcome, httpx.Response):
+            if outcome.status_code < 300:
+                return SENT, None
+            error = _response_error(outcome)
+            retry = outcome.status_code in RETRY_STATUSES
+        elif isinstance(outcome, (CircuitOpenError,) + UNSENT_ERRORS):
+            error, retry = str(outcome) or type(outcome).__name__, True
+        else:
+            # Including read timeouts and resets, which may follow a committed write
+            error, retry = f"{type(outcome).__name__}: {outcome}", False
+        if retry and entry.attempts + 1 < self.max_attempts:
+            return PENDING, error
+        return FAILED, error
+    
+    def _apply(
+        self,
+        entries: List[OutboxEntry],
+        outcomes: List[Union[httpx.Response, BaseException]],
+    ) -> None:
+        now = time.time()
+        sent: List[str] = []
+        retries: List[Tuple[str, float, str]] = []
+        failed: List[Tuple[str, str]] = []
+        for entry, outcome in zip(entries, outcomes):
+            state, error = self._classify(entry, outcome)
+            if state == SENT:
+                sent.append(entry.key)
+            elif state == PENDING:
+                retries.append((entry.key, now + self._backoff(entry.attempts + 1), error))
+            else:
+                failed.append((entry.key, error))
+        self.store.record(sent, retries, failed, now)
+        self.sent += len(sent)
+        self.retried += len(retries)
+        self.failures += len(failed)
+        if now - self._pruned_at > 60:
+            self._pruned_at = now
+            self.store.prune(now - self.retention)
+    
+    def _idle_wait(self) -> Optional[float]:
+        next_due = self.store.next_due()
+        return None if next_due is None else max(0.0, next_due - time.time())
+    
+    def _deliver(self, entry: OutboxEntry) -> Union[httpx.Response, BaseException]:
+        client = self._client
+        try:
+            headers = client._post_headers(entry.body, entry.signed, entry.key)
+            return client._send_post(entry.endpoint, entry.body, headers, False)
+        except Exception as exc:
+            return exc
+    
+    def _flush_once(self) -> bool:
+        entries = self.store.due(self.batch_size, time.time())
+        if not entries:
+            return False
+        outcomes = list(self._executor.map(self._deliver, entries))
+        self._apply(entries, outcomes)
+        with self._progress:
+            self._progress.notify_all()
+        return True
+    
+    def _run(self) -> None:
+        while not self._closed:
+            try:
+                if self._flush_once():
+                    continue
+            except sqlite3.Error:
+                if self._closed:
+                    return
+                time.sleep(self.backoff_base)  # e.g. the file is locked; try again
+                continue
+            self._wake.wait(self._idle_wait())
+            self._wake.clear()
+            if self.linger and not self._closed:
+                time.sleep(self.linger)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every pending entry is delivered or given up on.
+        
+        Returns:
+            True if nothing is pending, False if ``timeout`` ran out first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._progress:
+            while self.store.count(PENDING):
+                self._wake.set()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._progress.wait(0.05 if remaining is None else min(remaining, 0.05))
+        return True
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the flusher after its current batch and close the log.
+        
+        Pending entries stay in the file and are replayed by the next
+        outbox opened on it. Call ``flush`` first to drain instead.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._executor.shutdown()
+        if self._task is not None:
+            self._task.cancel()
+        self.store.close()
+    
+    async def _adeliver(self, entry: OutboxEntry) -> Union[httpx.Response, BaseException]:
+        client = self._client
+        try:
+            headers = client._post_headers(entry.body, entry.signed, entry.key)
+            return await client._send_post(entry.endpoint, entry.body, headers, False)
+        except Exception as exc:
+            return exc
+    
+    async def _arun(self) -> None:
+        while not self._closed:
+            entries = self.store.due(self.batch_size, time.time())
+            if entries:
+                outcomes = await gather_bounded(
+                    (self._adeliver(entry) for entry in entries), self.concurrency
+                )
+                self._apply(entries, outcomes)
+                continue
+            try:
+                await asyncio.wait_for(self._async_wake.wait(), self._idle_wait())
+            except asyncio.TimeoutError:
+                pass
+            self._async_wake.clear()
+            if self.linger:
+                await asyncio.sleep(self.linger)
+    
+    async def aflush(self, timeout: Optional[float] = None) -> bool:
+        """Async counterpart of ``flush``, for outboxes attached to an async client"""
+        if self._task is None:
+            self.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.store.count(PENDING):
+            if self._task.done():
+                self._task.result()  # surface a crashed flusher
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            self._async_wake.set()
+            await asyncio.sleep(0.01)
+        return True
+    
+    async def aclose(self) -> None:
+        """Async counterpart of ``close``"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.store.close()
@@ -0,0 +1,110 @@
+"""
+Lazy, auto-paginating iterators over offset-based list endpoints
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List
+
+from .decoding import envelope_data, envelope_success
+from .exceptions import ApiError
+from .models import ApiResponse
+
+DEFAULT_PAGE_SIZE = 100
+
+PageFetcher = Callable[[int, int], ApiResponse]
+AsyncPageFetcher = Callable[[int, int], Awaitable[ApiResponse]]
+
+
+def page_items(response: ApiResponse) -> List[Any]:
+    """Extract the list of items from a page response, raising on API errors"""
+    if not envelope_success(response):
+        raise ApiError.from_response(response)
+    return envelope_data(response) or []
+
+
+def iter_items(
+    fetch_page: PageFetcher,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = False,
+    start_offset: int = 0,
+) -> Iterator[Any]:
+    """
+    Yield every item from an offset-paginated endpoint, one page at a time.
+    
+    Only the current page (and, with ``prefetch``, the next one) is held in
+    memory. Iteration stops at the first page shorter than ``page_size``.
+    
+    Args:
+        fetch_page: Callable taking ``(limit, offset)`` and returning a page response
+        page_size: Number of items to request per page
+        prefetch: Fetch page N+1 on a background thread while page N is consumed
+        start_offset: Offset of the first item to fetch
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    
+    offset = start_offset
+    if not prefetch:
+        while True:
+            items = page_items(fetch_page(page_size, offset))
+            yield from items
+            if len(items) < page_size:
+                return
+            offset += page_size
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(fetch_page, page_size, offset)
+        try:
+            while True:
+                items = page_items(pending.result())
+                offset += page_size
+                if len(items) < page_size:
+                    yield from items
+                    return
+                pending = executor.submit(fetch_page, page_size, offset)
+                yield from items
+        finally:
+            pending.cancel()
+
+
+async def aiter_items(
+    fetch_page: AsyncPageFetcher,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = False,
+    start_offset: int = 0,
+) -> AsyncIterator[Any]:
+    """
+    Async counterpart of ``iter_items``.
+    
+    With ``prefetch``, the request for page N+1 runs as a task on the event
+    loop while the caller consumes page N.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    
+    offset = start_offset
+    if not prefetch:
+        while True:
+            items = page_items(await fetch_page(page_size, offset))
+            for item in items:
+                yield item
+            if len(items) < page_size:
+                return
+            offset += page_size
+    
+    pending = asyncio.ensure_future(fetch_page(page_size, offset))
+    try:
+        while True:
+            items = page_items(await pending)
+            offset += page_size
+            if len(items) < page_size:
+                for item in items:
+                    yield item
+                return
+            pending = asyncio.ensure_future(fetch_page(page_size, offset))
+            for item in items:
+                yield item
+    finally:
+        if not pending.done():
+            pending.cancel()
@@ -0,0 +1,60 @@
+"""
+Request phase names and the no-op trace used while a client is uninstrumented
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .instrument import RequestTrace
+
+# Phases of one request, in the order they happen
+ENCODE = "encode"
+SIGN = "sign"
+CONNECT = "connect"  # DNS lookup and TCP connect
+TLS = "tls"
+SEND = "send"
+WAIT = "wait"  # request sent until response headers: server time plus one round trip
+RECEIVE = "receive"
+DECODE = "decode"
+REQUEST = "request"  # the whole call, including retries
+
+
+class _NullPhase:
+    __slots__ = ()
+    
+    def __enter__(self) -> "_NullPhase":
+        return self
+    
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _NullTrace:
+    """Stand-in used while instrumentation is off; every method is a no-op"""
+    
+    __slots__ = ()
+    _phase = _NullPhase()
+    
+    def __enter__(self) -> "_NullTrace":
+        return self
+    
+    def __exit__(self, *args: Any) -> None:
+        return None
+    
+    def phase(self, name: str) -> _NullPhase:
+        return self._phase
+    
+    def mark_cached(self) -> None:
+        return None
+    
+    def observe(self, response: Any) -> Any:
+        return response
+    
+    def extensions(self) -> None:
+        return None
+    
+    def async_extensions(self) -> None:
+        return None
+
+
+NULL_TRACE: "RequestTrace" = _NullTrace()  # type: ignore[assignment]
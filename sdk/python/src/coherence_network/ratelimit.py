@@ -0,0 +1,312 @@
+"""
+Adaptive client-side rate limiting and circuit breaking
+"""
+
+import asyncio
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import astuple, dataclass
+from typing import Callable, Dict, Iterator, Optional
+
+from .exceptions import CoherenceError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class CircuitOpenError(CoherenceError):
+    """The circuit breaker for a base URL is open; the request was not sent"""
+    
+    def __init__(self, key: str, retry_in: float):
+        super().__init__(f"Circuit open for {key}; retry in {retry_in:.1f}s")
+        self.key = key
+        self.retry_in = retry_in
+
+
+@dataclass
+class LimitState:
+    """
+    Shared state for one token bucket or one circuit breaker.
+    
+    Buckets use ``tokens``, ``updated`` and ``rate``; breakers use
+    ``failures``, ``opened_at`` and ``probe_until``. A NaN ``rate`` marks a
+    record that has not been initialised yet.
+    """
+    
+    tokens: float = 0.0
+    updated: float = 0.0
+    rate: float = math.nan
+    failures: float = 0.0
+    opened_at: float = 0.0
+    probe_until: float = 0.0
+
+
+class LimiterStore(ABC):
+    """Where limiter and breaker state lives; ``update`` runs atomically per store"""
+    
+    @abstractmethod
+    def update(self, key: str, fn: Callable[[LimitState], float]) -> float:
+        """Apply ``fn`` to the state for ``key`` under the store's lock and return its result"""
+
+
+class MemoryLimiterStore(LimiterStore):
+    """State shared by the threads and asyncio tasks of one process"""
+    
+    def __init__(self) -> None:
+        self._states: Dict[str, LimitState] = {}
+        self._lock = threading.Lock()
+    
+    def update(self, key: str, fn: Callable[[LimitState], float]) -> float:
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = LimitState()
+            return fn(state)
+
+
+MAGIC = b"CNLIMIT1"
+_HEADER = struct.Struct("<8sQ")
+HEADER_SIZE = 16
+
+# Each slot is a key hash followed by the six LimitState fields.
+_SLOT = struct.Struct("<Q6d")
+DEFAULT_FILE_SLOTS = 256
+
+
+def _hash(value: str) -> int:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return max(int.from_bytes(digest, "little"), 1)
+
+
+class FileLimiterStore(LimiterStore):
+    """
+    State shared by every process on a host through a memory-mapped file.
+    
+    Slots form a fixed open-addressed table keyed by a hash of the bucket or
+    breaker name. Updates serialize on an ``fcntl`` lock on the file and a
+    thread lock within the process. Without ``fcntl`` (Windows) the file is
+    still shared, but updates are only atomic within one process.
+    """
+    
+    def __init__(self, path: str, slots: int = DEFAULT_FILE_SLOTS):
+        """
+        Args:
+            path: State file; created if missing, reused if another process made it
+            slots: Table size for a new file (distinct buckets plus breakers)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._file_lock():
+            if os.fstat(self._fd).st_size < HEADER_SIZE:
+                os.ftruncate(self._fd, HEADER_SIZE + slots * _SLOT.size)
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, _HEADER.pack(MAGIC, slots))
+            self._map = mmap.mmap(self._fd, 0)
+        magic, self.slots = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise CoherenceError(f"{path} is not a rate limiter state file")
+    
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        if fcntl is None:  # pragma: no cover - Windows
+            yield
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+    
+    def _slot(self, key_hash: int) -> int:
+        for probe in range(self.slots):
+            offset = HEADER_SIZE + ((key_hash + probe) % self.slots) * _SLOT.size
+            stored = struct.unpack_from("<Q", self._map, offset)[0]
+            if stored == key_hash:
+                return offset
+            if stored == 0:
+                _SLOT.pack_into(self._map, offset, key_hash, *astuple(LimitState()))
+                return offset
+        raise CoherenceError(f"{self.path} is full; recreate it with more slots")
+    
+    def update(self, key: str, fn: Callable[[LimitState], float]) -> float:
+        with self._lock, self._file_lock():
+            offset = self._slot(_hash(key))
+            state = LimitState(*_SLOT.unpack_from(self._map, offset)[1:])
+            result = fn(state)
+            _SLOT.pack_into(self._map, offset, _hash(key), *astuple(state))
+            return result
+    
+    def close(self) -> None:
+        """Unmap and close the state file"""
+        self._map.close()
+        os.close(self._fd)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket per endpoint family whose rate adapts to 429 responses.
+    
+    Callers reserve a token and sleep until it is due, so waiters queue in
+    order instead of retrying in lockstep. The rate follows AIMD: every 429
+    multiplies it by ``decrease``, and every success adds ``increase /
+    rate``. The rate therefore climbs back about ``increase`` tokens/s per
+    second of clean traffic instead of jumping straight back to full speed.
+    
+    Share one limiter (or one ``FileLimiterStore``) between clients, threads
+    and processes that talk to the same server.
+    """
+    
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[float] = None,
+        rates: Optional[Dict[str, float]] = None,
+        min_rate: float = 0.2,
+        max_rate: Optional[float] = None,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        store: Optional[LimiterStore] = None,
+    ):
+        """
+        Args:
+            rate: Starting requests per second for each endpoint family
+            burst: Bucket capacity (default: one second of ``rate``)
+            rates: Starting rate per endpoint family, e.g. ``{"/api-tasks": 2}``
+            min_rate: Floor the rate never drops below
+            max_rate: Ceiling for additive increase (default: the starting rate)
+            increase: Additive increase, in requests per second per second
+            decrease: Multiplicative factor applied on each 429
+            store: Shared state backend (default: in-process memory)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.rates = rates or {}
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.store = store or MemoryLimiterStore()
+    
+    def _initial(self, key: str) -> float:
+        return self.rates.get(key, self.rate)
+    
+    def _capacity(self, key: str) -> float:
+        return self.burst if self.burst is not None else max(1.0, self._initial(key))
+    
+    def _refill(self, key: str, state: LimitState, now: float) -> None:
+        if math.isnan(state.rate):
+            state.rate = self._initial(key)
+            state.tokens = self._capacity(key)
+        else:
+            elapsed = max(0.0, now - state.updated)
+            state.tokens = min(self._capacity(key), state.tokens + elapsed * state.rate)
+        state.updated = now
+    
+    def reserve(self, key: str) -> float:
+        """Take a token for ``key``; returns how long to wait before sending"""
+        def take(state: LimitState) -> float:
+            self._refill(key, state, time.time())
+            state.tokens -= 1.0
+            return 0.0 if state.tokens >= 0 else -state.tokens / state.rate
+        
+        return self.store.update(f"bucket:{key}", take)
+    
+    def acquire(self, key: str) -> None:
+        """Block until a request to ``key`` may be sent"""
+        delay = self.reserve(key)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self, key: str) -> None:
+        """Wait without blocking the event loop until a request to ``key`` may be sent"""
+        delay = self.reserve(key)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def record(self, key: str, status_code: int) -> None:
+        """Adapt the rate for ``key`` to a response status"""
+        def adapt(state: LimitState) -> float:
+            self._refill(key, state, time.time())
+            if status_code == 429:
+                state.rate = max(self.min_rate, state.rate * self.decrease)
+                state.tokens = min(state.tokens, 0.0)
+            elif status_code < 500:
+                ceiling = self.max_rate if self.max_rate is not None else self._initial(key)
+                state.rate = min(ceiling, state.rate + self.increase / state.rate)
+            return state.rate
+        
+        self.store.update(f"bucket:{key}", adapt)
+    
+    def current_rate(self, key: str) -> float:
+        """Current requests per second allowed for ``key``"""
+        def read(state: LimitState) -> float:
+            self._refill(key, state, time.time())
+            return state.rate
+        
+        return self.store.update(f"bucket:{key}", read)
+
+
+class CircuitBreaker:
+    """
+    Stops sending to a base URL after repeated failures.
+    
+    After ``failure_threshold`` consecutive 5xx responses or network errors,
+    the circuit opens and requests fail fast with ``CircuitOpenError``. Once
+    ``recovery_time`` has passed, exactly one caller (across every process
+    sharing the store) is let through as a probe. Success closes the circuit;
+    failure reopens it for another ``recovery_time``.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 10.0,
+        store: Optional[LimiterStore] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.store = store or MemoryLimiterStore()
+    
+    def before_request(self, key: str) -> None:
+        """Raise ``CircuitOpenError`` unless a request to ``key`` may go out"""
+        def check(state: LimitState) -> float:
+            if not state.opened_at:
+                return 0.0
+            now = time.time()
+            reopen_at = state.opened_at + self.recovery_time
+            if now < reopen_at:
+                return reopen_at - now
+            if now < state.probe_until:
+                return state.probe_until - now
+            state.probe_until = now + self.recovery_time
+            return 0.0
+        
+        retry_in = self.store.update(f"circuit:{key}", check)
+        if retry_in > 0:
+            raise CircuitOpenError(key, retry_in)
+    
+    def record(self, key: str, success: bool) -> None:
+        """Record the outcome of a request to ``key``"""
+        def update(state: LimitState) -> float:
+            if success:
+                state.failures = 0.0
+                state.opened_at = 0.0
+                state.probe_until = 0.0
+            else:
+                state.failures += 1
+                if state.opened_at or state.failures >= self.failure_threshold:
+                    state.opened_at = time.time()
+                    state.probe_until = 0.0
+            return state.failures
+        
+        self.store.update(f"circuit:{key}", update)
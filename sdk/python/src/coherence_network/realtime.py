@@ -0,0 +1,261 @@
+"""
+Realtime event subscriptions over the agent-gateway SSE stream
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import httpx
+
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from .client import AsyncCoherenceClient
+
+TASK_CREATED = "task_created"
+TASK_CLAIMED = "task_claimed"
+TASK_COMPLETED = "task_completed"
+CLAIM_CREATED = "claim_created"
+# Payload: {"status": new, "previous_status": old}; logged by a trigger on claims
+CLAIM_STATUS_CHANGED = "claim_status_changed"
+EDGE_CREATED = "edge_created"
+AGENT_REGISTERED = "agent_registered"
+
+TASK_EVENTS = (TASK_CREATED, TASK_CLAIMED, TASK_COMPLETED)
+CLAIM_EVENTS = (CLAIM_CREATED, CLAIM_STATUS_CHANGED)
+
+# Delivered when the server could not replay everything missed since the
+# cursor; events between the gap's cursor and the next event were lost
+GAP = "gap"
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+
+# The server sends a keepalive comment every 30s; a silent minute means the
+# connection is dead even if the socket is still open.
+DEFAULT_READ_TIMEOUT = 75.0
+_RECONNECT = RetryPolicy(backoff_base=0.5, backoff_max=30.0)
+
+
+@dataclass
+class Event:
+    """One row of ``alephnet_events`` pushed by the gateway"""
+    
+    id: Optional[str]
+    event_type: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    source_agent_id: Optional[str] = None
+    target_claim_id: Optional[str] = None
+    target_task_id: Optional[str] = None
+    created_at: Optional[str] = None
+    cursor: Optional[str] = None
+
+
+class Subscription:
+    """
+    Async iterator over gateway events with reconnect, resume and backpressure.
+    
+    A background reader keeps one SSE connection open. Every event carries a
+    cursor. After a disconnect, the reader reconnects with exponential
+    backoff and sends the last cursor as ``Last-Event-ID``, so the server
+    replays whatever was missed.
+    
+    Events pass through a bounded queue. With ``overflow="block"`` a slow
+    consumer pauses the reader, which stops reading the socket and pushes
+    back on the server. With ``"drop_oldest"`` the oldest queued events are
+    discarded and counted in ``dropped``.
+    
+    The server replays at most a fixed number of missed events. When more
+    were missed, the subscription yields an event of type ``GAP`` (whatever
+    ``event_types`` says) and counts it in ``gaps``; state built from the
+    stream should then be resynced from the API.
+    
+    Usage:
+        async with client.gateway.subscribe([TASK_CREATED]) as events:
+            async for event in events:
+                if event.event_type == GAP:
+                    ...  # resync
+    """
+    
+    def __init__(
+        self,
+        client: "AsyncCoherenceClient",
+        event_types: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+        max_queue: int = 1000,
+        overflow: str = OVERFLOW_BLOCK,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        reconnect: RetryPolicy = _RECONNECT,
+    ):
+        """
+        Args:
+            client: Client whose connection pool and credentials are used
+            event_types: Only deliver these event types (default: all)
+            cursor: Resume after this cursor (``Event.cursor`` from an earlier run)
+            max_queue: Events buffered between the reader and the consumer
+            overflow: ``"block"`` or ``"drop_oldest"`` when the buffer is full
+            read_timeout: Reconnect if nothing, not even a keepalive, arrives for this long
+            reconnect: Backoff between reconnect attempts
+        """
+        if overflow not in (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST):
+            raise ValueError(f"overflow must be 'block' or 'drop_oldest', got {overflow!r}")
+        
+        self._client = client
+        self.event_types = tuple(event_types) if event_types else None
+        self.cursor = cursor
+        self.overflow = overflow
+        self.read_timeout = read_timeout
+        self.reconnect = reconnect
+        self.connects = 0
+        self.dropped = 0
+        self.gaps = 0
+        self.last_error: Optional[BaseException] = None
+        # ``None`` in the queue marks the end of the stream
+        self._queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue(max_queue)
+        self._failure: Optional[BaseException] = None
+        self._reader: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+    
+    def _request_headers(self) -> Dict[str, str]:
+        headers = self._client._get_headers()
+        headers["Accept"] = "text/event-stream"
+        if self.cursor:
+            headers["Last-Event-ID"] = self.cursor
+        return headers
+    
+    def _url(self) -> str:
+        url = f"{self._client.base_url}/agent-gateway/events"
+        if self.event_types:
+            url += "?types=" + ",".join(self.event_types)
+        return url
+    
+    async def _deliver(self, event: Event) -> None:
+        if self.overflow == OVERFLOW_DROP_OLDEST:
+            while self._queue.full():
+                self._queue.get_nowait()
+                self.dropped += 1
+            self._queue.put_nowait(event)
+        else:
+            await self._queue.put(event)
+    
+    async def _dispatch(self, data: List[str], event_id: Optional[str]) -> None:
+        try:
+            message = json.loads("\n".join(data))
+        except ValueError:
+            return
+        if not isinstance(message, dict):
+            return
+        if message.get("type") == GAP:
+            self.gaps += 1
+            self.cursor = event_id or message.get("cursor") or self.cursor
+            replayed = message.get("replayed")
+            await self._deliver(
+                Event(id=None, event_type=GAP, payload={"replayed": replayed}, cursor=self.cursor)
+            )
+            return
+        if message.get("type") != "event":
+            return
+        event_type = message.get("event_type", "")
+        if self.event_types and event_type not in self.event_types:
+            return
+        if event_id:
+            self.cursor = event_id
+        await self._deliver(
+            Event(
+                id=message.get("id"),
+                event_type=event_type,
+                payload=message.get("payload") or {},
+                source_agent_id=message.get("source_agent_id"),
+                target_claim_id=message.get("target_claim_id"),
+                target_task_id=message.get("target_task_id"),
+                created_at=message.get("created_at"),
+                cursor=event_id,
+            )
+        )
+    
+    async def _read_stream(self) -> None:
+        timeout = httpx.Timeout(self._client.timeout, read=self.read_timeout)
+        async with self._client._http.stream(
+            "GET", self._url(), headers=self._request_headers(), timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            self.connects += 1
+            data: List[str] = []
+            event_id: Optional[str] = None
+            async for line in response.aiter_lines():
+                if not line:
+                    if data:
+                        await self._dispatch(data, event_id)
+                    data, event_id = [], None
+                elif line.startswith(":"):
+                    continue
+                else:
+                    name, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if name == "data":
+                        data.append(value)
+                    elif name == "id":
+                        event_id = value
+    
+    async def _run(self) -> None:
+        attempt = 0
+        while not self._closed:
+            connects = self.connects
+            try:
+                await self._read_stream()
+            except asyncio.CancelledError:
+                raise
+            except httpx.HTTPStatusError as exc:
+                self.last_error = exc
+                status = exc.response.status_code
+                if 400 <= status < 500 and status not in (408, 429):
+                    # Bad credentials or URL: retrying will not help
+                    self._failure = exc
+                    self._closed = True
+                    await self._queue.put(None)
+                    return
+            except (httpx.HTTPError, OSError) as exc:
+                self.last_error = exc
+            if self._closed:
+                return
+            # Back off from the first failure; a stream that was up resets the count
+            attempt = 1 if self.connects > connects else attempt + 1
+            await asyncio.sleep(self.reconnect.backoff(attempt))
+    
+    def start(self) -> "Subscription":
+        """Start the background reader (done automatically on first iteration)"""
+        if self._reader is None:
+            self._reader = asyncio.ensure_future(self._run())
+        return self
+    
+    async def close(self) -> None:
+        """Stop the reader and drop the connection"""
+        self._closed = True
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        if not self._queue.full():
+            self._queue.put_nowait(None)
+    
+    def __aiter__(self) -> AsyncIterator[Event]:
+        return self
+    
+    async def __anext__(self) -> Event:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        self.start()
+        event = await self._queue.get()
+        if event is None:
+            if self._failure is not None:
+                raise self._failure
+            raise StopAsyncIteration
+        return event
+    
+    async def __aenter__(self) -> "Subscription":
+        return self.start()
+    
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
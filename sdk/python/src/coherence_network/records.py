@@ -0,0 +1,264 @@
+"""
+Compact slotted records for large result sets
+"""
+
+import sys
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import AliasChoices, AliasPath, BaseModel
+
+# Fields with a small vocabulary (statuses, types, tags). Their strings are
+# interned, so 100k records share one ``"active"`` instead of holding 100k.
+INTERNED_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "type",
+        "status",
+        "scope_domain",
+        "sandbox_level",
+        "alephnet_stake_tier",
+        "tags",
+        "topic_tags",
+        "domains",
+    }
+)
+
+_intern = sys.intern
+
+# Marks a field that none of its key paths found in a record
+MISSING: Any = object()
+
+KeyPath = Tuple[Union[str, int], ...]
+
+
+def _alias_paths(alias: Any) -> Tuple[KeyPath, ...]:
+    if isinstance(alias, AliasChoices):
+        return tuple(path for choice in alias.choices for path in _alias_paths(choice))
+    if isinstance(alias, AliasPath):
+        return (tuple(alias.path),)
+    return ((alias,),)
+
+
+@lru_cache(maxsize=None)
+def field_paths(model: Type[BaseModel]) -> Dict[str, Tuple[KeyPath, ...]]:
+    """
+    Key paths each field of ``model`` is read from, first match wins.
+    
+    Only fields with a validation alias are listed, e.g. ``Claim.author_id``
+    as ``(("author_id",), ("author", "agent_id"))``; every other field is
+    read by its name. The unvalidated builders use these so they accept
+    the API functions' record shapes just like ``model_validate`` does.
+    """
+    return {
+        name: _alias_paths(field.validation_alias)
+        for name, field in model.model_fields.items()
+        if field.validation_alias is not None
+    }
+
+
+def lookup(values: Dict[str, Any], paths: Tuple[KeyPath, ...]) -> Any:
+    """Value at the first of ``paths`` present in ``values``, else ``MISSING``"""
+    for path in paths:
+        value: Any = values
+        for key in path:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                break
+        else:
+            return value
+    return MISSING
+
+
+def nested_converter(
+    annotation: Any,
+    builder: Callable[[Type[BaseModel]], Callable[[Dict[str, Any]], Any]],
+) -> Optional[Callable[[Any], Any]]:
+    """
+    Converter building the records of a field that holds a model or a list
+    of models (``FeedPage.items``) with ``builder``; ``None`` for other fields.
+    """
+    args = get_args(annotation)
+    if get_origin(annotation) in (list, List) and args:
+        annotation, many = args[0], True
+    else:
+        many = False
+    if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+        return None
+    model = annotation
+    
+    def convert(value: Any) -> Any:
+        build = builder(model)
+        if many and isinstance(value, list):
+            return [build(item) if isinstance(item, dict) else item for item in value]
+        return build(value) if isinstance(value, dict) else value
+    
+    return convert
+
+
+def _is_list(annotation: Any) -> bool:
+    if get_origin(annotation) in (list, List):
+        return True
+    return any(get_origin(arg) in (list, List) for arg in get_args(annotation))
+
+
+class CompactRecord:
+    """
+    Base of the slotted record classes built by ``compact_type``.
+    
+    A record holds the same fields as its pydantic model, read as attributes
+    (``claim.status``), but has no ``__dict__``, no validator state and no
+    fields-set bookkeeping. List fields are stored as tuples, and strings of
+    ``INTERNED_FIELDS`` are interned. Like ``decode="trusted"``, nothing is
+    validated: timestamps stay strings and missing fields are ``None``.
+    
+    Call ``to_model()`` to get the full model for one record.
+    """
+    
+    __slots__ = ()
+    __model__: ClassVar[Type[BaseModel]]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values as a plain dict, with tuples turned back into lists"""
+        return {name: _plain(value) for name, value in zip(self.__slots__, self._values())}
+    
+    def to_model(self, validate: bool = False) -> BaseModel:
+        """
+        Expand into the pydantic model this record was built for.
+        
+        Args:
+            validate: Run the model's validation (parsing timestamps and
+                checking constraints) instead of ``model_construct``
+        """
+        if validate:
+            return self.__model__.model_validate(self.to_dict())
+        return self.__model__.model_construct(**self.to_dict())
+    
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()  # type: ignore[attr-defined]
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}" for name, value in zip(self.__slots__, self._values())
+        )
+        return f"{type(self).__name__}({fields})"
+    
+    def __reduce__(self) -> Any:
+        # Generated classes can't be pickled by name; rebuild from the model
+        return _restore, (self.__model__, self.to_dict())
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    if isinstance(value, CompactRecord):
+        return value.to_dict()
+    return value
+
+
+@lru_cache(maxsize=None)
+def compact_type(model: Type[BaseModel]) -> Type[CompactRecord]:
+    """Slotted record class with the fields of ``model``, e.g. ``CompactClaim``"""
+    name = f"Compact{model.__name__}"
+    namespace = {
+        "__slots__": tuple(model.model_fields),
+        "__model__": model,
+        "__module__": __name__,
+        "__qualname__": name,
+        "__doc__": f"Compact, unvalidated ``{model.__name__}``",
+    }
+    return type(name, (CompactRecord,), namespace)
+
+
+def _intern_str(value: Any) -> Any:
+    return _intern(value) if type(value) is str else value
+
+
+def _to_tuple(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _intern_list(value: Any) -> Any:
+    if not isinstance(value, list):
+        return value
+    try:
+        return tuple(map(_intern, value))
+    except TypeError:  # not all strings; records are not validated
+        return tuple(value)
+
+
+def _converter(name: str, annotation: Any) -> Optional[Callable[[Any], Any]]:
+    nested = nested_converter(annotation, compact_builder)
+    if nested is not None:
+        return lambda value: _to_tuple(nested(value))
+    interned = name in INTERNED_FIELDS
+    if _is_list(annotation):
+        return _intern_list if interned else _to_tuple
+    return _intern_str if interned else None
+
+
+@lru_cache(maxsize=None)
+def compact_builder(model: Type[BaseModel]) -> Callable[[Dict[str, Any]], CompactRecord]:
+    """
+    Cached constructor of compact ``model`` records from parsed JSON.
+    
+    Defaults are taken from the model; list defaults become the shared empty
+    tuple. Fields are read by name or from their aliases' key paths (see
+    ``field_paths``); other keys are dropped.
+    """
+    record_type = compact_type(model)
+    aliased = field_paths(model)
+    plan = []
+    for name, field in model.model_fields.items():
+        if field.default_factory is not None:
+            default = () if _is_list(field.annotation) else field.default_factory()
+        elif field.is_required():
+            default = None
+        else:
+            default = field.default
+        setter = getattr(record_type, name).__set__
+        plan.append(
+            (name, aliased.get(name), setter, default, _converter(name, field.annotation))
+        )
+    new = record_type.__new__
+    
+    def build(values: Dict[str, Any]) -> CompactRecord:
+        record = new(record_type)
+        get = values.get
+        for name, paths, setter, default, convert in plan:
+            if paths is None:
+                value = get(name, default)
+            else:
+                value = lookup(values, paths)
+                if value is MISSING:
+                    value = default
+            if convert is not None and value is not None:
+                value = convert(value)
+            setter(record, value)
+        return record
+    
+    return build
+
+
+def _restore(model: Type[BaseModel], values: Dict[str, Any]) -> CompactRecord:
+    return compact_builder(model)(values)
@@ -0,0 +1,355 @@
+"""
+Retry, backoff and hedging policy for API requests
+"""
+
+import asyncio
+import random
+import threading
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Errors raised before the request reached the server; safe to retry any method
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how to retry failed requests.
+    
+    GETs are retried on transient network errors and on ``retry_statuses``.
+    POSTs are only retried when the request never left the client (connect
+    errors) or on 429, which the rate limiter returns before the handler
+    runs. The functions do not deduplicate writes, so a POST that may have
+    reached its handler (a read timeout, a 5xx) is never sent again: a
+    retry could create the claim or edge twice. Waits use exponential
+    backoff with full jitter, and a ``Retry-After`` header is honoured when
+    it is longer.
+    
+    Hedging sends a second copy of a slow GET once it has run longer than the
+    ``hedge_quantile`` latency recently seen for its endpoint, and uses
+    whichever copy answers first. This cuts the tail added by cold starts.
+    
+    Attributes:
+        max_attempts: Total attempts per request, including the first
+        backoff_base: Backoff for the first retry, in seconds
+        backoff_max: Cap on any single backoff
+        retry_statuses: HTTP statuses worth retrying
+        retry_after_max: Longest ``Retry-After`` to wait; longer ones are returned
+        idempotency_keys: Send an ``Idempotency-Key`` with every POST. The
+            functions ignore the header for now, so it does not make POSTs
+            any more retryable.
+        hedge: Enable hedged GETs
+        hedge_quantile: Latency quantile after which a GET is hedged
+        hedge_min_samples: Samples needed per endpoint before hedging starts
+        hedge_min_delay: Never hedge sooner than this, in seconds
+    """
+    
+    max_attempts: int = 3
+    backoff_base: float = 0.25
+    backoff_max: float = 8.0
+    retry_statuses: Tuple[int, ...] = RETRY_STATUSES
+    retry_after_max: float = 60.0
+    idempotency_keys: bool = False
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_min_delay: float = 0.05
+    
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter backoff before retry number ``attempt`` (1-based)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+    
+    def retry_after(self, response: httpx.Response) -> Optional[float]:
+        """Seconds requested by a ``Retry-After`` header, if any"""
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
+    def delay(self, attempt: int, response: Optional[httpx.Response]) -> Optional[float]:
+        """Seconds to wait before retry ``attempt``, or None to stop retrying"""
+        if attempt >= self.max_attempts:
+            return None
+        wait_for = self.backoff(attempt)
+        if response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.retry_after_max:
+                    return None
+                wait_for = max(wait_for, retry_after)
+        return wait_for
+    
+    def retryable(
+        self,
+        idempotent: bool,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """Whether an attempt that produced ``response`` or ``error`` may be retried"""
+        if error is not None:
+            if isinstance(error, UNSENT_ERRORS):
+                return True
+            return idempotent and isinstance(error, httpx.TransportError)
+        if response is None or response.status_code not in self.retry_statuses:
+            return False
+        # A 429 is rejected before the handler runs, so even a plain POST is safe to resend
+        return idempotent or response.status_code == 429
+
+
+def _close_loser(future: Future) -> None:
+    """Release the connection held by the hedge copy that lost"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _aclose_loser(task: "asyncio.Future[httpx.Response]") -> None:
+    """Async counterpart of ``_close_loser``"""
+    if not task.cancelled() and task.exception() is None:
+        asyncio.ensure_future(task.result().aclose())
+
+
+def route_key(endpoint: str) -> str:
+    """Latency bucket for an endpoint: the path with ID-like segments collapsed"""
+    path = endpoint.split("?", 1)[0]
+    return "/".join(
+        ":id" if any(char.isdigit() for char in segment) else segment
+        for segment in path.split("/")
+    )
+
+
+DEFAULT_RETRY = RetryPolicy()
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class LatencyTracker:
+    """Recent request latencies per endpoint family, kept in fixed-size rings"""
+    
+    def __init__(self, window: int = 256):
+        self.window = window
+        self._samples: Dict[str, array] = {}
+        self._next: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = array("d")
+                self._next[key] = 0
+            if len(samples) < self.window:
+                samples.append(seconds)
+            else:
+                position = self._next[key]
+                samples[position] = seconds
+                self._next[key] = (position + 1) % self.window
+    
+    def quantile(self, key: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """Latency quantile for ``key``, or None with fewer than ``min_samples``"""
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Retrier:
+    """
+    Runs requests under a ``RetryPolicy``, hedging slow GETs when enabled.
+    
+    ``send`` and ``asend`` take a zero-argument callable that performs one
+    attempt and returns the ``httpx.Response``. The final response is
+    returned even if it is still an error; transport errors are re-raised
+    once retries run out.
+    """
+    
+    def __init__(
+        self,
+        policy: RetryPolicy = DEFAULT_RETRY,
+        tracker: Optional[LatencyTracker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.policy = policy
+        self.tracker = tracker or LatencyTracker()
+        self._sleep = sleep
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    def _hedge_delay(self, key: str) -> Optional[float]:
+        policy = self.policy
+        if not policy.hedge:
+            return None
+        deadline = self.tracker.quantile(key, policy.hedge_quantile, policy.hedge_min_samples)
+        return None if deadline is None else max(deadline, policy.hedge_min_delay)
+    
+    def _timed(self, key: str, attempt: Callable[[], httpx.Response]) -> httpx.Response:
+        started = time.perf_counter()
+        response = attempt()
+        if response.status_code < 500:
+            self.tracker.record(key, time.perf_counter() - started)
+        return response
+    
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="coherence-hedge")
+            return self._executor
+    
+    def _hedged(self, key: str, attempt: Callable[[], httpx.Response], delay: float):
+        pool = self._pool()
+        first = pool.submit(self._timed, key, attempt)
+        try:
+            return first.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        second = pool.submit(self._timed, key, attempt)
+        done, _ = wait((first, second), return_when=FIRST_COMPLETED)
+        winner = next((f for f in (first, second) if f in done and f.exception() is None), None)
+        if winner is None:
+            # The copy that finished failed: give the other one the chance to succeed
+            return (second if first in done else first).result()
+        loser = second if winner is first else first
+        loser.add_done_callback(_close_loser)
+        return winner.result()
+    
+    def send(
+        self,
+        key: str,
+        attempt: Callable[[], httpx.Response],
+        idempotent: bool,
+        hedge: bool = False,
+    ) -> httpx.Response:
+        """
+        Run ``attempt`` until it succeeds or the policy gives up.
+        
+        Args:
+            key: Latency bucket, see ``route_key``
+            attempt: Performs one HTTP request
+            idempotent: Whether the request may be repeated safely
+            hedge: Allow hedging (GETs only)
+        """
+        number = 1
+        while True:
+            response = error = None
+            try:
+                delay = self._hedge_delay(key) if hedge else None
+                if delay is None:
+                    response = self._timed(key, attempt)
+                else:
+                    response = self._hedged(key, attempt, delay)
+            except httpx.TransportError as exc:
+                error = exc
+            
+            if error is None and response.status_code < 400:
+                return response
+            if not self.policy.retryable(idempotent, response, error):
+                wait_for = None
+            else:
+                wait_for = self.policy.delay(number, response)
+            if wait_for is None:
+                if error is not None:
+                    raise error
+                return response
+            
+            if response is not None:
+                response.close()
+            self._sleep(wait_for)
+            number += 1
+    
+    async def _atimed(
+        self,
+        key: str,
+        attempt: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        started = time.perf_counter()
+        response = await attempt()
+        if response.status_code < 500:
+            self.tracker.record(key, time.perf_counter() - started)
+        return response
+    
+    async def _ahedged(
+        self,
+        key: str,
+        attempt: Callable[[], Awaitable[httpx.Response]],
+        delay: float,
+    ) -> httpx.Response:
+        first = asyncio.ensure_future(self._atimed(key, attempt))
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done:
+            return first.result()
+        
+        second = asyncio.ensure_future(self._atimed(key, attempt))
+        try:
+            done, _ = await asyncio.wait({first, second}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            first.cancel()
+            second.cancel()
+            raise
+        winner = next((t for t in (first, second) if t in done and t.exception() is None), None)
+        if winner is None:
+            # The copy that finished failed: give the other one the chance to succeed
+            return await (second if first in done else first)
+        loser = second if winner is first else first
+        loser.cancel()
+        loser.add_done_callback(_aclose_loser)
+        return winner.result()
+    
+    async def asend(
+        self,
+        key: str,
+        attempt: Callable[[], Awaitable[httpx.Response]],
+        idempotent: bool,
+        hedge: bool = False,
+    ) -> httpx.Response:
+        """Async counterpart of ``send``; the losing hedge copy is cancelled"""
+        number = 1
+        while True:
+            response = error = None
+            try:
+                delay = self._hedge_delay(key) if hedge else None
+                if delay is None:
+                    response = await self._atimed(key, attempt)
+                else:
+                    response = await self._ahedged(key, attempt, delay)
+            except httpx.TransportError as exc:
+                error = exc
+            
+            if error is None and response.status_code < 400:
+                return response
+            if not self.policy.retryable(idempotent, response, error):
+                wait_for = None
+            else:
+                wait_for = self.policy.delay(number, response)
+            if wait_for is None:
+                if error is not None:
+                    raise error
+                return response
+            
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(wait_for)
+            number += 1
+    
+    def close(self) -> None:
+        """Stop the hedging thread pool, if one was started"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
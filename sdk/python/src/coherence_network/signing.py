@@ -0,0 +1,342 @@
+"""
+Pluggable Ed25519 signing and verification backends
+"""
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+DEFAULT_KEY_CACHE_SIZE = 4096
+
+
+def _installed(package: str) -> bool:
+    """Whether ``package`` can be imported, without importing it"""
+    return find_spec(package) is not None
+
+
+class SignerBackend(ABC):
+    """
+    One Ed25519 key bound to a signing implementation.
+    
+    All backends produce identical signatures (Ed25519 is deterministic), so
+    they are interchangeable; they differ only in speed.
+    """
+    
+    name = ""
+    
+    def __init__(self, seed: bytes):
+        """
+        Args:
+            seed: 32-byte Ed25519 private key seed
+        """
+    
+    @classmethod
+    @abstractmethod
+    def available(cls) -> bool:
+        """Whether the library behind this backend is installed"""
+    
+    @property
+    @abstractmethod
+    def public_key(self) -> bytes:
+        """32-byte public key"""
+    
+    @abstractmethod
+    def sign(self, data: bytes) -> bytes:
+        """64-byte signature over ``data``"""
+
+
+class PyNaClSigner(SignerBackend):
+    """libsodium through PyNaCl; releases the GIL while signing"""
+    
+    name = "pynacl"
+    
+    def __init__(self, seed: bytes):
+        import nacl.signing
+        
+        self._key = nacl.signing.SigningKey(seed)
+        self._public_key = bytes(self._key.verify_key)
+    
+    @classmethod
+    def available(cls) -> bool:
+        return _installed("nacl")
+    
+    @property
+    def public_key(self) -> bytes:
+        return self._public_key
+    
+    def sign(self, data: bytes) -> bytes:
+        return self._key.sign(data).signature
+
+
+class CryptographySigner(SignerBackend):
+    """OpenSSL through ``cryptography``"""
+    
+    name = "cryptography"
+    
+    def __init__(self, seed: bytes):
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+        
+        self._key = Ed25519PrivateKey.from_private_bytes(seed)
+        self._public_key = self._key.public_key().public_bytes(
+            serialization.Encoding.Raw, serialization.PublicFormat.Raw
+        )
+    
+    @classmethod
+    def available(cls) -> bool:
+        return _installed("cryptography")
+    
+    @property
+    def public_key(self) -> bytes:
+        return self._public_key
+    
+    def sign(self, data: bytes) -> bytes:
+        return self._key.sign(data)
+
+
+class Ed25519PackageSigner(SignerBackend):
+    """The ``ed25519`` package (SUPERCOP ref10), the SDK's baseline dependency"""
+    
+    name = "ed25519"
+    
+    def __init__(self, seed: bytes):
+        import ed25519
+        
+        self._key = ed25519.SigningKey(seed)
+        self._public_key = self._key.get_verifying_key().to_bytes()
+    
+    @classmethod
+    def available(cls) -> bool:
+        return _installed("ed25519")
+    
+    @property
+    def public_key(self) -> bytes:
+        return self._public_key
+    
+    def sign(self, data: bytes) -> bytes:
+        return self._key.sign(data)
+
+
+class VerifierBackend(ABC):
+    """
+    One Ed25519 public key bound to a verifying implementation.
+    
+    Verifiers hold no per-message state; ``KeyCache`` keeps one per peer.
+    """
+    
+    name = ""
+    
+    def __init__(self, public_key: bytes):
+        """
+        Args:
+            public_key: 32-byte Ed25519 public key
+        
+        Raises:
+            ValueError: If the key is not a valid Ed25519 public key
+        """
+    
+    @abstractmethod
+    def verify(self, signature: bytes, data: bytes) -> bool:
+        """Whether ``signature`` is a valid signature over ``data``"""
+
+
+class PyNaClVerifier(VerifierBackend):
+    """libsodium through PyNaCl"""
+    
+    name = PyNaClSigner.name
+    
+    def __init__(self, public_key: bytes):
+        import nacl.exceptions
+        import nacl.signing
+        
+        try:
+            self._key = nacl.signing.VerifyKey(public_key)
+        except (TypeError, nacl.exceptions.CryptoError) as exc:
+            raise ValueError(f"Invalid Ed25519 public key: {exc}") from None
+        self._errors = (nacl.exceptions.BadSignatureError, ValueError, TypeError)
+    
+    def verify(self, signature: bytes, data: bytes) -> bool:
+        try:
+            self._key.verify(data, signature)
+        except self._errors:
+            return False
+        return True
+
+
+class CryptographyVerifier(VerifierBackend):
+    """OpenSSL through ``cryptography``"""
+    
+    name = CryptographySigner.name
+    
+    def __init__(self, public_key: bytes):
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+        
+        self._key = Ed25519PublicKey.from_public_bytes(public_key)
+        self._errors = (InvalidSignature, ValueError)
+    
+    def verify(self, signature: bytes, data: bytes) -> bool:
+        try:
+            self._key.verify(signature, data)
+        except self._errors:
+            return False
+        return True
+
+
+class Ed25519PackageVerifier(VerifierBackend):
+    """The ``ed25519`` package (SUPERCOP ref10)"""
+    
+    name = Ed25519PackageSigner.name
+    
+    def __init__(self, public_key: bytes):
+        import ed25519
+        
+        if len(public_key) != 32:
+            raise ValueError("Invalid Ed25519 public key: expected 32 bytes")
+        self._key = ed25519.VerifyingKey(public_key)
+        self._errors = (ed25519.BadSignatureError, AssertionError, ValueError)
+    
+    def verify(self, signature: bytes, data: bytes) -> bool:
+        try:
+            self._key.verify(signature, data)
+        except self._errors:
+            return False
+        return True
+
+
+# Fastest first; ``auto`` picks the first one that is installed.
+BACKENDS: Dict[str, Type[SignerBackend]] = {
+    PyNaClSigner.name: PyNaClSigner,
+    CryptographySigner.name: CryptographySigner,
+    Ed25519PackageSigner.name: Ed25519PackageSigner,
+}
+
+VERIFIERS: Dict[str, Type[VerifierBackend]] = {
+    PyNaClVerifier.name: PyNaClVerifier,
+    CryptographyVerifier.name: CryptographyVerifier,
+    Ed25519PackageVerifier.name: Ed25519PackageVerifier,
+}
+
+
+def available_backends() -> List[str]:
+    """Names of the installed backends, fastest first"""
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """
+    Name of the backend to use: ``backend`` itself, checked, or the fastest installed.
+    
+    Raises:
+        ValueError: If ``backend`` is not a known backend name
+        ImportError: If the backend (or, for ``auto``, any backend) is not installed
+    """
+    if backend is None or backend == "auto":
+        names = available_backends()
+        if not names:
+            raise ImportError(
+                "No Ed25519 backend installed; install pynacl, cryptography or ed25519"
+            )
+        return names[0]
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown signing backend {backend!r}; choose from {list(BACKENDS)}")
+    if not BACKENDS[backend].available():
+        raise ImportError(f"Signing backend {backend!r} is not installed")
+    return backend
+
+
+def load_signer(seed: bytes, backend: Optional[str] = None) -> SignerBackend:
+    """
+    Bind ``seed`` to a signing backend.
+    
+    Args:
+        seed: 32-byte private key seed
+        backend: Backend name from ``BACKENDS``; default picks the fastest installed
+    """
+    return BACKENDS[resolve_backend(backend)](seed)
+
+
+class KeyCache:
+    """
+    Thread-safe LRU of verifiers keyed by hex public key.
+    
+    A hit skips hex decoding, length checks and building the backend's key
+    object. Invalid keys are cached too (as ``None``), so a peer sending a
+    bad key is rejected without being parsed again.
+    """
+    
+    def __init__(self, backend: Optional[str] = None, size: int = DEFAULT_KEY_CACHE_SIZE):
+        """
+        Args:
+            backend: Backend name from ``VERIFIERS``; default picks the fastest installed
+            size: Most keys kept; the least recently used is dropped first
+        """
+        self.backend = resolve_backend(backend)
+        self.size = size
+        self._verifier_type = VERIFIERS[self.backend]
+        # lru_cache is implemented in C and locks internally: hits stay cheap
+        self.get: Callable[[str], Optional[VerifierBackend]] = lru_cache(maxsize=size)(
+            self._load
+        )
+    
+    def _load(self, public_key_hex: str) -> Optional[VerifierBackend]:
+        """Verifier for ``public_key_hex``, or ``None`` if it is not a valid key"""
+        try:
+            public_key = bytes.fromhex(public_key_hex)
+            if len(public_key) != 32:
+                return None
+            return self._verifier_type(public_key)
+        except ValueError:
+            return None
+    
+    def __len__(self) -> int:
+        return self.get.cache_info().currsize  # type: ignore[attr-defined]
+    
+    @property
+    def hits(self) -> int:
+        return self.get.cache_info().hits  # type: ignore[attr-defined]
+    
+    @property
+    def misses(self) -> int:
+        return self.get.cache_info().misses  # type: ignore[attr-defined]
+    
+    def verify(self, public_key_hex: str, signature: bytes, data: bytes) -> bool:
+        """Whether ``signature`` over ``data`` was made by ``public_key_hex``"""
+        verifier = self.get(public_key_hex)
+        return verifier is not None and verifier.verify(signature, data)
+    
+    def clear(self) -> None:
+        self.get.cache_clear()  # type: ignore[attr-defined]
+
+
+# Per-process signer used by ``sign_in_worker``; set by ``init_worker`` in each
+# process-pool worker so the key is loaded once, not pickled per task.
+_worker_signer: Optional[SignerBackend] = None
+
+
+def init_worker(seed: bytes, backend: Optional[str]) -> None:
+    """Process-pool initializer: load the signer once per worker"""
+    global _worker_signer
+    _worker_signer = load_signer(seed, backend)
+
+
+def sign_in_worker(data: bytes) -> bytes:
+    """Sign with the signer loaded by ``init_worker``"""
+    return _worker_signer.sign(data)
+
+
+# Per-process key cache used by ``verify_in_worker``; each worker keeps the
+# keys it has parsed across tasks.
+_worker_keys: Optional[KeyCache] = None
+
+
+def init_verify_worker(backend: Optional[str], cache_size: int) -> None:
+    """Process-pool initializer: one key cache per worker"""
+    global _worker_keys
+    _worker_keys = KeyCache(backend, cache_size)
+
+
+def verify_in_worker(item: Tuple[str, bytes, bytes]) -> bool:
+    """Verify one ``(public_key_hex, signature, message)`` with the worker's key cache"""
+    return _worker_keys.verify(*item)
@@ -0,0 +1,224 @@
+"""
+Incremental decoding of list pages while they download
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, get_args
+
+import httpx
+from pydantic import BaseModel
+
+from .decoding import (
+    DECODE_COMPACT,
+    DECODE_RAW,
+    DECODE_TRUSTED,
+    DECODE_VALIDATE,
+    Envelope,
+    decode_response,
+    record_decoder,
+    response_adapter,
+    wrap_response,
+)
+
+# The envelope as the functions write it (JSON.stringify keeps key order)
+_PAGE_HEAD = re.compile(r'\s*\{\s*"success"\s*:\s*(true|false)\s*,\s*"data"\s*:\s*\[')
+_SPACE = re.compile(r"[ \t\n\r]*")
+# What may follow an array element; a number cut off before one could go on
+_ELEMENT_END = frozenset(", \t\n\r]")
+# A body whose first bytes don't match the page head by now is decoded whole
+_HEAD_LIMIT = 256
+
+_HEAD, _ITEMS, _TAIL, _WHOLE = range(4)
+
+_scan = json.JSONDecoder().raw_decode
+
+
+def _item_decoder(data_type: Any, mode: str) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    (item_type,) = get_args(data_type) or (Any,)
+    if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+        return record_decoder(item_type, mode)
+    return None
+
+
+class PageDecoder:
+    """
+    Decode a list-page response body fed in chunks.
+    
+    Each record of the envelope's ``data`` array is parsed and decoded as
+    soon as its closing brace arrives, so decoding overlaps the download
+    instead of starting once the last byte is in, and the body is never
+    held whole. Bodies of another shape (errors, single records) are
+    buffered and decoded whole by ``close``. The result equals what
+    ``decode_response`` returns for the same body.
+    
+    Args:
+        data_type: Type of the envelope's ``data`` field, e.g. ``List[Claim]``
+        mode: Decode mode, see ``decode_response``
+        keep: Also keep the raw body as ``content``, e.g. to cache it
+    """
+    
+    def __init__(self, data_type: Any, mode: str = DECODE_RAW, keep: bool = False):
+        self.data_type = data_type
+        self.mode = mode
+        self.keep = keep
+        self._item = _item_decoder(data_type, mode)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _HEAD
+        self._raw: Optional[List[bytes]] = []
+        self._success = False
+        self._items: List[Any] = []
+        self._need_comma = False
+    
+    @property
+    def content(self) -> Optional[bytes]:
+        """The raw body fed so far, if ``keep`` was set"""
+        return b"".join(self._raw) if self.keep and self._raw is not None else None
+    
+    def feed(self, chunk: bytes) -> None:
+        """Take the next chunk of the (decompressed) body"""
+        if self._raw is not None:
+            self._raw.append(chunk)
+        if self._state == _WHOLE:
+            return
+        text = self._text.decode(chunk)
+        self._buffer = self._buffer[self._pos :] + text if self._pos else self._buffer + text
+        self._pos = 0
+        if self._state == _HEAD:
+            self._head()
+        if self._state == _ITEMS:
+            self._parse_items()
+    
+    def _head(self) -> None:
+        match = _PAGE_HEAD.match(self._buffer)
+        if match is None:
+            if len(self._buffer) >= _HEAD_LIMIT:
+                self._state = _WHOLE
+                self._buffer = ""
+            return
+        self._success = match.group(1) == "true"
+        self._pos = match.end()
+        self._state = _ITEMS
+        if not self.keep:
+            self._raw = None
+    
+    def _parse_items(self) -> None:
+        buffer = self._buffer
+        end = len(buffer)
+        pos = self._pos
+        items = self._items
+        decode = self._item
+        while True:
+            pos = _SPACE.match(buffer, pos).end()
+            if pos >= end:
+                break
+            char = buffer[pos]
+            if char == "]" and (self._need_comma or not items):
+                self._state = _TAIL
+                pos += 1
+                break
+            if self._need_comma:
+                if char != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                self._need_comma = False
+                pos += 1
+                continue
+            try:
+                value, stop = _scan(buffer, pos)
+            except json.JSONDecodeError:
+                break  # the record is still arriving
+            if stop >= end or (
+                not isinstance(value, (dict, list)) and buffer[stop] not in _ELEMENT_END
+            ):
+                break  # a number could continue in the next chunk, e.g. "2." of "2.5"
+            items.append(value if decode is None else decode(value))
+            self._need_comma = True
+            pos = stop
+        self._pos = pos
+    
+    def close(self) -> Envelope:
+        """Finish the body and return the decoded envelope"""
+        self._buffer = self._buffer[self._pos :] + self._text.decode(b"", final=True)
+        self._pos = 0
+        if self._state in (_HEAD, _WHOLE):
+            return decode_response(b"".join(self._raw or ()), self.data_type, self.mode)
+        if self._state == _ITEMS:
+            self._parse_items()
+        if self._state == _ITEMS:
+            _scan(self._buffer, self._pos)  # raises the parse error, if there is one
+            raise json.JSONDecodeError("Unterminated data array", self._buffer, self._pos)
+        
+        rest = self._buffer[self._pos :].strip()
+        if rest == "}":
+            payload: Dict[str, Any] = {}
+        elif rest.startswith(","):
+            payload = json.loads("{" + rest[1:])
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", rest, 0)
+        payload = {"success": self._success, "data": self._items, **payload}
+        if self.mode == DECODE_VALIDATE:
+            # Records are models already and are not validated twice
+            return response_adapter(self.data_type).validate_python(payload)
+        if self.mode in (DECODE_TRUSTED, DECODE_COMPACT):
+            return wrap_response(payload, self.data_type, self._items)
+        return payload
+
+
+class PageStream:
+    """
+    Reads list-page GET responses into ``PageDecoder``s, one per attempt.
+    
+    ``read`` and ``aread`` consume a response opened with ``stream=True``
+    inside a retry attempt, so hedged and retried attempts each decode
+    their own body. ``pop`` then returns the envelope and raw content of
+    the winning response, or ``None`` if it was read whole (errors, 304s
+    and small pages).
+    """
+    
+    def __init__(self, data_type: Any, mode: str, threshold: int, keep: bool = False):
+        self.data_type = data_type
+        self.mode = mode
+        self.threshold = threshold
+        self.keep = keep
+        self._done: Dict[httpx.Response, Tuple[Envelope, Optional[bytes]]] = {}
+    
+    def _wanted(self, response: httpx.Response) -> bool:
+        if response.status_code != 200:
+            return False
+        length = response.headers.get("content-length")
+        return length is None or int(length) >= self.threshold
+    
+    def read(self, response: httpx.Response) -> httpx.Response:
+        """Read the body of ``response``, decoding it as it arrives if it is a large page"""
+        if not self._wanted(response):
+            response.read()
+            return response
+        decoder = PageDecoder(self.data_type, self.mode, self.keep)
+        try:
+            for chunk in response.iter_bytes():
+                decoder.feed(chunk)
+        finally:
+            response.close()
+        self._done[response] = (decoder.close(), decoder.content)
+        return response
+    
+    async def aread(self, response: httpx.Response) -> httpx.Response:
+        """Async counterpart of ``read``"""
+        if not self._wanted(response):
+            await response.aread()
+            return response
+        decoder = PageDecoder(self.data_type, self.mode, self.keep)
+        try:
+            async for chunk in response.aiter_bytes():
+                decoder.feed(chunk)
+        finally:
+            await response.aclose()
+        self._done[response] = (decoder.close(), decoder.content)
+        return response
+    
+    def pop(self, response: httpx.Response) -> Optional[Tuple[Envelope, Optional[bytes]]]:
+        """Envelope and (with ``keep``) raw body decoded from ``response``"""
+        return self._done.pop(response, None)
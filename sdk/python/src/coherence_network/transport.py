@@ -0,0 +1,76 @@
+"""
+Connection pool configuration shared by the sync and async clients
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .concurrency import DEFAULT_MAX_CONCURRENCY
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    Connection pool and protocol settings for the underlying ``httpx`` client.
+    
+    The defaults keep enough idle connections alive to serve a full
+    ``AsyncCoherenceClient.gather`` burst without reconnecting, and hold them
+    for 30s so bursty agents reuse TLS sessions instead of re-handshaking.
+    
+    Attributes:
+        max_connections: Upper bound on open connections per pool
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection stays open
+        http2: Multiplex requests over HTTP/2 (needs ``coherence-network[http2]``)
+        connect_timeout: Separate connect timeout; defaults to the client timeout
+        retries: Connection-level retries on connect errors
+        headers: Extra headers sent with every request
+    """
+    
+    max_connections: int = 100
+    max_keepalive_connections: int = DEFAULT_MAX_CONCURRENCY
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    connect_timeout: Optional[float] = None
+    retries: int = 0
+    headers: Dict[str, str] = field(default_factory=dict)
+    
+    def limits(self) -> httpx.Limits:
+        """Pool limits in ``httpx`` form"""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+    
+    def timeout(self, timeout: float) -> httpx.Timeout:
+        """Request timeout with the optional separate connect timeout"""
+        if self.connect_timeout is None:
+            return httpx.Timeout(timeout)
+        return httpx.Timeout(timeout, connect=self.connect_timeout)
+    
+    def _client_kwargs(self, timeout: float) -> Dict[str, Any]:
+        return {
+            "timeout": self.timeout(timeout),
+            "http2": self.http2,  # raises a clear ImportError when h2 is missing
+            "headers": self.headers,
+        }
+    
+    def sync_client(self, timeout: float = 30.0) -> httpx.Client:
+        """Build an ``httpx.Client`` that can be shared by several ``CoherenceClient``s"""
+        transport = httpx.HTTPTransport(
+            limits=self.limits(), http2=self.http2, retries=self.retries
+        )
+        return httpx.Client(transport=transport, **self._client_kwargs(timeout))
+    
+    def async_client(self, timeout: float = 30.0) -> httpx.AsyncClient:
+        """Build an ``httpx.AsyncClient`` that can be shared by several async clients"""
+        transport = httpx.AsyncHTTPTransport(
+            limits=self.limits(), http2=self.http2, retries=self.retries
+        )
+        return httpx.AsyncClient(transport=transport, **self._client_kwargs(timeout))
+
+
+DEFAULT_POOL = PoolConfig()
@@ -0,0 +1,531 @@
+"""
+Task worker runtime: concurrent poll, claim, execute and submit loop
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import signal
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .decoding import envelope_data, envelope_success, record_id, record_value
+from .realtime import TASK_CLAIMED, TASK_CREATED
+from .retry import LatencyTracker
+
+if TYPE_CHECKING:
+    from .client import AsyncCoherenceClient
+
+EXECUTOR_ASYNCIO = "asyncio"
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTORS = (EXECUTOR_ASYNCIO, EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
+DEFAULT_TIME_BUDGET = 3600
+_RECENT_LIMIT = 4096
+
+
+@dataclass
+class TaskResult:
+    """What a handler reports for a task; submitted as the task result"""
+    
+    success: bool
+    summary: str
+    evidence_ids: List[str] = field(default_factory=list)
+    new_claim_ids: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def coerce(cls, value: Any) -> "TaskResult":
+        """Accept a ``TaskResult``, a dict of its fields, or a bare bool"""
+        if isinstance(value, TaskResult):
+            return value
+        if isinstance(value, dict):
+            return cls(**value)
+        if isinstance(value, bool):
+            return cls(value, "completed" if value else "failed")
+        raise TypeError(f"Task handler returned {type(value).__name__}, expected TaskResult")
+
+
+@dataclass
+class Lease:
+    """A claimed task and the time budget it must be finished in"""
+    
+    task_id: str
+    claimed_at: float
+    time_budget: float
+    
+    @property
+    def deadline(self) -> float:
+        return self.claimed_at + self.time_budget
+    
+    def remaining(self, now: Optional[float] = None) -> float:
+        """Seconds left before the budget runs out"""
+        return self.deadline - (time.monotonic() if now is None else now)
+
+
+class WorkerMetrics:
+    """Counters and per-phase latencies for a ``TaskWorker``"""
+    
+    PHASES = ("poll", "claim", "execute", "submit", "total")
+    
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.counters: Dict[str, int] = {
+            "polled": 0,
+            "claimed": 0,
+            "claim_failed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "handler_errors": 0,
+            "submit_errors": 0,
+            "poll_errors": 0,
+            "abandoned": 0,
+        }
+        self.latency = LatencyTracker(window=1024)
+    
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def observe(self, phase: str, seconds: float) -> None:
+        self.latency.record(phase, seconds)
+    
+    @property
+    def completed(self) -> int:
+        return self.counters["succeeded"] + self.counters["failed"]
+    
+    def throughput(self) -> float:
+        """Completed tasks per second since the worker started"""
+        elapsed = time.monotonic() - self.started
+        return self.completed / elapsed if elapsed > 0 else 0.0
+    
+    def snapshot(self) -> Dict[str, float]:
+        """Counters, throughput and p50/p95 latency per phase in one flat dict"""
+        snapshot: Dict[str, float] = dict(self.counters)
+        snapshot["throughput"] = self.throughput()
+        for phase in self.PHASES:
+            for label, q in (("p50", 0.5), ("p95", 0.95)):
+                value = self.latency.quantile(phase, q)
+                if value is not None:
+                    snapshot[f"{phase}_{label}"] = value
+        return snapshot
+
+
+def _time_budget(task: Any) -> float:
+    budget = record_value(task, "time_budget_sec")
+    if budget is None:
+        constraints = record_value(task, "constraints")
+        budget = record_value(constraints, "time_budget_sec") if constraints else None
+    return float(budget or DEFAULT_TIME_BUDGET)
+
+
+def _priority_key(task: Any) -> Tuple[float, float]:
+    priority = record_value(task, "priority")
+    reward = record_value(task, "coherence_reward")
+    return (-float(0.5 if priority is None else priority), -float(reward or 0))
+
+
+class TaskWorker:
+    """
+    Runs the claim, execute, submit loop for an agent.
+    
+    A poller keeps a priority queue of open tasks topped up, ordered by
+    ``priority`` then ``coherence_reward``. ``concurrency`` slots take the best
+    queued task, claim it, run the handler and submit the result. Polling,
+    claiming and execution all overlap. The queue holds ``prefetch`` tasks
+    beyond the running ones, so a free slot never waits for a poll. Queued
+    tasks are not claimed until a slot takes them, so their leases do not
+    start early.
+    
+    Each claimed task gets a ``Lease`` for its ``time_budget_sec``. A handler
+    still running ``lease_margin`` seconds before the budget runs out is
+    abandoned and reported as failed. With the ``asyncio`` executor the
+    handler is cancelled. With ``thread`` and ``process`` the lease is
+    advisory: a running handler cannot be stopped, so it carries on and
+    keeps its pool worker until it returns. Such handlers are counted as
+    ``abandoned``, and no task is claimed while every pool worker is busy,
+    abandoned handlers included, so hung handlers stall the worker rather
+    than piling tasks up behind them.
+    
+    Usage:
+        def handle(task) -> TaskResult:
+            ...
+            return TaskResult(success=True, summary="Reproduced")
+        
+        worker = TaskWorker(client, handle, executor="thread", concurrency=8)
+        worker.run_sync()  # SIGINT/SIGTERM drain in-flight tasks, then exit
+    """
+    
+    def __init__(
+        self,
+        client: "AsyncCoherenceClient",
+        handler: Callable[[Any], Any],
+        executor: str = EXECUTOR_ASYNCIO,
+        concurrency: int = 4,
+        prefetch: Optional[int] = None,
+        task_type: Optional[str] = None,
+        poll_interval: float = 5.0,
+        lease_margin: float = 5.0,
+        use_gateway: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        realtime: bool = False,
+    ):
+        """
+        Args:
+            client: Async client the worker claims and submits through
+            handler: Called with each claimed task (dict or model). Returns a
+                ``TaskResult``, a dict of its fields or a bool. Coroutine
+                functions are awaited with the ``asyncio`` executor. With the
+                ``process`` executor, the handler and tasks must be picklable.
+            executor: ``"asyncio"``, ``"thread"`` or ``"process"``
+            concurrency: Tasks executed at once
+            prefetch: Extra tasks kept queued (default: ``concurrency``)
+            task_type: Only take tasks of this type (e.g. ``"VERIFY"``)
+            poll_interval: Seconds between polls while the queue is full
+            lease_margin: Seconds before the time budget ends to give up on a task
+            use_gateway: Claim/submit through the Ed25519 gateway (default: if
+                the client has ``auth``)
+            max_workers: Pool size for thread/process executors (default: concurrency)
+            realtime: Subscribe to gateway task events. A new task triggers an
+                immediate poll, and queued tasks claimed by other agents are
+                skipped. Polling every ``poll_interval`` remains as a fallback.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        
+        self.client = client
+        self.handler = handler
+        self.executor = executor
+        self.concurrency = concurrency
+        self.prefetch = concurrency if prefetch is None else prefetch
+        self.task_type = task_type
+        self.poll_interval = poll_interval
+        self.lease_margin = lease_margin
+        self.use_gateway = client.auth is not None if use_gateway is None else use_gateway
+        self.max_workers = max_workers or concurrency
+        self.realtime = realtime
+        
+        self.metrics = WorkerMetrics()
+        self.leases: Dict[str, Lease] = {}
+        self._heap: List[Tuple[float, float, int, Any]] = []
+        self._queued: Set[str] = set()
+        self._taken: Set[str] = set()
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self._sequence = itertools.count()
+        self._stopping = False
+        self._pool: Optional[Executor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ready: Optional[asyncio.Condition] = None
+        self._poll_now: Optional[asyncio.Event] = None
+        self._slots: List["asyncio.Task[None]"] = []
+        self._busy = 0
+        self._abandoned: Set["Future[Any]"] = set()
+    
+    @property
+    def in_flight(self) -> int:
+        """Tasks currently claimed and running"""
+        return len(self.leases)
+    
+    @property
+    def queued(self) -> int:
+        """Open tasks waiting for a free slot"""
+        return len(self._heap)
+    
+    @property
+    def abandoned(self) -> int:
+        """Handlers still running in the pool after their lease expired"""
+        return len(self._abandoned)
+    
+    def _pool_full(self) -> bool:
+        """Whether every pool worker is taken, counting abandoned handlers"""
+        return self._pool is not None and self._busy + len(self._abandoned) >= self.max_workers
+    
+    def _known(self, task_id: str) -> bool:
+        return task_id in self._queued or task_id in self.leases or task_id in self._recent
+    
+    def _forget_later(self, task_id: str) -> None:
+        self._recent[task_id] = None
+        while len(self._recent) > _RECENT_LIMIT:
+            self._recent.popitem(last=False)
+    
+    async def _poll(self) -> None:
+        while not self._stopping:
+            wanted = self.concurrency + self.prefetch - self.queued - self.in_flight
+            if wanted > 0:
+                started = time.monotonic()
+                try:
+                    response = await self.client.tasks.list(
+                        status="open",
+                        task_type=self.task_type,
+                        limit=self.concurrency + self.prefetch,
+                    )
+                except Exception:
+                    self.metrics.count("poll_errors")
+                else:
+                    self.metrics.observe("poll", time.monotonic() - started)
+                    if envelope_success(response):
+                        await self._enqueue(envelope_data(response) or [])
+                    else:
+                        self.metrics.count("poll_errors")
+            
+            try:
+                await asyncio.wait_for(self._poll_now.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._poll_now.clear()
+    
+    async def _enqueue(self, tasks: List[Any]) -> None:
+        added = 0
+        for task in tasks:
+            task_id = record_id(task, "task")
+            if task_id is None or self._known(task_id):
+                continue
+            priority, reward = _priority_key(task)
+            heapq.heappush(self._heap, (priority, reward, next(self._sequence), task))
+            self._queued.add(task_id)
+            added += 1
+        if added:
+            self.metrics.count("polled", added)
+            async with self._ready:
+                self._ready.notify(added)
+    
+    async def _next_task(self) -> Optional[Any]:
+        while True:
+            async with self._ready:
+                while (not self._heap or self._pool_full()) and not self._stopping:
+                    if not self._heap:
+                        self._poll_now.set()
+                    await self._ready.wait()
+                if self._stopping:
+                    return None
+                task = heapq.heappop(self._heap)[3]
+            task_id = record_id(task, "task")
+            if task_id not in self._taken:
+                self._busy += 1
+                break
+            # Claimed by another agent while queued; skip the doomed claim
+            self._taken.discard(task_id)
+            self._queued.discard(task_id)
+            self._forget_later(task_id)
+        if self.queued < self.prefetch:
+            self._poll_now.set()
+        return task
+    
+    async def _listen(self) -> None:
+        try:
+            async with self.client.gateway.subscribe([TASK_CREATED, TASK_CLAIMED]) as events:
+                async for event in events:
+                    if event.event_type == TASK_CLAIMED:
+                        if event.target_task_id in self._queued:
+                            self._taken.add(event.target_task_id)
+                    elif self.task_type in (None, event.payload.get("task_type")):
+                        self._poll_now.set()
+        except Exception:
+            # Realtime is an accelerator; polling carries on without it
+            self.metrics.count("realtime_errors")
+    
+    async def _claim(self, task_id: str) -> bool:
+        started = time.monotonic()
+        try:
+            if self.use_gateway:
+                response = await self.client.gateway.claim_task(task_id)
+            else:
+                response = await self.client.tasks.claim(task_id)
+        except Exception:
+            return False
+        finally:
+            self.metrics.observe("claim", time.monotonic() - started)
+        return envelope_success(response)
+    
+    async def _execute(self, task: Any) -> Any:
+        if self._pool is None:
+            result = self.handler(task)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        future = self._pool.submit(self.handler, task)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if not future.cancel():
+                self._abandon(future)
+            raise
+    
+    def _abandon(self, future: "Future[Any]") -> None:
+        """Track a handler that outlived its lease until it returns and frees its pool worker"""
+        self._abandoned.add(future)
+        self.metrics.count("abandoned")
+        loop = self._loop
+        
+        def release(_: "Future[Any]") -> None:
+            try:
+                loop.call_soon_threadsafe(self._release, future)
+            except RuntimeError:  # the loop is gone with the worker
+                pass
+        
+        future.add_done_callback(release)
+    
+    def _release(self, future: "Future[Any]") -> None:
+        self._abandoned.discard(future)
+        if self._ready is not None:
+            asyncio.ensure_future(self._wake())
+    
+    async def _wake(self) -> None:
+        async with self._ready:
+            self._ready.notify_all()
+    
+    async def _submit(self, task_id: str, result: TaskResult) -> None:
+        started = time.monotonic()
+        try:
+            if self.use_gateway:
+                response = await self.client.gateway.submit_result(
+                    task_id,
+                    result.success,
+                    result.summary,
+                    result.evidence_ids,
+                    result.new_claim_ids,
+                )
+            else:
+                response = await self.client.tasks.submit_result(
+                    task_id,
+                    result.success,
+                    result.summary,
+                    result.evidence_ids,
+                    result.new_claim_ids,
+                )
+            if not envelope_success(response):
+                self.metrics.count("submit_errors")
+        except Exception:
+            self.metrics.count("submit_errors")
+        finally:
+            self.metrics.observe("submit", time.monotonic() - started)
+    
+    async def _process(self, task: Any) -> None:
+        task_id = record_id(task, "task")
+        started = time.monotonic()
+        claimed = await self._claim(task_id)
+        # Stays in _queued until now so a poll during the claim cannot re-queue it
+        self._queued.discard(task_id)
+        if not claimed:
+            self.metrics.count("claim_failed")
+            self._forget_later(task_id)
+            return
+        
+        self.metrics.count("claimed")
+        lease = Lease(task_id, time.monotonic(), _time_budget(task))
+        self.leases[task_id] = lease
+        try:
+            executed = time.monotonic()
+            try:
+                timeout = max(0.0, lease.remaining() - self.lease_margin)
+                result = TaskResult.coerce(await asyncio.wait_for(self._execute(task), timeout))
+            except asyncio.TimeoutError:
+                self.metrics.count("timed_out")
+                summary = f"Lease expired: not finished within {lease.time_budget:g}s"
+                result = TaskResult(False, summary)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.metrics.count("handler_errors")
+                result = TaskResult(False, f"{type(exc).__name__}: {exc}")
+            self.metrics.observe("execute", time.monotonic() - executed)
+            
+            await self._submit(task_id, result)
+            self.metrics.count("succeeded" if result.success else "failed")
+            self.metrics.observe("total", time.monotonic() - started)
+        finally:
+            del self.leases[task_id]
+            self._forget_later(task_id)
+    
+    async def _slot(self) -> None:
+        while True:
+            task = await self._next_task()
+            if task is None:
+                return
+            try:
+                await self._process(task)
+            finally:
+                self._busy -= 1
+                if self._pool is not None:
+                    # A slot waiting for a pool worker may go now
+                    asyncio.ensure_future(self._wake())
+    
+    def _begin_stop(self, drain: bool) -> None:
+        self._stopping = True
+        self._poll_now.set()
+        if not drain:
+            for slot in self._slots:
+                slot.cancel()
+        asyncio.ensure_future(self._wake())
+    
+    def stop(self, drain: bool = True) -> None:
+        """
+        Stop the worker; safe to call from any thread or a signal handler.
+        
+        Args:
+            drain: Let in-flight tasks finish and submit (queued tasks are
+                dropped unclaimed). If False, in-flight tasks are cancelled.
+        """
+        if self._loop is None:
+            self._stopping = True
+            return
+        self._loop.call_soon_threadsafe(self._begin_stop, drain)
+    
+    async def run(self, handle_signals: bool = False) -> WorkerMetrics:
+        """
+        Run until ``stop()`` is called.
+        
+        Args:
+            handle_signals: Drain on SIGINT/SIGTERM (Unix event loops only)
+        
+        Returns:
+            The worker's metrics
+        """
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Condition()
+        self._poll_now = asyncio.Event()
+        if self.executor == EXECUTOR_THREAD:
+            self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="coherence-task")
+        elif self.executor == EXECUTOR_PROCESS:
+            self._pool = ProcessPoolExecutor(self.max_workers)
+        if handle_signals:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    self._loop.add_signal_handler(signum, self.stop)
+                except (NotImplementedError, RuntimeError):  # pragma: no cover - Windows
+                    pass
+        
+        poller = asyncio.ensure_future(self._poll())
+        listener = asyncio.ensure_future(self._listen()) if self.realtime else None
+        self._slots = [asyncio.ensure_future(self._slot()) for _ in range(self.concurrency)]
+        if self._stopping:
+            self._begin_stop(drain=True)
+        try:
+            await asyncio.gather(*self._slots, return_exceptions=True)
+        finally:
+            self._stopping = True
+            background = [poller] if listener is None else [poller, listener]
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+            if handle_signals:
+                for signum in (signal.SIGINT, signal.SIGTERM):
+                    try:
+                        self._loop.remove_signal_handler(signum)
+                    except (NotImplementedError, RuntimeError):  # pragma: no cover - Windows
+                        pass
+            self._loop = None
+        return self.metrics
+    
+    def run_sync(self, handle_signals: bool = True) -> WorkerMetrics:
+        """Run the worker on a new event loop until stopped; returns its metrics"""
+        return asyncio.run(self.run(handle_signals=handle_signals))
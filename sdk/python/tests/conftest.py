@@ -0,0 +1,21 @@
+import os
+from typing import Iterator
+
+import pytest
+from mock_server import MockCoherenceServer, MockConfig
+
+from coherence_network import Ed25519Auth, RetryPolicy
+
+# Retries in tests back off for milliseconds, not seconds
+FAST_RETRY = RetryPolicy(backoff_base=0.001, backoff_max=0.01)
+
+
+@pytest.fixture
+def server() -> Iterator[MockCoherenceServer]:
+    with MockCoherenceServer(MockConfig(claims=200, agents=20, tasks=50)) as server:
+        yield server
+
+
+@pytest.fixture
+def auth() -> Ed25519Auth:
+    return Ed25519Auth(os.urandom(32).hex())
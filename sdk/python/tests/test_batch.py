@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+
+from coherence_network import AsyncCoherenceClient
+from coherence_network.batch import arun_batch, run_batch
+from coherence_network.models import CreateClaimRequest
+
+
+def test_run_batch_rejects_empty_chunks():
+    with pytest.raises(ValueError, match="chunk_size"):
+        run_batch(lambda item: None, CreateClaimRequest, [], chunk_size=0)
+
+
+def test_arun_batch_rejects_empty_chunks():
+    with pytest.raises(ValueError, match="chunk_size"):
+        asyncio.run(arun_batch(lambda item: None, CreateClaimRequest, [], chunk_size=0))
+
+
+def test_gather_rejects_zero_limit(server):
+    async def main():
+        async with AsyncCoherenceClient(base_url=server.base_url, anon_key="test") as client:
+            return await client.gather([], limit=0)
+    
+    with pytest.raises(ValueError, match="limit"):
+        asyncio.run(main())
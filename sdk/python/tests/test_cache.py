@@ -0,0 +1,47 @@
+import pytest
+
+from coherence_network import CoherenceClient, MemoryCache
+from coherence_network.cache import ResponseCache, cache_key, endpoint_family
+
+
+def _gets(server) -> int:
+    return sum(n for (method, *_), n in server.requests.items() if method == "GET")
+
+
+def test_response_cache_is_abstract():
+    with pytest.raises(TypeError):
+        ResponseCache()
+
+
+def test_keys_keep_endpoint_prefixes():
+    key = cache_key("/api-claims/abc?limit=5", "0123")
+    assert endpoint_family(key) == "/api-claims"
+    assert endpoint_family(cache_key("/api-stats", "0123")) == "/api-stats"
+    assert MemoryCache(ttls={"/api-claims": 7}).ttl_for(key) == 7
+
+
+def test_credentials_do_not_share_entries(server):
+    cache = MemoryCache(default_ttl=60)
+    with CoherenceClient(
+        base_url=server.base_url, anon_key="test", access_token="agent-a", cache=cache
+    ) as agent_a:
+        agent_b = agent_a.with_credentials(access_token="agent-b")
+        agent_a.stats.get()
+        agent_a.stats.get()
+        assert _gets(server) == 1
+        agent_b.stats.get()
+        assert _gets(server) == 2
+        agent_b.stats.get()
+        assert _gets(server) == 2 and len(cache) == 2
+
+
+def test_mutation_invalidates_every_credential(server):
+    cache = MemoryCache(default_ttl=60)
+    with CoherenceClient(
+        base_url=server.base_url, anon_key="test", access_token="agent-a", cache=cache
+    ) as agent_a:
+        agent_b = agent_a.with_credentials(access_token="agent-b")
+        agent_a.claims.list(limit=5)
+        agent_b.claims.list(limit=5)
+        agent_a.claims.create(title="t", statement="s")
+        assert len(cache) == 0
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from coherence_network.coalesce import AsyncBatcher, AsyncSingleFlight, Batcher, SingleFlight
+from coherence_network.exceptions import ApiError
+
+
+def _threads(n, target):
+    """Run ``target(i)`` on ``n`` threads and return their results (or exceptions) in order"""
+    results = [None] * n
+    
+    def run(i):
+        try:
+            results[i] = target(i)
+        except Exception as exc:
+            results[i] = exc
+    
+    threads = [threading.Thread(target=run, args=(i,), daemon=True) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_single_flight_shares_the_leaders_exception():
+    flight = SingleFlight()
+    calls = []
+    
+    def fn():
+        calls.append(1)
+        time.sleep(0.1)
+        raise ApiError("boom", status_code=500)
+    
+    results = _threads(5, lambda _: flight.do("k", fn))
+    assert len(calls) == 1 and flight.shared == 4
+    assert all(isinstance(result, ApiError) for result in results)
+    # Nothing is kept: the next call runs again
+    assert flight.do("k", lambda: "again") == "again"
+
+
+def test_async_single_flight_survives_a_cancelled_caller():
+    flight = AsyncSingleFlight()
+    calls = []
+    
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "value"
+    
+    async def main():
+        first = asyncio.ensure_future(flight.do("k", fn))
+        second = asyncio.ensure_future(flight.do("k", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+    
+    assert asyncio.run(main()) == "value"
+    assert len(calls) == 1 and flight.shared == 1
+
+
+def test_async_single_flight_shares_the_leaders_exception():
+    flight = AsyncSingleFlight()
+    
+    async def fn():
+        await asyncio.sleep(0.01)
+        raise ApiError("boom")
+    
+    async def main():
+        calls = [flight.do("k", fn) for _ in range(3)]
+        return await asyncio.gather(*calls, return_exceptions=True)
+    
+    results = asyncio.run(main())
+    assert all(isinstance(result, ApiError) for result in results)
+    assert results[0] is results[1] is results[2]
+
+
+def test_batcher_folds_callers_and_reports_missing_ids():
+    fetched = []
+    
+    def fetch_many(ids):
+        fetched.append(sorted(ids))
+        return {key: f"record {key}" for key in ids if key != "gone"}
+    
+    batcher = Batcher(fetch_many, window=0.1)
+    keys = ["a", "b", "gone", "a"]
+    results = _threads(len(keys), lambda i: batcher.load(keys[i]))
+    assert fetched == [["a", "b", "gone"]] and batcher.batches == 1
+    assert results[0] == results[3] == "record a" and results[1] == "record b"
+    assert isinstance(results[2], ApiError) and results[2].status_code == 404
+
+
+def test_batcher_flushes_early_at_max_size():
+    fetched = []
+    batcher = Batcher(lambda ids: fetched.append(ids) or {key: key for key in ids}, 5, 3)
+    started = time.perf_counter()
+    results = _threads(3, lambda i: batcher.load(str(i)))
+    assert results == ["0", "1", "2"] and len(fetched) == 1
+    assert time.perf_counter() - started < 1
+
+
+def test_batcher_fetch_error_reaches_every_caller():
+    def fetch_many(ids):
+        raise ApiError("down", status_code=503)
+    
+    batcher = Batcher(fetch_many, window=0.05)
+    results = _threads(3, lambda i: batcher.load(str(i)))
+    assert all(isinstance(result, ApiError) for result in results)
+
+
+def test_async_batcher_flushes_early_and_reports_missing_ids():
+    fetched = []
+    
+    async def fetch_many(ids):
+        fetched.append(sorted(ids))
+        return {key: key.upper() for key in ids if key != "gone"}
+    
+    async def main():
+        batcher = AsyncBatcher(fetch_many, window=5, max_size=3)
+        calls = [batcher.load(key) for key in ("a", "gone", "b")]
+        return await asyncio.wait_for(asyncio.gather(*calls, return_exceptions=True), 1)
+    
+    a, gone, b = asyncio.run(main())
+    assert (a, b) == ("A", "B") and fetched == [["a", "b", "gone"]]
+    assert isinstance(gone, ApiError) and gone.status_code == 404
+
+
+def test_async_batcher_survives_a_cancelled_caller():
+    async def fetch_many(ids):
+        await asyncio.sleep(0.05)
+        return {key: key for key in ids}
+    
+    async def main():
+        batcher = AsyncBatcher(fetch_many, window=0.01)
+        first = asyncio.ensure_future(batcher.load("a"))
+        second = asyncio.ensure_future(batcher.load("b"))
+        await asyncio.sleep(0.02)  # the batch is fetching now
+        first.cancel()
+        return await second, batcher.batches
+    
+    assert asyncio.run(main()) == ("b", 1)
@@ -0,0 +1,158 @@
+import json
+import pickle
+from typing import List
+
+import pytest
+
+from coherence_network import CoherenceClient
+from coherence_network.decoding import decode_response
+from coherence_network.models import Agent, Claim, Edge, FeedPage, Room, Task
+from coherence_network.streaming import PageDecoder
+
+MODES = ("validate", "trusted")
+
+
+def _body(data) -> bytes:
+    meta = {"timestamp": "2025-01-01T00:00:00Z", "request_id": "test"}
+    return json.dumps({"success": True, "data": data, "error": None, "meta": meta}).encode()
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_claims_from_api_shape(server, mode):
+    with CoherenceClient(base_url=server.base_url, anon_key="test", decode=mode) as client:
+        claims = client.claims.list(limit=10).data
+        single = client.claims.get(claims[0].id).data
+    raw = server.data.claims[0]
+    assert [claim.id for claim in claims] == [c["claim_id"] for c in server.data.claims[:10]]
+    assert claims[0].author_id == raw["author"]["agent_id"]
+    assert claims[0].scope_domain == raw["scope"]["domain"]
+    assert single.id == raw["claim_id"]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_tasks_and_agents_from_api_shape(server, mode):
+    with CoherenceClient(base_url=server.base_url, anon_key="test", decode=mode) as client:
+        task = client.tasks.list(limit=1).data[0]
+        agent = client.agents.get(server.data.agents[0]["agent_id"]).data
+    raw = server.data.tasks[0]
+    assert task.id == raw["task_id"]
+    assert task.sandbox_level == raw["constraints"]["sandbox"]
+    assert agent.id == server.data.agents[0]["agent_id"]
+    assert agent.calibration == server.data.agents[0]["reputation"]["calibration"]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_feed_page(server, mode):
+    with CoherenceClient(base_url=server.base_url, anon_key="test", decode=mode) as client:
+        page = client.feed.discovery(limit=5).data
+    assert isinstance(page, FeedPage)
+    assert len(page.items) == 5 and page.total == 100 and page.has_more
+    assert page.items[0].item["claim_id"] == server.data.claims[0]["claim_id"]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_nested_records(mode):
+    edge = {
+        "edge_id": "e1",
+        "type": "SUPPORTS",
+        "justification": None,
+        "weight": 0.7,
+        "from_claim": {"claim_id": "c1", "title": "one"},
+        "to_claim": {"claim_id": "c2", "title": "two"},
+        "author": {"agent_id": "a1", "display_name": "agent"},
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+    room = {
+        "room_id": "r1",
+        "title": "room",
+        "description": None,
+        "status": "active",
+        "topic_tags": ["x"],
+        "owner": None,
+        "synthesis": {"synth_id": "s1", "title": "synthesis"},
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+    task = {
+        "task_id": "t1",
+        "type": "VERIFY",
+        "status": "done",
+        "priority": 0.5,
+        "target": {"claim_id": "c1", "claim": None},
+        "assigned_agent": {"agent_id": "a1", "display_name": "agent"},
+        "constraints": {"sandbox": "standard", "time_budget_sec": 60},
+        "coherence_reward": 10,
+        "result": {"success": True, "summary": "ok", "completed_at": "2025-01-01T00:00:00Z"},
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+    (decoded_edge,) = decode_response(_body([edge]), List[Edge], mode).data
+    assert decoded_edge.id == "e1" and decoded_edge.author_id == "a1"
+    assert (decoded_edge.from_claim_id, decoded_edge.to_claim_id) == ("c1", "c2")
+    decoded_room = decode_response(_body(room), Room, mode).data
+    assert decoded_room.id == "r1" and decoded_room.synthesis_id == "s1"
+    assert decoded_room.owner_id is None
+    decoded_task = decode_response(_body(task), Task, mode).data
+    assert decoded_task.target_claim_id == "c1" and decoded_task.assigned_agent_id == "a1"
+    assert decoded_task.time_budget_sec == 60 and decoded_task.result_success is True
+
+
+def test_model_field_names_still_accepted():
+    claim = Claim.model_validate(
+        {
+            "id": "c1",
+            "title": "t",
+            "statement": "s",
+            "confidence": 0.5,
+            "status": "active",
+            "author_id": "a1",
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+    )
+    assert claim.author_id == "a1" and claim.scope_domain == "general"
+    assert Claim.model_validate(claim.model_dump()) == claim
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_page_decoder_matches_decode_response(server, mode):
+    body = _body(server.data.claims[:50])
+    decoder = PageDecoder(List[Claim], mode)
+    for start in range(0, len(body), 97):
+        decoder.feed(body[start : start + 97])
+    streamed = decoder.close()
+    whole = decode_response(body, List[Claim], mode)
+    assert [claim.id for claim in streamed.data] == [claim.id for claim in whole.data]
+    assert streamed.data[0].author_id == server.data.claims[0]["author"]["agent_id"]
+
+
+def test_page_decoder_any_chunk_split():
+    data = [1, 2.5, -3e-2, 10, True, None, 'a"b', {"x": [1.25]}]
+    body = _body(data)
+    for split in range(1, len(body)):
+        decoder = PageDecoder(List[int], "raw")
+        decoder.feed(body[:split])
+        decoder.feed(body[split:])
+        assert decoder.close()["data"] == data, body[:split]
+
+
+def test_agents_list_ids(server):
+    with CoherenceClient(base_url=server.base_url, anon_key="test", decode="trusted") as client:
+        agents = client.agents.list(limit=3).data
+    assert all(isinstance(agent, Agent) and agent.id for agent in agents)
+
+
+def test_compact_records_from_api_shape(server):
+    with CoherenceClient(base_url=server.base_url, anon_key="test", decode="compact") as client:
+        claims = client.claims.list(limit=10).data
+        task = client.tasks.list(limit=1).data[0]
+        page = client.feed.discovery(limit=2).data
+    raw = server.data.claims[0]
+    assert type(claims[0]).__name__ == "CompactClaim"
+    assert claims[0].id == raw["claim_id"]
+    assert claims[0].author_id == raw["author"]["agent_id"]
+    assert claims[0].scope_domain == raw["scope"]["domain"]
+    assert task.id == server.data.tasks[0]["task_id"]
+    assert task.sandbox_level == server.data.tasks[0]["constraints"]["sandbox"]
+    assert len(page.items) == 2 and page.items[0].id.startswith("claim_")
+    
+    model = claims[0].to_model(validate=True)
+    assert isinstance(model, Claim) and model.id == raw["claim_id"]
+    assert pickle.loads(pickle.dumps(claims[0])) == claims[0]
@@ -0,0 +1,92 @@
+import os
+import time
+
+from coherence_network.cache import CacheEntry
+from coherence_network.disk_cache import DiskCache
+
+
+def _entry(content: bytes, ttl: float = 60, etag=None) -> CacheEntry:
+    return CacheEntry(content, time.time() + ttl, etag=etag)
+
+
+def test_set_get_delete(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set("/api-claims/1", _entry(b"one", etag='"1"'))
+    cache.set("/api-claims/2", _entry(b"two"))
+    entry = cache.get("/api-claims/1")
+    assert entry.content == b"one" and entry.etag == '"1"'
+    assert len(cache) == 2
+    
+    cache.set("/api-claims/1", _entry(b"uno"))
+    assert cache.get("/api-claims/1").content == b"uno"
+    cache.delete("/api-claims/1")
+    assert cache.get("/api-claims/1") is None
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_survives_reopen(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set("/api-stats", _entry(b"stats"))
+    cache.close()
+    
+    reopened = DiskCache(str(tmp_path))
+    assert reopened.get("/api-stats").content == b"stats"
+    reader = DiskCache(str(tmp_path), readonly=True)
+    assert reader.get("/api-stats").content == b"stats"
+    reader.close()
+    reopened.close()
+
+
+def test_grows_index_past_initial_slots(tmp_path):
+    cache = DiskCache(str(tmp_path), initial_slots=8)
+    for i in range(500):
+        cache.set(f"/api-agents/{i}", _entry(str(i).encode()))
+    assert len(cache) == 500
+    assert all(cache.get(f"/api-agents/{i}").content == str(i).encode() for i in range(500))
+    cache.close()
+
+
+def test_invalidate_prefix_and_clear(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    for i in range(20):
+        cache.set(f"/api-claims/{i}", _entry(b"c"))
+    cache.set("/api-agents/1", _entry(b"a"))
+    
+    cache.invalidate_prefix("/api-claims/1")
+    assert cache.get("/api-claims/1") is None and cache.get("/api-claims/15") is None
+    assert cache.get("/api-claims/2") is not None
+    cache.invalidate_prefix("/api-claims")
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_compaction_evicts_oldest_past_max_bytes(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=200_000)
+    for i in range(2000):
+        cache.set(f"/api-claims/{i}", _entry(b"x" * 300))
+    assert os.path.getsize(tmp_path / "data.log") <= 200_000
+    assert cache.get("/api-claims/1999") is not None
+    assert cache.get("/api-claims/0") is None
+    cache.close()
+
+
+def test_readonly_writes_are_noops(tmp_path):
+    DiskCache(str(tmp_path)).close()
+    reader = DiskCache(str(tmp_path), readonly=True)
+    reader.set("/api-stats", _entry(b"stats"))
+    assert reader.get("/api-stats") is None
+    reader.close()
+
+
+def test_client_serves_repeat_gets_from_disk(server, tmp_path):
+    from coherence_network import CoherenceClient
+    
+    cache = DiskCache(str(tmp_path), default_ttl=60)
+    with CoherenceClient(base_url=server.base_url, anon_key="test", cache=cache) as client:
+        first = client.claims.list(limit=5)
+        second = client.claims.list(limit=5)
+    assert first == second
+    assert sum(count for (method, *_), count in server.requests.items() if method == "GET") == 1
@@ -0,0 +1,56 @@
+import pytest
+
+from coherence_network.export import Column, ColumnarTable, FloatColumn
+
+
+def test_column_is_abstract():
+    with pytest.raises(TypeError):
+        Column()
+
+
+def test_table_from_api_records(server):
+    pytest.importorskip("numpy")
+    claims = server.data.claims[:20]
+    table = ColumnarTable("claim", ["id", "author_id", "scope_domain", "confidence"])
+    table.extend(claims)
+    arrays = table.to_numpy()
+    assert len(table) == 20
+    assert list(arrays["id"]) == [claim["claim_id"] for claim in claims]
+    assert arrays["author_id"][0] == claims[0]["author"]["agent_id"]
+    assert arrays["scope_domain"][0] == claims[0]["scope"]["domain"]
+    assert arrays["confidence"][0] == claims[0]["confidence"]
+
+
+def test_every_aliased_field_exports():
+    pytest.importorskip("numpy")
+    task = {
+        "task_id": "t1",
+        "type": "verify",
+        "status": "completed",
+        "target": {"claim_id": "c1"},
+        "constraints": {"sandbox": "none", "time_budget_sec": 60},
+        "result": {
+            "success": True,
+            "summary": "done",
+            "evidence_ids": ["e1", "e2"],
+            "new_claim_ids": ["c2"],
+        },
+    }
+    table = ColumnarTable("task")
+    table.append(task)
+    arrays = table.to_numpy()
+    assert arrays["id"][0] == "t1" and arrays["target_claim_id"][0] == "c1"
+    assert arrays["time_budget_sec"][0] == 60 and arrays["result_summary"][0] == "done"
+    assert list(arrays["result_evidence_ids"][0]) == ["e1", "e2"]
+    assert list(arrays["result_new_claim_ids"][0]) == ["c2"]
+
+
+def test_clear_leaves_views_alone():
+    pytest.importorskip("numpy")
+    column = FloatColumn()
+    column.append(1.5)
+    column.append(None)
+    view = column.to_numpy()
+    column.clear()
+    column.append(2.0)
+    assert view[0] == 1.5 and len(column) == 1
@@ -0,0 +1,106 @@
+import asyncio
+import hashlib
+import json
+
+import httpx
+import pytest
+
+from coherence_network import AsyncCoherenceClient, CoherenceClient
+from coherence_network.feed_sync import FeedSynchronizer
+
+
+class Feed:
+    """``api-feed`` over ``httpx.MockTransport``, answering 304 to a matching ``If-None-Match``"""
+    
+    def __init__(self, items):
+        self.items = items
+        self.requests = []
+    
+    def handler(self, request):
+        self.requests.append(request)
+        data = {"items": self.items, "total": len(self.items), "has_more": False}
+        body = json.dumps({"success": True, "data": data}).encode()
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, content=body, headers={"ETag": etag})
+
+
+def _item(item_id, score, reason="new"):
+    claim = {"claim_id": item_id, "title": item_id, "status": "active"}
+    return {
+        "id": item_id,
+        "type": "claim",
+        "item": claim,
+        "relevance_score": score,
+        "reason": reason,
+    }
+
+
+def _id(item):
+    return item["id"] if isinstance(item, dict) else item.id
+
+
+@pytest.mark.parametrize("mode", ["raw", "validate", "trusted"])
+def test_sync_merges_added_changed_and_removed(mode):
+    feed = Feed([_item("a", 0.9), _item("b", 0.8), _item("c", 0.7)])
+    http = httpx.Client(transport=httpx.MockTransport(feed.handler))
+    local = FeedSynchronizer("discovery", limit=3)
+    with CoherenceClient("http://test", "test", http_client=http, decode=mode) as client:
+        first = local.sync(client)
+        assert [_id(item) for item in first.added] == ["a", "b", "c"]
+        assert not first.changed and not first.removed
+        
+        feed.items = [_item("d", 0.95), _item("a", 0.9, "disputed"), _item("b", 0.8)]
+        delta = local.sync(client)
+    
+    assert [_id(item) for item in delta.added] == ["d"]
+    assert [_id(item) for item in delta.changed] == ["a"]
+    assert delta.removed == ["c"]
+    assert [_id(item) for item in local] == ["d", "a", "b"]
+    assert "c" not in local and local.total == 3
+
+
+def test_unchanged_feed_costs_a_304():
+    feed = Feed([_item("a", 0.9), _item("b", 0.8)])
+    http = httpx.Client(transport=httpx.MockTransport(feed.handler))
+    local = FeedSynchronizer("coherence-work", limit=2)
+    with CoherenceClient("http://test", "test", http_client=http) as client:
+        local.sync(client)
+        held = local.get("a")
+        delta = local.sync(client)
+    
+    assert delta.not_modified and not delta
+    assert feed.requests[1].headers["if-none-match"] == local.etag
+    assert local.not_modified == 1 and local.syncs == 2
+    assert local.get("a") is held and len(local) == 2
+    assert feed.requests[0].url.path == "/api-feed/coherence-work"
+    assert feed.requests[0].url.params["limit"] == "2"
+
+
+def test_reset_resends_everything_without_etag():
+    feed = Feed([_item("a", 0.9)])
+    http = httpx.Client(transport=httpx.MockTransport(feed.handler))
+    local = FeedSynchronizer()
+    with CoherenceClient("http://test", "test", http_client=http) as client:
+        local.sync(client)
+        local.reset()
+        delta = local.sync(client)
+    assert "if-none-match" not in feed.requests[1].headers
+    assert [_id(item) for item in delta.added] == ["a"]
+
+
+def test_sync_async():
+    feed = Feed([_item("a", 0.9)])
+    
+    async def main():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(feed.handler))
+        local = FeedSynchronizer()
+        async with AsyncCoherenceClient("http://test", "test", http_client=http) as client:
+            added = await local.sync_async(client)
+            again = await local.sync_async(client)
+        await http.aclose()
+        return added, again
+    
+    added, again = asyncio.run(main())
+    assert len(added.added) == 1 and again.not_modified
@@ -0,0 +1,123 @@
+import httpx
+import pytest
+
+from coherence_network import CoherenceClient
+from coherence_network.graph import ClaimGraph
+
+
+def _edge(edge_id, source, target, edge_type, weight=1.0):
+    """An edge as ``api-claims/:id/edges`` returns it"""
+    return {
+        "edge_id": edge_id,
+        "type": edge_type,
+        "justification": None,
+        "weight": weight,
+        "from_claim": {"claim_id": source, "title": source},
+        "to_claim": {"claim_id": target, "title": target},
+        "author": None,
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def _claim(claim_id, confidence, created_at="2025-01-01T00:00:00Z"):
+    return {
+        "claim_id": claim_id,
+        "title": claim_id,
+        "statement": "s",
+        "author": None,
+        "confidence": confidence,
+        "status": "active",
+        "scope": {"domain": "physics", "time_range": None},
+        "assumptions": [],
+        "tags": [],
+        "coherence_score": None,
+        "created_at": created_at,
+    }
+
+
+@pytest.fixture
+def graph():
+    graph = ClaimGraph()
+    graph.add_claims([_claim("a", 0.9), _claim("b", 0.8), _claim("c", 0.7)])
+    graph.add_edges(
+        [
+            _edge("e1", "a", "b", "SUPPORTS"),
+            _edge("e2", "c", "a", "CONTRADICTS"),
+            _edge("e3", "b", "c", "DEPENDS_ON"),
+        ]
+    )
+    return graph
+
+
+def test_graph_from_api_records(graph):
+    assert len(graph) == 3 and graph.edge_count == 3
+    assert graph.neighbors("a", edge_types=["SUPPORTS"]) == ["b"]
+    assert graph.neighbors("a", direction="in") == ["c"]
+    assert graph.confidence[graph.node_id("b")] == 0.8
+
+
+@pytest.mark.parametrize("mode", ["raw", "validate", "trusted", "compact"])
+def test_sync(server, mode):
+    graph = ClaimGraph()
+    with CoherenceClient(base_url=server.base_url, anon_key="test", decode=mode) as client:
+        assert graph.sync(client, page_size=50) == len(server.data.claims)
+        assert graph.sync(client, page_size=50) == 0
+    first = server.data.claims[0]
+    assert first["claim_id"] in graph
+    assert graph.confidence[graph.node_id(first["claim_id"])] == first["confidence"]
+
+
+def test_sync_fetches_edges_and_full_catches_up():
+    claims = [_claim("b", 0.8, "2025-01-02T00:00:00Z"), _claim("a", 0.9)]
+    edges = {"a": [_edge("e1", "a", "b", "SUPPORTS")], "b": []}
+    fetched = []
+    
+    def handler(request):
+        parts = request.url.path.strip("/").split("/")
+        if len(parts) == 3 and parts[2] == "edges":
+            fetched.append(parts[1])
+            data = edges[parts[1]]
+        else:
+            offset = int(request.url.params.get("offset", 0))
+            data = claims[offset:]
+        return httpx.Response(200, json={"success": True, "data": data})
+    
+    graph = ClaimGraph()
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    with CoherenceClient(base_url="http://test", anon_key="test", http_client=http) as client:
+        assert graph.sync(client) == 2
+        assert graph.edge_count == 1 and sorted(fetched) == ["a", "b"]
+        
+        # An edge between claims already in the replica needs a full sync
+        edges["b"].append(_edge("e2", "b", "a", "REFINES"))
+        fetched.clear()
+        assert graph.sync(client) == 0
+        assert graph.edge_count == 1 and fetched == []
+        graph.sync(client, full=True)
+        assert graph.edge_count == 2
+        assert graph.neighbors("b", edge_types=["REFINES"]) == ["a"]
+
+
+def test_scorer_does_not_pin_graph(graph):
+    pytest.importorskip("numpy")
+    from coherence_network.scoring import CoherenceScorer
+    
+    scorer = CoherenceScorer.from_graph(graph)
+    base = scorer.base.copy()
+    graph.add_claims([_claim("d", 0.5), _claim("a", 0.1, "2025-02-01T00:00:00Z")])
+    graph.add_edges([_edge("e4", "d", "a", "SUPPORTS")])
+    assert len(graph) == 4
+    assert (scorer.base == base).all()
+    assert len(CoherenceScorer.from_graph(graph).base) == 4
+
+
+def test_scorer_targets_contradicted_claims(graph):
+    pytest.importorskip("numpy")
+    from coherence_network.scoring import CoherenceScorer
+    
+    scorer = CoherenceScorer.from_graph(graph)
+    propagated = scorer.propagate()
+    assert ((propagated >= 0) & (propagated <= 1)).all()
+    targets = scorer.verification_targets(k=5)
+    # Only the two claims contradicting each other are under pressure
+    assert {claim_id for claim_id, _ in targets} == {"a", "c"}
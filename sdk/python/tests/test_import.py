@@ -0,0 +1,51 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import coherence_network
+
+HEAVY = ("httpx", "pydantic", "numpy")
+# Opt-in features a client imports only when they are used
+FEATURES = tuple(
+    f"coherence_network.{name}" for name in ("outbox", "instrument", "realtime", "export", "graph")
+) + ("sqlite3",)
+SRC = str(Path(coherence_network.__file__).parents[1])
+
+
+def _loaded_after(statement: str, modules: tuple = HEAVY) -> list:
+    """Which of ``modules`` are loaded by ``statement`` in a fresh interpreter"""
+    script = "\n".join(
+        [
+            "import json, sys",
+            statement,
+            f"print(json.dumps([name for name in {modules!r} if name in sys.modules]))",
+        ]
+    )
+    env = {**os.environ, "PYTHONPATH": SRC}
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env
+    )
+    return json.loads(result.stdout)
+
+
+def test_package_import_is_light():
+    assert _loaded_after("import coherence_network") == []
+
+
+def test_exceptions_import_is_light():
+    assert _loaded_after("from coherence_network import ApiError, CoherenceError") == []
+
+
+def test_client_loads_on_first_use():
+    assert "httpx" in _loaded_after("from coherence_network import CoherenceClient")
+
+
+def test_client_does_not_load_optional_features():
+    statement = "import coherence_network; coherence_network.CoherenceClient"
+    assert _loaded_after(statement, FEATURES) == []
+    assert _loaded_after(f"{statement}; coherence_network.Outbox", FEATURES) == [
+        "coherence_network.outbox",
+        "sqlite3",
+    ]
@@ -0,0 +1,99 @@
+import random
+
+import httpx
+import pytest
+
+from coherence_network import CoherenceClient, Instrumentation
+from coherence_network.instrument import (
+    REQUEST,
+    Histogram,
+    PhaseEvent,
+    _bucket,
+    _bucket_bounds,
+)
+
+
+def test_buckets_are_exact_then_about_three_percent_wide():
+    assert [_bucket_bounds(_bucket(micros)) for micros in range(64)] == [
+        (micros, micros) for micros in range(64)
+    ]
+    rng = random.Random(7)
+    for micros in [64, 65, 127, 128, 1000, 10**6, 3600 * 10**6] + [
+        rng.randrange(64, 10**10) for _ in range(1000)
+    ]:
+        low, high = _bucket_bounds(_bucket(micros))
+        assert low <= micros <= high
+        assert high - low + 1 <= low / 32
+    # Buckets are contiguous
+    for index in range(64, 400):
+        assert _bucket_bounds(index + 1)[0] == _bucket_bounds(index)[1] + 1
+
+
+def test_quantiles_stay_within_a_bucket_of_the_true_value():
+    histogram = Histogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+    assert histogram.count == 1000 and histogram.min == 0.001 and histogram.max == 1.0
+    assert histogram.mean() == pytest.approx(0.5005)
+    for q, exact in ((0.5, 0.5), (0.95, 0.95), (0.99, 0.99)):
+        assert exact <= histogram.quantile(q) <= exact * (1 + 1 / 32)
+    # The top bucket is capped at the largest value seen
+    assert histogram.quantile(1.0) == 1.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_merge_and_cumulative_counts():
+    fast, slow = Histogram(), Histogram()
+    for _ in range(3):
+        fast.record(0.002)
+    slow.record(0.3)
+    fast.merge(slow)
+    assert fast.count == 4 and fast.min == 0.002 and fast.max == 0.3
+    assert fast.cumulative([0.001, 0.005, 0.25, 0.5]) == [0, 3, 3, 4]
+
+
+def _event(phase, duration, status=None, route="/api-claims/:id"):
+    return PhaseEvent(phase, "GET", route, 0.0, duration, status=status)
+
+
+def test_prometheus_exposition():
+    instrument = Instrumentation()
+    instrument.emit(_event("wait", 0.003))
+    instrument.emit(_event(REQUEST, 0.02, status=200))
+    instrument.emit(_event(REQUEST, 0.2, status=200))
+    text = instrument.prometheus(buckets=(0.01, 0.1, 1.0))
+    name = "coherence_client_phase_seconds"
+    request = 'phase="request",method="GET",route="/api-claims/:id",status="200"'
+    assert text.startswith(f"# HELP {name} ")
+    assert f"# TYPE {name} histogram\n" in text
+    for line in (
+        f'{name}_bucket{{{request},le="0.01"}} 0',
+        f'{name}_bucket{{{request},le="0.1"}} 1',
+        f'{name}_bucket{{{request},le="1"}} 2',
+        f'{name}_bucket{{{request},le="+Inf"}} 2',
+        f"{name}_sum{{{request}}} 0.220000",
+        f"{name}_count{{{request}}} 2",
+        f'{name}_count{{phase="wait",method="GET",route="/api-claims/:id"}} 1',
+    ):
+        assert line in text.splitlines()
+
+
+def test_prometheus_escapes_labels():
+    instrument = Instrumentation()
+    instrument.emit(_event("wait", 0.01, route='/a"b\\c'))
+    assert 'route="/a\\"b\\\\c"' in instrument.prometheus()
+
+
+def test_client_reports_post_phases():
+    events = []
+    instrument = Instrumentation(hooks=[events.append])
+    http = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"success": True}))
+    )
+    with CoherenceClient("http://test", "test", http_client=http, instrument=instrument) as client:
+        client.claims.create(title="t", statement="s")
+    (request,) = [event for event in events if event.phase == REQUEST]
+    assert request.method == "POST" and request.status == 200
+    phases = [event.phase for event in request.phases]
+    assert phases[:2] == ["encode", "sign"] and phases[-1] == "decode"
+    assert instrument.histogram(REQUEST, status="200").count == 1
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import os
+from collections import Counter
+from dataclasses import replace
+
+import httpx
+import pytest
+from conftest import FAST_RETRY
+from mock_server import MockCoherenceServer, MockConfig
+
+from coherence_network import AsyncCoherenceClient, CoherenceClient, Ed25519Auth, Outbox
+
+
+def _posts(server, status=200) -> int:
+    requests = server.requests.items()
+    return sum(n for (method, _, code), n in requests if method == "POST" and code == status)
+
+
+def test_enqueue_returns_queued_and_dedupes(server, auth, tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    client = CoherenceClient(
+        base_url=server.base_url, anon_key="test", auth=auth, retry=FAST_RETRY, outbox=outbox
+    )
+    first = client.gateway.submit_result("t1", True, "done", idempotency_key="submit:t1")
+    again = client.gateway.submit_result("t1", True, "done", idempotency_key="submit:t1")
+    assert first["data"]["status"] == "queued"
+    assert again["data"]["status"] == "duplicate"
+    assert outbox.flush(timeout=10)
+    assert outbox.sent == 1 and outbox.duplicates == 1
+    assert _posts(server) == 1
+    
+    # Delivered keys are remembered for the retention window
+    late = client.gateway.submit_result("t1", True, "done", idempotency_key="submit:t1")
+    assert late["data"]["status"] == "duplicate"
+    client.close()
+
+
+def test_pending_entries_replay_on_reopen(server, auth, tmp_path):
+    path = str(tmp_path / "outbox.db")
+    outbox = Outbox(path, backoff_base=0.01, backoff_max=0.02)
+    offline = CoherenceClient(
+        base_url="http://127.0.0.1:9", anon_key="test", auth=auth, retry=FAST_RETRY, outbox=outbox
+    )
+    for i in range(20):
+        offline.gateway.create_claim(f"claim {i}", "statement", idempotency_key=f"claim:{i}")
+    offline.close()
+    
+    outbox = Outbox(path)
+    assert len(outbox) == 20
+    client = CoherenceClient(
+        base_url=server.base_url, anon_key="test", auth=auth, retry=FAST_RETRY, outbox=outbox
+    )
+    assert outbox.flush(timeout=10)
+    assert outbox.sent == 20 and _posts(server) == 20
+    client.close()
+
+
+def test_client_errors_are_final(server, auth, tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    client = CoherenceClient(
+        base_url=server.base_url, anon_key="test", auth=auth, retry=FAST_RETRY, outbox=outbox
+    )
+    outbox.enqueue("/nope", {"x": 1})
+    assert outbox.flush(timeout=10)
+    (failed,) = outbox.failed()
+    assert failed.endpoint == "/nope" and "404" in failed.last_error
+    assert outbox.requeue_failed() == 1
+    client.close()
+
+
+@pytest.mark.parametrize(
+    "reply, retried",
+    [
+        (httpx.ConnectError("refused"), True),
+        (503, True),
+        (429, True),
+        (httpx.ReadTimeout("slow"), False),
+        (500, False),
+        (502, False),
+    ],
+)
+def test_retries_only_what_cannot_have_been_applied(auth, tmp_path, reply, retried):
+    # The gateway ignores Idempotency-Key, so a resend after the function ran duplicates it
+    attempts = Counter()
+    
+    def handler(request):
+        title = json.loads(request.content)["title"]
+        attempts[title] += 1
+        if attempts[title] > 1:
+            return httpx.Response(200, json={"success": True, "data": {}})
+        if isinstance(reply, Exception):
+            raise reply
+        return httpx.Response(reply, json={"success": False, "error": "unavailable"})
+    
+    outbox = Outbox(str(tmp_path / "outbox.db"), backoff_base=0.001, backoff_max=0.01)
+    client = CoherenceClient(
+        base_url="http://test",
+        anon_key="test",
+        auth=auth,
+        retry=FAST_RETRY,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        outbox=outbox,
+    )
+    client.gateway.create_claim("claim", "statement")
+    assert outbox.flush(timeout=10)
+    if retried:
+        assert attempts["claim"] == 2 and outbox.sent == 1
+    else:
+        (failed,) = outbox.failed()
+        assert attempts["claim"] == 1 and outbox.retried == 0 and failed.last_error
+    client.close()
+
+
+def test_each_attempt_is_one_post(auth, tmp_path):
+    # The outbox owns retries: the client's retrier must not re-POST under it
+    with MockCoherenceServer(MockConfig(claims=10, error_rate=0.3)) as server:
+        outbox = Outbox(str(tmp_path / "outbox.db"), backoff_base=0.001, backoff_max=0.01)
+        client = CoherenceClient(
+            base_url=server.base_url,
+            anon_key="test",
+            auth=auth,
+            retry=replace(FAST_RETRY, idempotency_keys=True),
+            outbox=outbox,
+        )
+        for i in range(50):
+            client.gateway.create_claim(f"claim {i}", "statement", idempotency_key=f"claim:{i}")
+        assert outbox.flush(timeout=30)
+        assert outbox.sent == 50 and outbox.failures == 0
+        assert _posts(server) == 50
+        assert _posts(server, 503) == outbox.retried
+        client.close()
+
+
+def test_derived_clients_need_their_own_outbox(server, auth, tmp_path):
+    outbox = Outbox(str(tmp_path / "a.db"))
+    client = CoherenceClient(
+        base_url=server.base_url, anon_key="test", auth=auth, retry=FAST_RETRY, outbox=outbox
+    )
+    other = Ed25519Auth(os.urandom(32).hex())
+    direct = client.with_credentials(auth=other)
+    assert direct.outbox is None
+    assert direct.gateway.create_claim("direct", "statement")["success"]
+    assert _posts(server) == 1 and len(outbox) == 0
+    
+    queued = client.with_credentials(auth=other, outbox=Outbox(str(tmp_path / "b.db")))
+    assert queued.gateway.create_claim("queued", "statement")["data"]["status"] == "queued"
+    assert queued.outbox.flush(timeout=10) and queued.outbox.sent == 1
+    assert outbox.sent == 0 and _posts(server) == 2
+    with pytest.raises(ValueError, match="already attached"):
+        client.with_credentials(auth=other, outbox=outbox)
+    queued.close()
+    client.close()
+
+
+def test_async_outbox(server, auth):
+    async def main():
+        outbox = Outbox(":memory:")
+        async with AsyncCoherenceClient(
+            base_url=server.base_url, anon_key="test", auth=auth, retry=FAST_RETRY, outbox=outbox
+        ) as client:
+            for _ in range(10):
+                response = await client.gateway.create_edge("a", "b", "SUPPORTS")
+                assert response["data"]["status"] == "queued"
+            assert await outbox.aflush(timeout=10)
+            return outbox.sent
+    
+    assert asyncio.run(main()) == 10
+    assert _posts(server) == 10
@@ -0,0 +1,34 @@
+import pytest
+
+from coherence_network.ratelimit import (
+    AdaptiveRateLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    FileLimiterStore,
+    LimiterStore,
+)
+
+
+def test_limiter_store_is_abstract():
+    with pytest.raises(TypeError):
+        LimiterStore()
+
+
+def test_breaker_state_is_shared_through_the_file(tmp_path):
+    path = str(tmp_path / "limits")
+    first = CircuitBreaker(failure_threshold=2, recovery_time=60, store=FileLimiterStore(path))
+    second = CircuitBreaker(failure_threshold=2, recovery_time=60, store=FileLimiterStore(path))
+    first.record("/api-claims", False)
+    second.before_request("/api-claims")
+    first.record("/api-claims", False)
+    with pytest.raises(CircuitOpenError):
+        second.before_request("/api-claims")
+    second.record("/api-claims", True)
+    first.before_request("/api-claims")
+
+
+def test_limiter_backs_off_on_429():
+    limiter = AdaptiveRateLimiter(rate=10, decrease=0.5)
+    assert limiter.current_rate("/api-claims") == 10
+    limiter.record("/api-claims", 429)
+    assert limiter.current_rate("/api-claims") == 5
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import httpx
+
+from coherence_network import AsyncCoherenceClient
+from coherence_network.realtime import (
+    CLAIM_EVENTS,
+    CLAIM_STATUS_CHANGED,
+    GAP,
+    TASK_CREATED,
+)
+
+
+def _sse(cursor, message) -> str:
+    return f"id: {cursor}\ndata: {json.dumps(message)}\n\n"
+
+
+def _event(cursor, event_type, payload=None, **columns):
+    message = {"type": "event", "id": cursor, "event_type": event_type, "payload": payload or {}}
+    return _sse(cursor, {**message, **columns})
+
+
+def _stream(body):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/event-stream"})
+    
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_truncated_replay_yields_gap():
+    body = (
+        ": keepalive\n\n"
+        + _event("t1|a", TASK_CREATED)
+        + _event("t2|b", "edge_created")
+        + _sse("t3|c", {"type": "gap", "cursor": "t3|c", "replayed": 1000})
+        + _event("t9|z", TASK_CREATED)
+    )
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/event-stream"})
+    
+    async def main():
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = AsyncCoherenceClient("http://gateway", "test", http_client=http)
+        async with client.gateway.subscribe([TASK_CREATED], cursor="t0|0") as events:
+            received = [await events.__anext__() for _ in range(3)]
+            gaps = events.gaps
+        await http.aclose()
+        return received, gaps
+    
+    received, gaps = asyncio.run(main())
+    assert [event.event_type for event in received] == [TASK_CREATED, GAP, TASK_CREATED]
+    assert received[1].cursor == "t3|c" and received[1].payload == {"replayed": 1000}
+    assert gaps == 1
+    assert requests[0].headers["Last-Event-ID"] == "t0|0"
+
+
+def test_claim_status_changes():
+    change = {"status": "verified", "previous_status": "active"}
+    body = (
+        _event("t1|a", TASK_CREATED)
+        + _event("t2|b", CLAIM_STATUS_CHANGED, change, target_claim_id="c1")
+        + _event("t3|c", "claim_created", {"title": "t"}, target_claim_id="c2")
+    )
+    
+    async def main():
+        http = _stream(body)
+        client = AsyncCoherenceClient("http://gateway", "test", http_client=http)
+        async with client.gateway.subscribe(CLAIM_EVENTS) as events:
+            received = [await events.__anext__() for _ in range(2)]
+        await http.aclose()
+        return received
+    
+    changed, created = asyncio.run(main())
+    assert changed.event_type == CLAIM_STATUS_CHANGED and changed.target_claim_id == "c1"
+    assert changed.payload == change
+    assert created.target_claim_id == "c2"
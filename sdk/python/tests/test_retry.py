@@ -0,0 +1,189 @@
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from coherence_network import CoherenceClient
+from coherence_network.retry import LatencyTracker, Retrier, RetryPolicy
+
+POLICY = RetryPolicy(max_attempts=3, backoff_base=0.01, backoff_max=0.02)
+
+
+def _replies(*replies):
+    """A transport answering with ``replies`` in turn (statuses, or exceptions to raise)"""
+    calls = []
+    
+    def handler(request):
+        reply = replies[min(len(calls), len(replies) - 1)]
+        calls.append(request)
+        if isinstance(reply, Exception):
+            raise reply
+        status, headers = reply if isinstance(reply, tuple) else (reply, {})
+        return httpx.Response(status, headers=headers, json={"success": status < 400})
+    
+    return httpx.Client(transport=httpx.MockTransport(handler)), calls
+
+
+def _retrier(policy=POLICY):
+    sleeps = []
+    return Retrier(policy, sleep=sleeps.append), sleeps
+
+
+def test_backoff_is_full_jitter_under_the_cap():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=2.0)
+    for attempt, cap in ((1, 0.5), (2, 1.0), (3, 2.0), (6, 2.0)):
+        assert all(0 <= policy.backoff(attempt) <= cap for _ in range(50))
+
+
+def test_retry_after_seconds_and_dates():
+    policy = RetryPolicy()
+    assert policy.retry_after(httpx.Response(503, headers={"retry-after": "3"})) == 3.0
+    date = formatdate(time.time() + 30, usegmt=True)
+    assert 25 < policy.retry_after(httpx.Response(503, headers={"retry-after": date})) <= 30
+    assert policy.retry_after(httpx.Response(503, headers={"retry-after": "soon"})) is None
+    assert policy.retry_after(httpx.Response(503)) is None
+
+
+def test_get_retries_until_success():
+    http, calls = _replies(503, 502, 200)
+    retrier, sleeps = _retrier()
+    response = retrier.send("/c", lambda: http.get("http://test/c"), idempotent=True)
+    assert response.status_code == 200 and len(calls) == 3
+    assert len(sleeps) == 2 and all(0 <= wait <= 0.02 for wait in sleeps)
+
+
+def test_gives_up_after_max_attempts():
+    http, calls = _replies(503)
+    retrier, sleeps = _retrier()
+    response = retrier.send("/c", lambda: http.get("http://test/c"), idempotent=True)
+    assert response.status_code == 503 and len(calls) == 3 and len(sleeps) == 2
+    
+    http, calls = _replies(httpx.ReadTimeout("slow"))
+    with pytest.raises(httpx.ReadTimeout):
+        retrier.send("/c", lambda: http.get("http://test/c"), idempotent=True)
+    assert len(calls) == 3
+
+
+def test_retry_after_is_honoured_and_capped():
+    http, calls = _replies((429, {"retry-after": "2"}), 200)
+    retrier, sleeps = _retrier()
+    assert retrier.send("/c", lambda: http.get("http://test/c"), True).status_code == 200
+    assert sleeps == [2.0]
+    
+    # Longer than retry_after_max: the 429 is returned instead of waited out
+    http, calls = _replies((429, {"retry-after": "600"}), 200)
+    retrier, sleeps = _retrier()
+    assert retrier.send("/c", lambda: http.get("http://test/c"), True).status_code == 429
+    assert sleeps == [] and len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "reply, attempts",
+    [
+        (503, 1),
+        (500, 1),
+        (httpx.ReadTimeout("slow"), 1),
+        (429, 3),
+        (httpx.ConnectError("refused"), 3),
+    ],
+)
+def test_post_retried_only_when_unprocessed(reply, attempts):
+    http, calls = _replies(reply)
+    retrier, _ = _retrier()
+    try:
+        retrier.send("/gw", lambda: http.post("http://test/gw"), idempotent=False)
+    except httpx.TransportError:
+        pass
+    assert len(calls) == attempts
+
+
+def test_idempotency_key_does_not_make_posts_retryable():
+    http, calls = _replies(503)
+    policy = RetryPolicy(backoff_base=0.001, backoff_max=0.01, idempotency_keys=True)
+    with CoherenceClient(
+        base_url="http://test", anon_key="test", retry=policy, http_client=http
+    ) as client:
+        client.claims.create(title="t", statement="s")
+    assert len(calls) == 1 and calls[0].headers["idempotency-key"]
+
+
+def _hedging(policy=None):
+    policy = policy or RetryPolicy(hedge=True, hedge_min_samples=5, hedge_min_delay=0.02)
+    tracker = LatencyTracker()
+    for _ in range(5):
+        tracker.record("/c", 0.01)
+    return Retrier(policy, tracker)
+
+
+def test_hedged_get_uses_first_answer_and_closes_the_loser():
+    calls = []
+    release = threading.Event()
+    
+    def handler(request):
+        calls.append(request)
+        copy = len(calls)
+        if copy == 1:
+            release.wait(5)  # the first copy hangs past the hedge delay
+        # A streamed body holds its connection until the response is closed
+        return httpx.Response(200, content=iter([b'{"copy": %d}' % copy]))
+    
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    responses = []
+    
+    def attempt():
+        response = http.send(http.build_request("GET", "http://test/c"), stream=True)
+        responses.append(response)
+        return response
+    
+    retrier = _hedging()
+    winner = retrier.send("/c", attempt, idempotent=True, hedge=True)
+    assert winner.read() and winner.json() == {"copy": 2}
+    release.set()
+    for _ in range(100):
+        if len(responses) == 2 and all(r.is_closed for r in responses if r is not winner):
+            break
+        time.sleep(0.01)
+    (loser,) = [r for r in responses if r is not winner]
+    assert loser.is_closed
+    retrier.close()
+
+
+def test_hedged_get_falls_back_when_the_hedge_fails():
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            time.sleep(0.1)
+            return httpx.Response(200, json={"copy": 1})
+        raise httpx.ReadError("reset")
+    
+    http = httpx.Client(transport=httpx.MockTransport(handler))
+    retrier = _hedging()
+    response = retrier.send("/c", lambda: http.get("http://test/c"), True, hedge=True)
+    assert response.json() == {"copy": 1} and len(calls) == 2
+    retrier.close()
+
+
+def test_async_hedged_get_cancels_the_loser():
+    async def main():
+        calls = []
+        
+        async def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+            return httpx.Response(200, json={"copy": len(calls)})
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            retrier = _hedging()
+            started = time.perf_counter()
+            response = await retrier.asend(
+                "/c", lambda: http.get("http://test/c"), idempotent=True, hedge=True
+            )
+            assert response.json() == {"copy": 2} and time.perf_counter() - started < 1
+    
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from coherence_network import Ed25519Auth, Ed25519Verifier
+from coherence_network.signing import (
+    BACKENDS,
+    KeyCache,
+    SignerBackend,
+    VerifierBackend,
+    available_backends,
+    load_signer,
+)
+
+
+def test_signer_backend_is_abstract():
+    with pytest.raises(TypeError):
+        SignerBackend(bytes(32))
+    
+    class Incomplete(SignerBackend):
+        @classmethod
+        def available(cls) -> bool:
+            return True
+    
+    with pytest.raises(TypeError):
+        Incomplete(bytes(32))
+
+
+def test_backends_sign_identically():
+    seed = os.urandom(32)
+    signers = [BACKENDS[name](seed) for name in available_backends()]
+    assert signers
+    assert len({signer.public_key for signer in signers}) == 1
+    assert len({signer.sign(b"payload") for signer in signers}) == 1
+    assert len(load_signer(seed).sign(b"payload")) == 64
+
+
+def test_verifier_backend_is_abstract():
+    with pytest.raises(TypeError):
+        VerifierBackend(bytes(32))
+    
+    class AcceptAll(VerifierBackend):
+        def verify(self, signature: bytes, data: bytes) -> bool:
+            return True
+    
+    assert AcceptAll(bytes(32)).verify(b"", b"")
+
+
+def test_key_cache_verifies_every_backend():
+    seed = os.urandom(32)
+    signer = load_signer(seed)
+    signature = signer.sign(b"payload")
+    for name in available_backends():
+        cache = KeyCache(name)
+        assert cache.verify(signer.public_key.hex(), signature, b"payload")
+        assert not cache.verify(signer.public_key.hex(), signature, b"tampered")
+        assert not cache.verify("zz", signature, b"payload")
+
+
+def test_ed25519_verifier_checks_headers_and_batches():
+    auth = Ed25519Auth(os.urandom(32).hex())
+    body = '{"task_id": "t1"}'
+    headers = auth.get_headers(body)
+    verifier = Ed25519Verifier()
+    assert verifier.verify_headers(body, headers)
+    assert not verifier.verify_headers(body + " ", headers)
+    
+    payloads = [(body, *auth.sign(body)) for _ in range(4)]
+    payloads.append((body, "00" * 64, auth.public_key_hex, payloads[0][3]))
+    assert verifier.verify_many(payloads, processes=False) == [True] * 4 + [False]
+    verifier.close()
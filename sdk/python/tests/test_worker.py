@@ -0,0 +1,163 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+
+from coherence_network import AsyncCoherenceClient
+from coherence_network.worker import TaskResult, TaskWorker
+
+
+class TaskApi:
+    """``api-tasks`` over ``httpx.MockTransport``: open tasks, claims and results"""
+    
+    def __init__(self, tasks):
+        self.tasks = {task["task_id"]: dict(task, status="open") for task in tasks}
+        self.claims = []
+        self.results = {}
+    
+    def handler(self, request):
+        path = request.url.path
+        if request.method == "GET":
+            limit = int(request.url.params["limit"])
+            data = [task for task in self.tasks.values() if task["status"] == "open"][:limit]
+            return httpx.Response(200, json={"success": True, "data": data})
+        task_id = path.split("/")[-2]
+        task = self.tasks[task_id]
+        if path.endswith("/claim"):
+            if task["status"] != "open":
+                return httpx.Response(400, json={"success": False, "error": "Task not available"})
+            task["status"] = "claimed"
+            self.claims.append(task_id)
+        else:
+            task["status"] = "completed"
+            self.results[task_id] = json.loads(request.content)
+        return httpx.Response(200, json={"success": True, "data": task})
+    
+    def client(self):
+        http = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return AsyncCoherenceClient(base_url="http://test", anon_key="test", http_client=http)
+    
+    def settled(self):
+        return all(task["status"] == "completed" for task in self.tasks.values())
+
+
+def _task(task_id, priority=0.5, budget=3600):
+    return {
+        "task_id": task_id,
+        "type": "VERIFY",
+        "priority": priority,
+        "coherence_reward": 10,
+        "constraints": {"time_budget_sec": budget},
+    }
+
+
+async def _run_until(worker, done, timeout=10):
+    async def stopper():
+        deadline = time.monotonic() + timeout
+        while not done() and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        worker.stop()
+    
+    stopping = asyncio.ensure_future(stopper())
+    metrics = await worker.run()
+    await stopping
+    return metrics
+
+
+def test_claims_executes_and_submits():
+    api = TaskApi([_task(f"t{i}") for i in range(12)])
+    
+    async def handle(task):
+        await asyncio.sleep(0.01)
+        return TaskResult(True, f"checked {task['task_id']}", evidence_ids=["e1"])
+    
+    async def main():
+        async with api.client() as client:
+            worker = TaskWorker(client, handle, concurrency=4, poll_interval=0.05)
+            return await _run_until(worker, api.settled)
+    
+    metrics = asyncio.run(main())
+    assert sorted(api.claims) == sorted(api.tasks) and api.settled()
+    assert api.results["t3"]["summary"] == "checked t3"
+    assert api.results["t3"]["evidence_ids"] == ["e1"]
+    assert metrics.counters["succeeded"] == 12 and metrics.counters["claim_failed"] == 0
+
+
+def test_takes_tasks_by_priority_then_reward():
+    tasks = [_task("low", 0.1), _task("high", 0.9), _task("mid", 0.5)]
+    tasks.append(dict(_task("mid-rich", 0.5), coherence_reward=50))
+    api = TaskApi(tasks)
+    
+    async def main():
+        async with api.client() as client:
+            worker = TaskWorker(client, lambda task: True, concurrency=1, prefetch=4)
+            return await _run_until(worker, api.settled)
+    
+    asyncio.run(main())
+    assert api.claims == ["high", "mid-rich", "mid", "low"]
+
+
+def test_stop_drains_in_flight_tasks():
+    api = TaskApi([_task(f"t{i}") for i in range(10)])
+    
+    async def main():
+        async with api.client() as client:
+            started = asyncio.Event()
+            
+            async def handle(task):
+                started.set()
+                await asyncio.sleep(0.2)
+                return True
+            
+            worker = TaskWorker(client, handle, concurrency=2, poll_interval=0.05)
+            running = asyncio.ensure_future(worker.run())
+            await started.wait()
+            worker.stop(drain=True)
+            return await running
+    
+    metrics = asyncio.run(main())
+    # Everything claimed was finished and submitted; nothing else was claimed
+    assert 1 <= len(api.claims) <= 2
+    assert sorted(api.results) == sorted(api.claims)
+    assert metrics.counters["succeeded"] == len(api.claims)
+
+
+def test_expired_lease_is_reported_and_holds_its_pool_worker():
+    api = TaskApi([_task("hung", 0.9, budget=0.3), _task("next", 0.1)])
+    release = threading.Event()
+    
+    def handle(task):
+        if task["task_id"] == "hung":
+            release.wait(10)  # a thread cannot be stopped; it runs on past its lease
+        return True
+    
+    async def main():
+        async with api.client() as client:
+            worker = TaskWorker(
+                client,
+                handle,
+                executor="thread",
+                concurrency=1,
+                lease_margin=0.1,
+                poll_interval=0.05,
+            )
+            running = asyncio.ensure_future(worker.run())
+            while "hung" not in api.results:
+                await asyncio.sleep(0.01)
+            # The only pool worker is still busy, so the next task is not claimed
+            await asyncio.sleep(0.2)
+            assert api.claims == ["hung"] and worker.abandoned == 1
+            release.set()
+            while "next" not in api.results:
+                await asyncio.sleep(0.01)
+            assert worker.abandoned == 0
+            worker.stop()
+            return await running
+    
+    metrics = asyncio.run(main())
+    assert api.results["hung"]["success"] is False
+    assert api.results["hung"]["summary"].startswith("Lease expired")
+    assert api.results["next"]["success"] is True
+    assert metrics.counters["timed_out"] == 1 and metrics.counters["abandoned"] == 1
@@ -34,6 +34,7 @@ const eventIcons: Record<string, React.ComponentType<{ className?: string }>> =
   task_claimed: Zap,
   task_completed: CheckCircle2,
   claim_created: FileText,
+  claim_status_changed: FileText,
   edge_created: Link2,
   error: XCircle,
 };
@@ -43,6 +44,7 @@ const eventColors: Record<string, string> = {
   task_claimed: 'text-pending bg-pending/10 border-pending/30',
   task_completed: 'text-verified bg-verified/10 border-verified/30',
   claim_created: 'text-primary bg-primary/10 border-primary/30',
+  claim_status_changed: 'text-primary bg-primary/10 border-primary/30',
   edge_created: 'text-synthesis bg-synthesis/10 border-synthesis/30',
   error: 'text-disputed bg-disputed/10 border-disputed/30',
 };
@@ -196,6 +198,9 @@ function formatEventPayload(event: AlephnetEvent): string {
   if (event.event_type === 'claim_created' && payload.title) {
     return `"${String(payload.title).slice(0, 40)}..."`;
   }
+  if (event.event_type === 'claim_status_changed' && payload.status) {
+    return `Status: ${payload.previous_status} → ${payload.status}`;
+  }
   if (event.event_type === 'edge_created' && payload.type) {
     return `${payload.type}: ${String(payload.from_claim_id).slice(0, 8)} → ${String(payload.to_claim_id).slice(0, 8)}`;
   }
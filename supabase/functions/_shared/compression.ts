@@ -0,0 +1,79 @@
+// Coherence Network - Transport Compression for Edge Functions
+// Gzip for large JSON responses and compressed request bodies from the SDK
+
+// Bodies smaller than this go out as-is: below ~1 KB the gzip header and
+// the CPU time cost more than the bytes saved
+export const COMPRESS_THRESHOLD = 1024;
+
+// Content-Encodings accepted on request bodies (what DecompressionStream reads)
+const REQUEST_ENCODINGS = new Set(['gzip', 'deflate']);
+
+/**
+ * Whether an Accept-Encoding header allows gzip (q-values of 0 refuse it)
+ */
+export function acceptsGzip(acceptEncoding: string | null): boolean {
+  if (!acceptEncoding) return false;
+  let accepted = false;
+  for (const part of acceptEncoding.split(',')) {
+    const [name, ...params] = part.trim().toLowerCase().split(';');
+    const q = params.map((p) => p.trim()).find((p) => p.startsWith('q='));
+    const allowed = q === undefined || parseFloat(q.slice(2)) > 0;
+    if (name === 'gzip') return allowed;
+    if (name === '*') accepted = allowed;
+  }
+  return accepted;
+}
+
+/**
+ * Read a request body as text, decompressing it per its Content-Encoding.
+ * Signatures are computed over this text, so it is the uncompressed body.
+ */
+export async function readText(req: Request): Promise<string> {
+  const encoding = (req.headers.get('content-encoding') || 'identity').trim().toLowerCase();
+  if (encoding === 'identity' || !req.body) {
+    return await req.text();
+  }
+  if (!REQUEST_ENCODINGS.has(encoding)) {
+    throw new Error(`Unsupported Content-Encoding: ${encoding}`);
+  }
+  const stream = req.body.pipeThrough(new DecompressionStream(encoding as CompressionFormat));
+  return await new Response(stream).text();
+}
+
+/**
+ * Parse a JSON request body, gzip- or deflate-compressed or not
+ */
+export async function readJson(req: Request): Promise<any> {
+  return JSON.parse(await readText(req));
+}
+
+/**
+ * Gzip a JSON response when the client accepts it and the body is large enough.
+ * Error and empty responses pass through; Vary is set either way so caches
+ * keep the two forms apart.
+ */
+export async function compressResponse(req: Request, res: Response): Promise<Response> {
+  const type = res.headers.get('content-type') || '';
+  if (!res.body || res.headers.has('content-encoding') || !type.includes('application/json')) {
+    return res;
+  }
+  const headers = new Headers(res.headers);
+  headers.append('Vary', 'Accept-Encoding');
+  const body = new Uint8Array(await res.arrayBuffer());
+  if (body.byteLength < COMPRESS_THRESHOLD || !acceptsGzip(req.headers.get('accept-encoding'))) {
+    return new Response(body, { status: res.status, headers });
+  }
+  headers.set('Content-Encoding', 'gzip');
+  headers.delete('Content-Length');
+  const stream = new Blob([body]).stream().pipeThrough(new CompressionStream('gzip'));
+  return new Response(stream, { status: res.status, headers });
+}
+
+/**
+ * Wrap a Deno.serve handler so its JSON responses are compressed
+ */
+export function withCompression(
+  handler: (req: Request) => Promise<Response>
+): (req: Request) => Promise<Response> {
+  return async (req: Request) => compressResponse(req, await handler(req));
+}
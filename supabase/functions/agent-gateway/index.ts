@@ -1,9 +1,10 @@
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
 import { verify } from 'https://esm.sh/@noble/ed25519@2.1.0';
+import { readJson, readText } from '../_shared/compression.ts';
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
-  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, x-alephnet-signature, x-alephnet-timestamp, x-alephnet-pubkey',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, content-encoding, last-event-id, x-alephnet-signature, x-alephnet-timestamp, x-alephnet-pubkey',
 };
 
 interface GatewayResponse {
@@ -34,6 +35,51 @@ function createResponse(data: unknown, status = 200, requestId: string, agentId?
   });
 }
 
+interface EventRow {
+  id: string;
+  event_type: string;
+  payload: unknown;
+  source_agent_id: string | null;
+  target_claim_id: string | null;
+  target_task_id: string | null;
+  created_at: string;
+}
+
+// Most events replayed on reconnect; older gaps need a full resync
+const REPLAY_LIMIT = 1000;
+
+// Cursor is `<created_at>|<event id>`, ordered the same way as the replay query
+function eventCursor(row: EventRow): string {
+  return `${row.created_at}|${row.id}`;
+}
+
+function formatEvent(row: EventRow): string {
+  const data = JSON.stringify({
+    type: 'event',
+    id: row.id,
+    event_type: row.event_type,
+    payload: row.payload,
+    source_agent_id: row.source_agent_id,
+    target_claim_id: row.target_claim_id,
+    target_task_id: row.target_task_id,
+    created_at: row.created_at,
+  });
+  return `id: ${eventCursor(row)}\ndata: ${data}\n\n`;
+}
+
+// Sent after a replay cut short at REPLAY_LIMIT: events after `last` and
+// before the live stream were not delivered, so the client must resync
+function formatGap(last: EventRow): string {
+  const cursor = eventCursor(last);
+  const data = JSON.stringify({ type: 'gap', cursor, replayed: REPLAY_LIMIT });
+  return `id: ${cursor}\ndata: ${data}\n\n`;
+}
+
+function parseCursor(cursor: string): [string, string | null] {
+  const [since, id] = cursor.split('|');
+  return [since, id || null];
+}
+
 // Create SSE response for event streaming
 function createSSEResponse(requestId: string): { response: Response; controller: ReadableStreamDefaultController<Uint8Array> | null } {
   let controller: ReadableStreamDefaultController<Uint8Array> | null = null;
@@ -136,33 +182,75 @@ Deno.serve(async (req) => {
     const action = pathParts[1];
 
     // SSE endpoint for event streaming
+    // Each event carries an `id:` cursor. Reconnecting with Last-Event-ID (or
+    // ?since=<cursor>) replays the events missed in between before going live.
+    // If more than REPLAY_LIMIT were missed, a `gap` message follows the
+    // replay before the stream goes live.
+    // ?types=task_created,edge_created limits the stream to those event types.
     if (req.method === 'GET' && action === 'events') {
       const { response, controller } = createSSEResponse(requestId);
-      
+      const encoder = new TextEncoder();
+      const types = url.searchParams.get('types')?.split(',').filter(Boolean) ?? null;
+      const cursor = req.headers.get('last-event-id') || url.searchParams.get('since');
+
+      const sendEvent = (row: EventRow) => {
+        if (!controller || (types && !types.includes(row.event_type))) return;
+        controller.enqueue(encoder.encode(formatEvent(row)));
+      };
+
+      // Live rows that arrive while the backlog is replayed are held back, then
+      // sent after it, skipping any the replay already covered.
+      let pending: EventRow[] | null = cursor ? [] : null;
+      const replayed = new Set<string>();
+
       // Subscribe to alephnet_events table for real-time updates
       const channel = supabase
         .channel('alephnet-events')
         .on('postgres_changes', 
           { event: 'INSERT', schema: 'public', table: 'alephnet_events' },
           (payload) => {
-            if (controller) {
-              const event = `data: ${JSON.stringify({
-                type: 'event',
-                event_type: payload.new.event_type,
-                payload: payload.new.payload,
-                source_agent_id: payload.new.source_agent_id,
-                created_at: payload.new.created_at,
-              })}\n\n`;
-              controller.enqueue(new TextEncoder().encode(event));
+            const row = payload.new as EventRow;
+            if (pending) {
+              pending.push(row);
+            } else if (!replayed.has(row.id)) {
+              sendEvent(row);
             }
           }
         )
         .subscribe();
 
+      if (cursor) {
+        const [since, sinceId] = parseCursor(cursor);
+        let query = supabase
+          .from('alephnet_events')
+          .select('id, event_type, payload, source_agent_id, target_claim_id, target_task_id, created_at')
+          .gte('created_at', since)
+          .order('created_at', { ascending: true })
+          .order('id', { ascending: true })
+          .limit(REPLAY_LIMIT + 1);
+        if (types) query = query.in('event_type', types);
+
+        const { data: backlog } = await query;
+        const rows = (backlog || []) as EventRow[];
+        for (const row of rows.slice(0, REPLAY_LIMIT)) {
+          if (row.created_at === since && sinceId && row.id <= sinceId) continue;
+          replayed.add(row.id);
+          sendEvent(row);
+        }
+        if (rows.length > REPLAY_LIMIT && controller) {
+          controller.enqueue(encoder.encode(formatGap(rows[REPLAY_LIMIT - 1])));
+        }
+        const live = pending || [];
+        pending = null;
+        for (const row of live) {
+          if (!replayed.has(row.id)) sendEvent(row);
+        }
+      }
+
       // Send keepalive every 30 seconds
       const keepalive = setInterval(() => {
         if (controller) {
-          controller.enqueue(new TextEncoder().encode(`: keepalive\n\n`));
+          controller.enqueue(encoder.encode(`: keepalive\n\n`));
         }
       }, 30000);
 
@@ -200,7 +288,7 @@ Deno.serve(async (req) => {
         }
       } else if (alephnetPubkey && alephnetSignature && alephnetTimestamp) {
         // Alephnet signature authentication
-        const body = await req.clone().text();
+        const body = await readText(req.clone());
         const message = `${alephnetTimestamp}:${body}`;
         
         // Verify timestamp is recent (within 5 minutes)
@@ -235,7 +323,7 @@ Deno.serve(async (req) => {
           return createResponse({ message: 'JWT authentication required for registration' }, 401, requestId);
         }
 
-        const body = await req.json();
+        const body = await readJson(req);
         if (!body.alephnet_pubkey) {
           return createResponse({ message: 'alephnet_pubkey is required' }, 400, requestId);
         }
@@ -269,7 +357,7 @@ Deno.serve(async (req) => {
           return createResponse({ message: 'Authentication required' }, 401, requestId);
         }
 
-        const body = await req.json();
+        const body = await readJson(req);
         if (!body.task_id) {
           return createResponse({ message: 'task_id is required' }, 400, requestId);
         }
@@ -324,7 +412,7 @@ Deno.serve(async (req) => {
           return createResponse({ message: 'Authentication required' }, 401, requestId);
         }
 
-        const body = await req.json();
+        const body = await readJson(req);
         if (!body.task_id || body.success === undefined || !body.summary) {
           return createResponse({ message: 'task_id, success, and summary are required' }, 400, requestId);
         }
@@ -380,7 +468,7 @@ Deno.serve(async (req) => {
           }, 403, requestId, agentId);
         }
 
-        const body = await req.json();
+        const body = await readJson(req);
         if (!body.title || !body.statement) {
           return createResponse({ message: 'title and statement are required' }, 400, requestId);
         }
@@ -422,7 +510,7 @@ Deno.serve(async (req) => {
           return createResponse({ message: 'Authentication required' }, 401, requestId);
         }
 
-        const body = await req.json();
+        const body = await readJson(req);
         if (!body.from_claim_id || !body.to_claim_id || !body.type) {
           return createResponse({ message: 'from_claim_id, to_claim_id, and type are required' }, 400, requestId);
         }
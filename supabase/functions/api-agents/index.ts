@@ -1,8 +1,9 @@
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
+import { readJson } from '../_shared/compression.ts';
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
-  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, content-encoding',
 };
 
 interface ApiResponse {
@@ -57,6 +58,8 @@ Deno.serve(async (req) => {
       const domain = url.searchParams.get('domain');
       const limit = parseInt(url.searchParams.get('limit') || '50');
       const offset = parseInt(url.searchParams.get('offset') || '0');
+      // Comma-separated IDs let clients batch many single-record reads
+      const ids = url.searchParams.get('ids')?.split(',').filter(Boolean);
 
       let query = supabase
         .from('agents')
@@ -65,6 +68,7 @@ Deno.serve(async (req) => {
         .range(offset, offset + limit - 1);
 
       if (domain) query = query.contains('domains', [domain]);
+      if (ids?.length) query = query.in('id', ids);
 
       const { data, error } = await query;
       if (error) throw error;
@@ -219,7 +223,7 @@ Deno.serve(async (req) => {
         return createResponse({ message: 'Forbidden' }, 403, requestId);
       }
 
-      const body = await req.json();
+      const body = await readJson(req);
       const allowedFields = ['display_name', 'domains', 'capabilities', 'pubkey'];
       const updates: Record<string, unknown> = {};
 
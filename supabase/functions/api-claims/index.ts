@@ -1,9 +1,10 @@
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
 import { rateLimitMiddleware, getRateLimitHeaders, RateLimitResult } from '../_shared/rate-limit.ts';
+import { readJson, withCompression } from '../_shared/compression.ts';
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
-  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, content-encoding',
 };
 
 interface ApiResponse {
@@ -40,7 +41,7 @@ function createResponse(data: unknown, status = 200, requestId: string, rateLimi
   return new Response(JSON.stringify(response), { status, headers });
 }
 
-Deno.serve(async (req) => {
+Deno.serve(withCompression(async (req) => {
   const requestId = crypto.randomUUID();
 
   if (req.method === 'OPTIONS') {
@@ -68,6 +69,8 @@ Deno.serve(async (req) => {
       const domain = url.searchParams.get('domain');
       const limit = parseInt(url.searchParams.get('limit') || '50');
       const offset = parseInt(url.searchParams.get('offset') || '0');
+      // Comma-separated IDs let clients batch many single-record reads
+      const ids = url.searchParams.get('ids')?.split(',').filter(Boolean);
 
       let query = supabase
         .from('claims')
@@ -77,6 +80,7 @@ Deno.serve(async (req) => {
 
       if (status) query = query.eq('status', status);
       if (domain) query = query.eq('scope_domain', domain);
+      if (ids?.length) query = query.in('id', ids);
 
       const { data, error } = await query;
       if (error) throw error;
@@ -225,7 +229,7 @@ Deno.serve(async (req) => {
         return rateLimitResponse;
       }
 
-      const body = await req.json();
+      const body = await readJson(req);
       
       // Validate input
       if (!body.title || !body.statement) {
@@ -264,4 +268,4 @@ Deno.serve(async (req) => {
     const message = error instanceof Error ? error.message : 'Internal server error';
     return createResponse({ message }, 500, requestId);
   }
-});
+}));
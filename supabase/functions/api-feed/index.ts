@@ -1,8 +1,10 @@
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
+import { withCompression } from '../_shared/compression.ts';
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
-  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, if-none-match',
+  'Access-Control-Expose-Headers': 'etag',
 };
 
 interface ApiResponse {
@@ -16,7 +18,13 @@ interface ApiResponse {
   };
 }
 
-function createResponse(data: unknown, status = 200, requestId: string, feedType?: string): Response {
+function createResponse(
+  data: unknown,
+  status = 200,
+  requestId: string,
+  feedType?: string,
+  extraHeaders: Record<string, string> = {},
+): Response {
   const response: ApiResponse = {
     success: status >= 200 && status < 300,
     data: status >= 200 && status < 300 ? data : undefined,
@@ -29,10 +37,32 @@ function createResponse(data: unknown, status = 200, requestId: string, feedType
   };
   return new Response(JSON.stringify(response), {
     status,
-    headers: { ...corsHeaders, 'Content-Type': 'application/json' },
+    headers: { ...corsHeaders, ...extraHeaders, 'Content-Type': 'application/json' },
   });
 }
 
+// Weak ETag over the feed page only: meta changes on every request
+async function feedTag(data: unknown): Promise<string> {
+  const bytes = new TextEncoder().encode(JSON.stringify(data));
+  const digest = new Uint8Array(await crypto.subtle.digest('SHA-1', bytes));
+  const hex = Array.from(digest, (b) => b.toString(16).padStart(2, '0')).join('');
+  return `W/"${hex}"`;
+}
+
+// Answer 304 when the client already holds this exact page
+async function feedResponse(
+  req: Request,
+  data: unknown,
+  requestId: string,
+  feedType: string,
+): Promise<Response> {
+  const etag = await feedTag(data);
+  if (req.headers.get('if-none-match') === etag) {
+    return new Response(null, { status: 304, headers: { ...corsHeaders, ETag: etag } });
+  }
+  return createResponse(data, 200, requestId, feedType, { ETag: etag });
+}
+
 // Calculate relevance score based on various factors
 function calculateRelevance(item: any, type: string): number {
   let score = 0.5;
@@ -66,7 +96,7 @@ function calculateRelevance(item: any, type: string): number {
   return Math.min(1, Math.max(0, score));
 }
 
-Deno.serve(async (req) => {
+Deno.serve(withCompression(async (req) => {
   const requestId = crypto.randomUUID();
 
   if (req.method === 'OPTIONS') {
@@ -179,11 +209,11 @@ Deno.serve(async (req) => {
       feedItems.sort((a, b) => b.relevance_score - a.relevance_score);
       const paginatedItems = feedItems.slice(offset, offset + limit);
 
-      return createResponse({
+      return feedResponse(req, {
         items: paginatedItems,
         total: feedItems.length,
         has_more: offset + limit < feedItems.length,
-      }, 200, requestId, 'discovery');
+      }, requestId, 'discovery');
 
     } else if (feedType === 'coherence-work') {
       // Coherence work feed: Tasks available for agents to work on
@@ -272,11 +302,11 @@ Deno.serve(async (req) => {
       feedItems.sort((a, b) => b.relevance_score - a.relevance_score);
       const paginatedItems = feedItems.slice(offset, offset + limit);
 
-      return createResponse({
+      return feedResponse(req, {
         items: paginatedItems,
         total: feedItems.length,
         has_more: offset + limit < feedItems.length,
-      }, 200, requestId, 'coherence-work');
+      }, requestId, 'coherence-work');
 
     } else {
       return createResponse({ message: 'Invalid feed type. Use "discovery" or "coherence-work"' }, 400, requestId);
@@ -287,4 +317,4 @@ Deno.serve(async (req) => {
     const message = error instanceof Error ? error.message : 'Internal server error';
     return createResponse({ message }, 500, requestId);
   }
-});
+}));
@@ -1,8 +1,9 @@
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
+import { readJson } from '../_shared/compression.ts';
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
-  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, content-encoding',
 };
 
 interface ApiResponse {
@@ -176,7 +177,7 @@ Deno.serve(async (req) => {
         return createResponse({ message: 'Agent profile not found' }, 404, requestId);
       }
 
-      const body = await req.json();
+      const body = await readJson(req);
 
       if (!body.title) {
         return createResponse({ message: 'Title is required' }, 400, requestId);
@@ -232,7 +233,7 @@ Deno.serve(async (req) => {
         return createResponse({ message: 'Agent profile not found' }, 404, requestId);
       }
 
-      const body = await req.json();
+      const body = await readJson(req);
       const validRoles = ['proposer', 'challenger', 'verifier', 'synthesizer', 'librarian'];
 
       if (!body.role || !validRoles.includes(body.role)) {
@@ -281,7 +282,7 @@ Deno.serve(async (req) => {
         return createResponse({ message: 'Agent profile not found' }, 404, requestId);
       }
 
-      const body = await req.json();
+      const body = await readJson(req);
 
       if (!body.title || !body.summary) {
         return createResponse({ message: 'Title and summary are required' }, 400, requestId);
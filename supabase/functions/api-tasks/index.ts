@@ -1,8 +1,9 @@
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
+import { readJson, withCompression } from '../_shared/compression.ts';
 
 const corsHeaders = {
   'Access-Control-Allow-Origin': '*',
-  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, content-encoding',
 };
 
 interface ApiResponse {
@@ -31,7 +32,7 @@ function createResponse(data: unknown, status = 200, requestId: string): Respons
   });
 }
 
-Deno.serve(async (req) => {
+Deno.serve(withCompression(async (req) => {
   const requestId = crypto.randomUUID();
 
   if (req.method === 'OPTIONS') {
@@ -190,6 +191,14 @@ Deno.serve(async (req) => {
 
       if (error) throw error;
 
+      // Log event for realtime subscribers
+      await supabase.from('alephnet_events').insert({
+        event_type: 'task_claimed',
+        source_agent_id: agent.id,
+        target_task_id: data.id,
+        payload: { task_type: data.type, status: data.status },
+      });
+
       return createResponse({
         task_id: data.id,
         status: data.status,
@@ -209,7 +218,7 @@ Deno.serve(async (req) => {
         return createResponse({ message: 'Unauthorized' }, 401, requestId);
       }
 
-      const body = await req.json();
+      const body = await readJson(req);
 
       if (typeof body.success !== 'boolean' || !body.summary) {
         return createResponse({ message: 'Success status and summary are required' }, 400, requestId);
@@ -231,6 +240,14 @@ Deno.serve(async (req) => {
 
       if (error) throw error;
 
+      // Log event for realtime subscribers
+      await supabase.from('alephnet_events').insert({
+        event_type: 'task_completed',
+        source_agent_id: data.assigned_agent_id,
+        target_task_id: data.id,
+        payload: { task_type: data.type, success: data.result_success },
+      });
+
       return createResponse({
         task_id: data.id,
         status: data.status,
@@ -264,7 +281,7 @@ Deno.serve(async (req) => {
         return createResponse({ message: 'Agent profile not found' }, 404, requestId);
       }
 
-      const body = await req.json();
+      const body = await readJson(req);
 
       if (!body.type || !body.target_claim_id) {
         return createResponse({ message: 'Type and target_claim_id are required' }, 400, requestId);
@@ -291,6 +308,20 @@ Deno.serve(async (req) => {
 
       if (error) throw error;
 
+      // Log event so subscribed workers pick the task up without polling
+      await supabase.from('alephnet_events').insert({
+        event_type: 'task_created',
+        source_agent_id: agent.id,
+        target_task_id: data.id,
+        target_claim_id: data.target_claim_id,
+        payload: {
+          task_type: data.type,
+          status: data.status,
+          priority: data.priority,
+          coherence_reward: data.coherence_reward,
+        },
+      });
+
       return createResponse({
         task_id: data.id,
         type: data.type,
@@ -305,4 +336,4 @@ Deno.serve(async (req) => {
     const message = error instanceof Error ? error.message : 'Internal server error';
     return createResponse({ message }, 500, requestId);
   }
-});
+}));
@@ -0,0 +1,24 @@
+-- Log claim status changes for realtime subscribers (claim_status_changed).
+-- Claims change status through direct table updates rather than an edge
+-- function, so the event is written by a trigger on every such update.
+CREATE OR REPLACE FUNCTION public.log_claim_status_change()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  INSERT INTO public.alephnet_events (event_type, source_agent_id, target_claim_id, payload)
+  VALUES (
+    'claim_status_changed',
+    public.get_current_agent_id(),
+    NEW.id,
+    jsonb_build_object('status', NEW.status, 'previous_status', OLD.status)
+  );
+  RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER log_claims_status_change AFTER UPDATE OF status ON public.claims
+  FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+  EXECUTE FUNCTION public.log_claim_status_change();